@@ -0,0 +1,118 @@
+"""
+Compare storing message embeddings as JSON text and as raw float32 bytes.
+
+Writes the same random unit vectors into a temporary table of each kind, then
+reports their size on disk and how fast they are read back into a NumPy
+array, as the workers do:
+
+    python -m benchmarks.bench_embedding_storage --rows 200000 --dimensions 384
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from sqlalchemy import BigInteger, LargeBinary, String, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.application.utils.embeddings import decode_embeddings, encode_embeddings
+from project.infrastructure.database.session import sync_engine
+
+WRITE_BATCH_SIZE = 5000
+
+
+def encode_json(vectors: np.ndarray) -> list:
+    return [json.dumps(row) for row in vectors.tolist()]
+
+
+def decode_json(rows: list) -> np.ndarray:
+    # psycopg2 has already parsed each document into a list of floats
+    return np.array(rows, dtype=np.float32)
+
+
+FORMATS = {
+    "json": ("json", String, "::json", encode_json, decode_json),
+    "float32": ("bytea", LargeBinary, "", encode_embeddings, decode_embeddings),
+}
+
+
+def run(connection, name: str, vectors: np.ndarray, repeats: int) -> dict:
+    column_type, bind_type, cast, encode, decode = FORMATS[name]
+    table = f"embedding_storage_{name}"
+    connection.execute(
+        text(f"CREATE TEMPORARY TABLE {table} (id bigint, embedding {column_type})")
+    )
+    insert = text(
+        f"INSERT INTO {table} (id, embedding) "
+        f"SELECT id, embedding{cast} FROM unnest(:ids, :embeddings) "
+        "AS batch (id, embedding)"
+    ).bindparams(
+        bindparam("ids", type_=ARRAY(BigInteger)),
+        bindparam("embeddings", type_=ARRAY(bind_type)),
+    )
+
+    started = time.perf_counter()
+    for start in range(0, len(vectors), WRITE_BATCH_SIZE):
+        end = start + WRITE_BATCH_SIZE
+        connection.execute(
+            insert,
+            {
+                "ids": list(range(start, min(end, len(vectors)))),
+                "embeddings": encode(vectors[start:end]),
+            },
+        )
+    write_seconds = time.perf_counter() - started
+
+    connection.execute(text(f"VACUUM ANALYZE {table}"))
+    size = connection.scalar(text(f"SELECT pg_total_relation_size('{table}')"))
+    value_size = connection.scalar(
+        text(f"SELECT avg(pg_column_size(embedding)) FROM {table}")
+    )
+
+    read_seconds = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        rows = connection.execute(text(f"SELECT embedding FROM {table} ORDER BY id"))
+        decoded = decode([row.embedding for row in rows])
+        read_seconds = min(read_seconds, time.perf_counter() - started)
+    if not np.allclose(decoded, vectors, atol=1e-6):
+        raise RuntimeError(f"{name} did not read back the vectors written")
+
+    return {
+        "bytes per vector": float(value_size),
+        "table bytes": size,
+        "writes/sec": len(vectors) / write_seconds,
+        "reads/sec": len(vectors) / read_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--dimensions", type=int, default=384)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    vectors = np.random.default_rng(0).standard_normal(
+        (args.rows, args.dimensions), dtype=np.float32
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    # One connection for the temporary tables, out of any transaction block
+    # for VACUUM
+    with sync_engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        print(f"{args.rows} vectors of {args.dimensions} dimensions")
+        for name in FORMATS:
+            result = run(connection, name, vectors, args.repeats)
+            print(
+                f"{name:>8}: {result['bytes per vector']:,.0f} bytes per vector, "
+                f"{result['table bytes'] / 2**20:,.1f} MiB, "
+                f"{result['writes/sec']:,.0f} writes/sec, "
+                f"{result['reads/sec']:,.0f} reads/sec"
+            )
+
+
+if __name__ == "__main__":
+    main()
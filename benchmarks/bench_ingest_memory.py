@@ -0,0 +1,135 @@
+"""
+Measure the peak resident memory of evidence message ingestion.
+
+Every measurement runs ``ParseEvidencesUseCase`` in a fresh interpreter, so
+the reported peak RSS belongs to that ingestion alone:
+
+    python -m benchmarks.bench_ingest_memory --rows 1000000
+
+Memory used on top of the interpreter baseline is also scaled to one million
+rows, which keeps runs with different ``--rows`` comparable.
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.synthetic import write_synthetic_csv
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (Linux)."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+
+def peak_rss() -> int:
+    """Peak resident set size of this process in bytes (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(file_path: str, method: str) -> dict:
+    # Imported here so that the parent process never pays for them
+    from benchmarks.fixtures import create_benchmark_case, drop_benchmark_case
+    from project.application.use_cases.parse_evidence import ParseEvidencesUseCase
+    from project.dependencies.database_dependency import get_parser_registry
+    from project.infrastructure.database.session import SessionLocal
+    from project.infrastructure.repositories.communication_graph_repository import (
+        CommunicationGraphRepository,
+    )
+    from project.infrastructure.repositories.evidence_repository import (
+        EvidenceRepository,
+    )
+    from project.infrastructure.repositories.indicator_repository import (
+        IndicatorRepository,
+    )
+
+    session = SessionLocal()
+    case_id = create_benchmark_case(session)
+    try:
+        use_case = ParseEvidencesUseCase(
+            evidence_repository=EvidenceRepository(session, bulk_load_method=method),
+            parser_registry=get_parser_registry(),
+            communication_graph_repository=CommunicationGraphRepository(session),
+            indicator_repository=IndicatorRepository(session),
+        )
+        baseline = current_rss()
+        started = time.perf_counter()
+        result = use_case.execute(case_id=case_id, file_path=file_path)
+        elapsed = time.perf_counter() - started
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return {
+            "rows": result["total_rows"],
+            "seconds": elapsed,
+            "baseline": baseline,
+            "peak": peak_rss(),
+        }
+    finally:
+        drop_benchmark_case(session, case_id)
+        session.close()
+
+
+def run(file_path: str, method: str, batch_size: int, batch_bytes: int) -> dict:
+    # Settings are read at import time, so overrides go through the environment
+    env = dict(os.environ)
+    if batch_size:
+        env["EVIDENCE_BATCH_SIZE"] = str(batch_size)
+    if batch_bytes:
+        env["EVIDENCE_BATCH_BYTES"] = str(batch_bytes)
+
+    command = [
+        sys.executable,
+        "-m",
+        "benchmarks.bench_ingest_memory",
+        "--measure",
+        file_path,
+        "--methods",
+        method,
+    ]
+    completed = subprocess.run(
+        command, capture_output=True, text=True, check=True, env=env
+    )
+    # The ingestion logs its progress, the result is the last line
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--methods", nargs="+", default=["copy", "insert"])
+    parser.add_argument("--batch-size", type=int, default=0)
+    parser.add_argument("--batch-bytes", type=int, default=0)
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        stats = measure(args.measure, args.methods[0])
+        print(json.dumps(stats))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = write_synthetic_csv(
+            os.path.join(directory, "messages.csv"), args.rows
+        )
+        print(f"Synthetic file: {args.rows} rows, {os.path.getsize(file_path)} bytes")
+
+        mib = 1 << 20
+        for method in args.methods:
+            stats = run(file_path, method, args.batch_size, args.batch_bytes)
+            per_million = (stats["peak"] - stats["baseline"]) / stats["rows"] * 1e6
+            print(
+                f"{method:>8}: peak RSS {stats['peak'] / mib:,.1f} MiB "
+                f"(baseline {stats['baseline'] / mib:,.1f} MiB), "
+                f"{per_million / mib:,.1f} MiB per million rows, "
+                f"{stats['rows'] / stats['seconds']:,.0f} rows/sec"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare COPY and multi-row INSERT throughput for evidence message ingestion.
+
+Runs the full ``ParseEvidencesUseCase`` against the configured database:
+
+    python -m benchmarks.bench_message_bulk_load --rows 5000000
+
+``--indicator-rate`` makes a share of the payloads mention an indicator of
+compromise, to measure the cost of extracting and recording them.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.fixtures import create_benchmark_case, drop_benchmark_case
+from benchmarks.synthetic import write_synthetic_csv
+from project.application.use_cases.parse_evidence import ParseEvidencesUseCase
+from project.dependencies.database_dependency import get_parser_registry
+from project.infrastructure.database.session import SessionLocal
+from project.infrastructure.repositories.communication_graph_repository import (
+    CommunicationGraphRepository,
+)
+from project.infrastructure.repositories.evidence_repository import EvidenceRepository
+from project.infrastructure.repositories.indicator_repository import IndicatorRepository
+
+
+def run(file_path: str, method: str) -> float:
+    session = SessionLocal()
+    case_id = create_benchmark_case(session)
+    try:
+        use_case = ParseEvidencesUseCase(
+            evidence_repository=EvidenceRepository(session, bulk_load_method=method),
+            parser_registry=get_parser_registry(),
+            communication_graph_repository=CommunicationGraphRepository(session),
+            indicator_repository=IndicatorRepository(session),
+        )
+        started = time.perf_counter()
+        result = use_case.execute(case_id=case_id, file_path=file_path)
+        elapsed = time.perf_counter() - started
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return result["total_rows"] / elapsed
+    finally:
+        drop_benchmark_case(session, case_id)
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--methods", nargs="+", default=["copy", "insert"])
+    parser.add_argument("--indicator-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = write_synthetic_csv(
+            os.path.join(directory, "messages.csv"),
+            args.rows,
+            indicator_rate=args.indicator_rate,
+        )
+        print(f"Synthetic file: {args.rows} rows, {os.path.getsize(file_path)} bytes")
+
+        for method in args.methods:
+            rows_per_second = run(file_path, method)
+            print(f"{method:>8}: {rows_per_second:,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Measure message embedding throughput as the number of concurrent jobs grows.
+
+Loads one synthetic evidence, then embeds all of its messages once per job
+count, each job a process running ``EmbedMessagesUseCase`` against the
+configured database:
+
+    python -m benchmarks.bench_message_embedding --rows 1000000 --jobs 1 2 4
+
+Every run checks that each message was embedded exactly once.
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from sqlalchemy import func, select, update
+
+from benchmarks.fixtures import create_benchmark_case, drop_benchmark_case
+from benchmarks.synthetic import write_synthetic_csv
+from project.application.use_cases.embed_messages import EmbedMessagesUseCase
+from project.application.use_cases.parse_evidence import ParseEvidencesUseCase
+from project.dependencies.database_dependency import (
+    get_message_encoder,
+    get_parser_registry,
+)
+from project.domain.enums import MessageStatus
+from project.infrastructure.database.models import EvidenceModel, MessageModel
+from project.infrastructure.database.session import SessionLocal, sync_engine
+from project.infrastructure.repositories.evidence_repository import EvidenceRepository
+from project.infrastructure.repositories.message_embedding_repository import (
+    MessageEmbeddingRepository,
+)
+
+
+def embed(evidence_id: str, batch_size: int) -> int:
+    session = SessionLocal()
+    try:
+        use_case = EmbedMessagesUseCase(
+            embedding_repository=MessageEmbeddingRepository(session),
+            encoder=get_message_encoder(),
+        )
+        return use_case.execute(evidence_id, batch_size)["embedded_messages"]
+    finally:
+        session.close()
+
+
+def reset(session, evidence_id) -> None:
+    session.execute(
+        update(MessageModel)
+        .where(MessageModel.evidence_id == evidence_id)
+        .values(status=MessageStatus.PROCESSING.value, embeddings=None)
+    )
+    session.commit()
+    # Reclaims the row versions of the previous run, so every run starts alike
+    with sync_engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(
+            f"VACUUM ANALYZE {MessageModel.__table__.fullname}"
+        )
+
+
+def run(evidence_id: str, rows: int, jobs: int, batch_size: int) -> float:
+    # Spawned, a forked process would share the parent's pooled connections
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(jobs) as pool:
+        started = time.perf_counter()
+        embedded = pool.starmap(embed, [(evidence_id, batch_size)] * jobs)
+        elapsed = time.perf_counter() - started
+    if sum(embedded) != rows:
+        raise RuntimeError(f"Embedded {sum(embedded)} of {rows} messages")
+    return rows / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    case_id = create_benchmark_case(session)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = write_synthetic_csv(
+                os.path.join(directory, "messages.csv"), args.rows
+            )
+            result = ParseEvidencesUseCase(
+                evidence_repository=EvidenceRepository(session),
+                parser_registry=get_parser_registry(),
+            ).execute(case_id=case_id, file_path=file_path)
+            if "error" in result:
+                raise RuntimeError(result["error"])
+        evidence_id = session.scalar(
+            select(EvidenceModel.id).where(EvidenceModel.case_id == case_id)
+        )
+        print(f"Synthetic evidence: {args.rows} messages, {os.cpu_count()} CPUs")
+
+        for jobs in args.jobs:
+            reset(session, evidence_id)
+            messages_per_second = run(
+                str(evidence_id), args.rows, jobs, args.batch_size
+            )
+            print(f"{jobs:>3} jobs: {messages_per_second:,.0f} messages/sec")
+
+        pending = session.scalar(
+            select(func.count())
+            .select_from(MessageModel)
+            .where(
+                MessageModel.evidence_id == evidence_id,
+                MessageModel.status != MessageStatus.EMBEDDED.value,
+            )
+        )
+        if pending:
+            raise RuntimeError(f"{pending} messages left unembedded")
+    finally:
+        drop_benchmark_case(session, case_id)
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Measure the cost of the near-duplicate stage of ingestion and how many
+planted near-duplicates it clusters together.
+
+Generates synthetic payloads, a share of them variants of a pool of templates
+with their numbers changed and a word swapped, then runs every batch through
+the stage as ``ParseEvidencesUseCase`` does: MinHash/LSH buckets, a lookup
+in the bucket index, cluster assignment and the index update, staged and
+published as around the commit of the batch.
+
+    python -m benchmarks.bench_near_duplicates --rows 500000 --batch-size 5000
+
+Reports the time spent per step and the share of template variants that
+ended up in the cluster of their template's first variant.
+"""
+
+import argparse
+import random
+import string
+import tempfile
+import time
+import uuid
+from collections import Counter, defaultdict
+
+from project.application.utils.near_duplicates import (
+    assign_clusters,
+    lsh_buckets,
+    resolve_clusters,
+)
+from project.infrastructure.near_duplicate_index.lsh_bucket_index import LshBucketIndex
+
+VOCABULARY = 20_000
+
+
+def make_payloads(rows: int, templates: int, duplicate_rate: float, seed: int):
+    """Payloads with the template each one varies, or None."""
+    rng = random.Random(seed)
+    # A vocabulary large enough that unrelated payloads share few shingles
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(VOCABULARY)
+    ]
+    pool = [
+        " ".join(rng.choices(words, k=rng.randint(12, 30))) + " ref {} amount {}"
+        for _ in range(templates)
+    ]
+    payloads = []
+    template_of = []
+    for _ in range(rows):
+        if rng.random() < duplicate_rate:
+            template = rng.randrange(templates)
+            variant = pool[template].split(" ")
+            variant[rng.randrange(len(variant))] = rng.choice(words)
+            payloads.append(
+                " ".join(variant).format(rng.randint(1, 10**6), rng.randint(1, 999))
+            )
+            template_of.append(template)
+        else:
+            payloads.append(" ".join(rng.choices(words, k=rng.randint(4, 24))))
+            template_of.append(None)
+    return payloads, template_of
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--templates", type=int, default=200)
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    payloads, template_of = make_payloads(
+        args.rows, args.templates, args.duplicate_rate, args.seed
+    )
+    case_id = uuid.uuid4()
+    evidence_id = uuid.uuid4()
+    seconds = Counter()
+    cluster_of = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = LshBucketIndex(directory)
+        for start in range(0, args.rows, args.batch_size):
+            end = start + args.batch_size
+            batch = payloads[start:end]
+            ids = [uuid.uuid4() for _ in batch]
+
+            started = time.perf_counter()
+            buckets, has_buckets = lsh_buckets(batch)
+            hashed = time.perf_counter()
+            with index.locked(case_id):
+                known = index.find(case_id, buckets)
+                found = time.perf_counter()
+                near_duplicates = assign_clusters(case_id, buckets, has_buckets, known)
+                assigned = time.perf_counter()
+                clusters = resolve_clusters(near_duplicates, evidence_id, ids)
+                index.stage(
+                    case_id,
+                    "batch",
+                    end,
+                    near_duplicates.bucket_keys,
+                    near_duplicates.bucket_clusters,
+                    clusters,
+                )
+                index.publish(case_id, "batch", end)
+            added = time.perf_counter()
+
+            seconds["buckets"] += hashed - started
+            seconds["find"] += found - hashed
+            seconds["assign"] += assigned - found
+            seconds["add"] += added - assigned
+
+            batch_clusters = [None] * len(batch)
+            for share, cluster in zip(near_duplicates.clusters, clusters):
+                for row in share.rows:
+                    batch_clusters[row] = cluster.id
+            cluster_of.extend(batch_clusters)
+
+    total = sum(seconds.values())
+    print(
+        f"{args.rows} messages in batches of {args.batch_size}: "
+        f"{args.rows / total:,.0f} messages/sec"
+    )
+    for step, step_seconds in seconds.items():
+        print(
+            f"{step:>8}: {step_seconds:.2f} s, "
+            f"{step_seconds * 1e6 / args.rows:.1f} µs/message"
+        )
+
+    # Each template's variants should share the cluster of its first variant
+    variants = defaultdict(list)
+    for template, cluster in zip(template_of, cluster_of):
+        if template is not None:
+            variants[template].append(cluster)
+    planted = sum(len(clusters) - 1 for clusters in variants.values())
+    joined = sum(
+        sum(cluster == clusters[0] for cluster in clusters[1:])
+        for clusters in variants.values()
+    )
+    sizes = Counter(cluster_of)
+    print(
+        f"variants in their template's cluster: {joined / max(planted, 1):.3f}, "
+        f"clusters of more than one message: "
+        f"{sum(size > 1 for size in sizes.values())}"
+    )
+
+
+if __name__ == "__main__":
+    main()
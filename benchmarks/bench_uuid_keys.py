@@ -0,0 +1,87 @@
+"""
+Compare insert throughput of random (v4) and time-ordered (v7) UUID keys as
+the primary key index grows past memory.
+
+Each key kind gets a scratch table shaped like the messages table's key, with a
+UUID primary key and a short payload. The table is loaded in COPY batches, and
+throughput is reported at every ``--report-every`` rows:
+
+    python -m benchmarks.bench_uuid_keys --rows 20000000
+"""
+
+import argparse
+import io
+import time
+import uuid
+
+from sqlalchemy import text
+
+from project.application.utils.uuid7 import uuid7
+from project.infrastructure.database.models import schema_name
+from project.infrastructure.database.session import SessionLocal
+
+KEY_GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+PAYLOAD = "x" * 64
+
+
+def load(session, kind: str, rows: int, batch_size: int, report_every: int):
+    table = f"{schema_name}.bench_{kind}_keys"
+    generate = KEY_GENERATORS[kind]
+
+    session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    session.execute(text(f"CREATE TABLE {table} (id uuid PRIMARY KEY, payload text)"))
+    session.commit()
+
+    try:
+        loaded = 0
+        window_rows = 0
+        window_started = time.perf_counter()
+        while loaded < rows:
+            count = min(batch_size, rows - loaded)
+            buffer = io.StringIO()
+            buffer.writelines(f"{generate()},{PAYLOAD}\n" for _ in range(count))
+            buffer.seek(0)
+
+            dbapi_connection = session.connection().connection
+            with dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(f"COPY {table} FROM STDIN WITH (FORMAT csv)", buffer)
+            session.commit()
+
+            loaded += count
+            window_rows += count
+            if window_rows >= report_every or loaded == rows:
+                elapsed = time.perf_counter() - window_started
+                index_size = session.execute(
+                    text(f"SELECT pg_relation_size('{table}_pkey')")
+                ).scalar()
+                print(
+                    f"{kind:>6}: {loaded:>12,} rows  "
+                    f"{window_rows / elapsed:>10,.0f} rows/sec  "
+                    f"index {index_size / (1 << 20):,.0f} MiB"
+                )
+                window_rows = 0
+                window_started = time.perf_counter()
+    finally:
+        session.rollback()
+        session.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--report-every", type=int, default=2_000_000)
+    parser.add_argument("--keys", nargs="+", default=list(KEY_GENERATORS))
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        for kind in args.keys:
+            load(session, kind, args.rows, args.batch_size, args.report_every)
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
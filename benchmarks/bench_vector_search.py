@@ -0,0 +1,104 @@
+"""
+Measure the recall and latency of the IVF vector index against a brute-force
+scan of the same vectors.
+
+Builds an index of clustered random unit vectors batch by batch, as the
+embedding jobs do, then searches it with held-out vectors for each number of
+probed lists and reports recall@k and query latency percentiles:
+
+    python -m benchmarks.bench_vector_search --rows 500000 --probes 8 16 32 64
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from project.infrastructure.vector_index.ivf_vector_index import IvfVectorIndex
+
+BUILD_BATCH_SIZE = 5000
+
+
+def make_vectors(rows: int, dimensions: int, clusters: int, spread: float):
+    """Unit vectors scattered around random topics, like embedded messages."""
+    rng = np.random.default_rng(0)
+    topics = rng.standard_normal((clusters, dimensions), dtype=np.float32)
+    topics /= np.linalg.norm(topics, axis=1, keepdims=True)
+    vectors = topics[rng.integers(clusters, size=rows)]
+    vectors += spread * rng.standard_normal((rows, dimensions), dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors
+
+
+def percentile(samples: list, value: float) -> float:
+    return float(np.percentile(samples, value)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--clusters", type=int, default=2000)
+    parser.add_argument("--spread", type=float, default=0.05)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=512)
+    parser.add_argument("--probes", type=int, nargs="+", default=[8, 16, 32, 64])
+    args = parser.parse_args()
+
+    vectors = make_vectors(
+        args.rows + args.queries, args.dimensions, args.clusters, args.spread
+    )
+    queries, vectors = np.split(vectors, [args.queries])
+    k = args.k
+    ids = [uuid.uuid4() for _ in range(args.rows)]
+    evidence_id = uuid.uuid4()
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = IvfVectorIndex(directory, lists=args.lists)
+        started = time.perf_counter()
+        for start in range(0, args.rows, BUILD_BATCH_SIZE):
+            end = start + BUILD_BATCH_SIZE
+            index.add(evidence_id, ids[start:end], vectors[start:end])
+        build_seconds = time.perf_counter() - started
+        print(
+            f"{args.rows} vectors of {args.dimensions} dimensions, {args.lists} "
+            f"lists: built at {args.rows / build_seconds:,.0f} vectors/sec"
+        )
+
+        # Ground truth and baseline latency: every vector scored
+        truth = []
+        brute_seconds = []
+        for query in queries:
+            started = time.perf_counter()
+            scores = vectors @ query
+            best = np.argpartition(scores, -k)[-k:]
+            brute_seconds.append(time.perf_counter() - started)
+            truth.append({ids[i] for i in best})
+        print(
+            f"{'brute':>10}: recall@{k} 1.000, "
+            f"p50 {percentile(brute_seconds, 50):.2f} ms, "
+            f"p99 {percentile(brute_seconds, 99):.2f} ms"
+        )
+
+        for probes in args.probes:
+            index.probes = probes
+            found = 0
+            seconds = []
+            for query, expected in zip(queries, truth):
+                started = time.perf_counter()
+                matches = index.search([evidence_id], query, k)
+                seconds.append(time.perf_counter() - started)
+                found += len(expected.intersection(match.id for match in matches))
+            print(
+                f"{probes:>4} probes: recall@{k} "
+                f"{found / (k * args.queries):.3f}, "
+                f"p50 {percentile(seconds, 50):.2f} ms, "
+                f"p99 {percentile(seconds, 99):.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Measure how the cost of matching watchlists at ingest grows with their terms.
+
+Compiles watchlists of a growing number of synthetic terms, part of them
+planted in the payloads, into one Aho-Corasick automaton as the matcher of
+``ParseEvidencesUseCase`` does, and matches batches of payloads against it.
+For the smaller lists the same terms are also matched with a regular
+expression alternating them, a pattern per term being slower still:
+
+    python -m benchmarks.bench_watchlist_matching --rows 20000 --terms 100 1000 10000
+
+Reports the time to compile an automaton and to load its pickle, which is
+what the workers sharing it pay, and the matching cost per message.
+"""
+
+import argparse
+import pickle
+import random
+import re
+import string
+import time
+import uuid
+
+from project.application.utils.watchlists import normalize_text
+from project.infrastructure.watchlists.aho_corasick_matcher import (
+    compile_automaton,
+    match_automaton,
+)
+
+VOCABULARY = 20_000
+# Terms beyond this count aren't matched with a regular expression
+MAX_REGEX_TERMS = 1000
+
+
+def make_terms(count: int, rng: random.Random):
+    """Keywords, handles and phone numbers."""
+    terms = set()
+    while len(terms) < count:
+        kind = rng.random()
+        if kind < 0.4:
+            terms.add(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 12)))
+            )
+        elif kind < 0.7:
+            terms.add("@" + "".join(rng.choices(string.ascii_lowercase + "_", k=8)))
+        else:
+            terms.add("+" + "".join(rng.choices(string.digits, k=11)))
+    return list(terms)
+
+
+def make_payloads(rows: int, terms, hit_rate: float, rng: random.Random):
+    words = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+        for _ in range(VOCABULARY)
+    ]
+    payloads = []
+    for _ in range(rows):
+        payload = rng.choices(words, k=rng.randint(8, 40))
+        if rng.random() < hit_rate:
+            payload.insert(rng.randrange(len(payload)), rng.choice(terms))
+        payloads.append(" ".join(payload))
+    return payloads
+
+
+def match_regex(pattern, texts):
+    return [
+        (row, match.group())
+        for row, text in enumerate(texts)
+        for match in pattern.finditer(normalize_text(text))
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--terms", type=int, nargs="+", default=[100, 1000, 10_000, 100_000]
+    )
+    parser.add_argument("--hit-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for count in args.terms:
+        terms = make_terms(count, rng)
+        payloads = make_payloads(args.rows, terms, args.hit_rate, rng)
+        batches = [
+            payloads[start:end]
+            for start, end in zip(
+                range(0, args.rows, args.batch_size),
+                range(args.batch_size, args.rows + args.batch_size, args.batch_size),
+            )
+        ]
+
+        started = time.perf_counter()
+        automaton = compile_automaton({uuid.uuid4(): terms})
+        compiled = time.perf_counter()
+        pickled = pickle.dumps(automaton, protocol=pickle.HIGHEST_PROTOCOL)
+        loading = time.perf_counter()
+        pickle.loads(pickled)
+        loaded = time.perf_counter()
+
+        hits = 0
+        matching = time.perf_counter()
+        for batch in batches:
+            hits += len(match_automaton(automaton, batch))
+        matched = time.perf_counter()
+
+        print(
+            f"{count:>7} terms: compile {(compiled - started) * 1e3:.0f} ms, "
+            f"load {(loaded - loading) * 1e3:.0f} ms "
+            f"({len(pickled) / 2**20:.1f} MiB), "
+            f"{(matched - matching) * 1e6 / args.rows:.1f} µs/message, "
+            f"{hits} hits"
+        )
+
+        if count <= MAX_REGEX_TERMS:
+            pattern = re.compile(
+                r"(?<!\w)(?:" + "|".join(re.escape(term) for term in terms) + r")(?!\w)"
+            )
+            matching = time.perf_counter()
+            for batch in batches:
+                match_regex(pattern, batch)
+            matched = time.perf_counter()
+            print(
+                f"{'':>7}        regex alternation "
+                f"{(matched - matching) * 1e6 / args.rows:.1f} µs/message"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Assert that compressed evidence files parse through the real parser registry.
+
+Writes the same small CSV and JSONL evidence plain, gzip and zstd compressed,
+and as zstd members of a ZIP archive, then detects the format of each, checks
+its columns as an upload does and reads all of its records:
+
+    python -m benchmarks.check_compressed_parsing
+
+Exits non-zero when a file can't be read or yields other records than the
+plain one.
+"""
+
+import gzip
+import os
+import sys
+import tempfile
+import zipfile
+
+import zstandard
+
+from project.application.utils.evidence_format import detect_evidence_format
+from project.application.utils.evidence_schema import resolve_evidence_schema
+from project.domain.entities import IngestionCheckpointEntity
+from project.infrastructure.parsers.parser_registry import build_parser_registry
+
+ROWS = 50
+
+CSV = b"sender,receiver,payload\n" + b"".join(
+    b'user%d,peer%d,"line one\nline two of message %d"\n' % (row, row, row)
+    for row in range(ROWS)
+)
+JSONL = b"".join(
+    b'{"sender": "user%d", "receiver": "peer%d", "payload": "message %d"}\n'
+    % (row, row, row)
+    for row in range(ROWS)
+)
+
+
+def write_files(directory: str) -> dict:
+    """The evidence files by name, each with the number of records it holds."""
+    zstd = zstandard.ZstdCompressor()
+    contents = {
+        "evidence.csv": CSV,
+        "evidence.csv.gz": gzip.compress(CSV),
+        "evidence.csv.zst": zstd.compress(CSV),
+        "evidence.jsonl": JSONL,
+        "evidence.jsonl.gz": gzip.compress(JSONL),
+        "evidence.jsonl.zst": zstd.compress(JSONL),
+    }
+    for name, content in contents.items():
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(content)
+    counts = {name: ROWS for name in contents}
+
+    with zipfile.ZipFile(os.path.join(directory, "evidence.zip"), "w") as archive:
+        archive.writestr("messages.csv.zst", contents["evidence.csv.zst"])
+        archive.writestr("messages.jsonl.zst", contents["evidence.jsonl.zst"])
+    counts["evidence.zip"] = 2 * ROWS
+    return counts
+
+
+def read_all(parser, file_path: str) -> list:
+    records = []
+    for start, end in parser.plan_chunks(file_path, 0):
+        checkpoint = IngestionCheckpointEntity(
+            evidence_id=None, chunk_start=start, chunk_end=end, byte_offset=start
+        )
+        records.extend(
+            record for record, _ in parser.read_records(file_path, checkpoint)
+        )
+    return records
+
+
+def main() -> int:
+    registry = build_parser_registry()
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for name, count in write_files(directory).items():
+            file_path = os.path.join(directory, name)
+            try:
+                parser = registry.get(detect_evidence_format(file_path, name))
+                resolve_evidence_schema(parser, file_path)
+                records = read_all(parser, file_path)
+            except Exception as e:
+                failures += 1
+                print(f"FAIL {name}: {type(e).__name__}: {e}")
+                continue
+
+            parsed = [record for record in records if isinstance(record, dict)]
+            if len(parsed) != count or len(records) != count:
+                failures += 1
+                print(f"FAIL {name}: {len(parsed)} of {count} records parsed")
+            elif parsed[-1]["sender"] != f"user{ROWS - 1}":
+                failures += 1
+                print(f"FAIL {name}: last record is {parsed[-1]}")
+            else:
+                print(f"ok   {name}: {count} records")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Assert that a CSV file parsed in chunks yields the same records as a serial
+parse.
+
+Writes CSV evidence mixing quoted multi-line payloads, escaped quotes and
+stray quotes inside unquoted fields, plans its chunks at several sizes and
+reads each chunk through the CSV parser, as the parallel chunk jobs do:
+
+    python -m benchmarks.check_csv_chunks
+
+Exits non-zero when a chunked parse yields other records or rejects than
+the serial one.
+"""
+
+import os
+import sys
+import tempfile
+
+from project.domain.entities import IngestionCheckpointEntity
+from project.infrastructure.parsers.csv_parser import CsvEvidenceParser
+
+CHUNK_SIZES = [1, 64, 200, 1000, 4096]
+
+ROWS = [
+    b'user0,peer0,my 27" monitor\n',
+    *(
+        b'user%d,peer%d,"line one\nline two, ""quoted"" %d"\n' % (row, row, row)
+        for row in range(1, 200)
+    ),
+    b'user200,peer200,ends with a quote"\n',
+    b'user201,"peer\n201",6" ruler, 12" ruler\n',
+    *(
+        b'user%d,peer%d,"last\n\nlines %d"\n' % (row, row, row)
+        for row in range(202, 300)
+    ),
+]
+CSV = b"sender,receiver,payload\n" + b"".join(ROWS)
+
+
+def read_chunks(parser, file_path: str, chunks) -> list:
+    records = []
+    for start, end in chunks:
+        checkpoint = IngestionCheckpointEntity(
+            evidence_id=None, chunk_start=start, chunk_end=end, byte_offset=start
+        )
+        records.extend(
+            record if isinstance(record, dict) else record.reason
+            for record, _ in parser.read_records(file_path, checkpoint)
+        )
+    return records
+
+
+def main() -> int:
+    parser = CsvEvidenceParser()
+    failures = 0
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "evidence.csv")
+        with open(file_path, "wb") as f:
+            f.write(CSV)
+
+        serial = read_chunks(parser, file_path, parser.plan_chunks(file_path, 0))
+        print(f"serial: {len(serial)} records")
+        for chunk_size in CHUNK_SIZES:
+            chunks = parser.plan_chunks(file_path, chunk_size)
+            records = read_chunks(parser, file_path, chunks)
+            if records != serial:
+                failures += 1
+                print(
+                    f"FAIL chunk size {chunk_size}: {len(records)} records "
+                    f"from {len(chunks)} chunks"
+                )
+            else:
+                print(f"ok   chunk size {chunk_size}: {len(chunks)} chunks")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Assert that the access checks and association lookups are served by indexes.
+
+Every query is planned with sequential scans disabled. That makes the planner
+use any index that can serve the query, whatever the table size, so a
+``Seq Scan`` left in a plan means the index is missing:
+
+    python -m benchmarks.check_query_plans
+
+Exits non-zero when a plan scans one of its tables sequentially.
+"""
+
+import json
+import sys
+import uuid
+
+from sqlalchemy import String, any_, func, literal, literal_column, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.domain.enums import MessageStatus
+from project.infrastructure.database.models import (
+    MESSAGE_SEARCH_CONFIG,
+    CaseCollectionAssociationModel,
+    CaseModel,
+    CommunicationComponentModel,
+    CommunicationParticipantModel,
+    EvidenceModel,
+    IndicatorModel,
+    MessageIndicatorModel,
+    MessageModel,
+    NearDuplicateClusterModel,
+    SharedCaseGroupModel,
+    SharedCaseUserModel,
+    UserGroupAssociationModel,
+    WatchlistHitModel,
+    WatchlistModel,
+)
+from project.infrastructure.database.session import SessionLocal
+
+SOME_ID = uuid.uuid4()
+OTHER_ID = uuid.uuid4()
+
+QUERIES = {
+    "case access check": select(SharedCaseUserModel.id).where(
+        SharedCaseUserModel.user_id == SOME_ID,
+        SharedCaseUserModel.case_id == OTHER_ID,
+    ),
+    "cases shared with a user": select(SharedCaseUserModel.case_id).where(
+        SharedCaseUserModel.user_id == SOME_ID
+    ),
+    "cases owned by a user": select(CaseModel).where(CaseModel.user_id == SOME_ID),
+    "evidences of a case": select(EvidenceModel).where(
+        EvidenceModel.case_id == SOME_ID
+    ),
+    "messages of an evidence": select(MessageModel).where(
+        MessageModel.evidence_id == SOME_ID
+    ),
+    "messages matching a search": select(MessageModel.id).where(
+        MessageModel.payload_tsv.bool_op("@@")(
+            func.websearch_to_tsquery(
+                literal_column(f"'{MESSAGE_SEARCH_CONFIG}'::regconfig"), "wallet"
+            )
+        )
+    ),
+    "messages pending embedding": select(MessageModel.id)
+    .where(MessageModel.status == MessageStatus.PROCESSING.value)
+    .order_by(MessageModel.evidence_id, MessageModel.id)
+    .limit(5000),
+    "communication components of a case": select(CommunicationComponentModel.id)
+    .where(
+        CommunicationComponentModel.case_id == SOME_ID,
+        CommunicationComponentModel.size >= 2,
+    )
+    .order_by(
+        CommunicationComponentModel.size.desc(),
+        CommunicationComponentModel.message_count.desc(),
+        CommunicationComponentModel.id.desc(),
+    )
+    .limit(20),
+    "participants of a component": select(CommunicationParticipantModel.participant)
+    .where(CommunicationParticipantModel.component_id == SOME_ID)
+    .order_by(CommunicationParticipantModel.participant)
+    .limit(100),
+    "components of participants": select(
+        CommunicationParticipantModel.component_id
+    ).where(
+        CommunicationParticipantModel.case_id == SOME_ID,
+        CommunicationParticipantModel.participant
+        == any_(literal(["alice", "bob"], ARRAY(String))),
+    ),
+    "top talkers of a case": select(CommunicationParticipantModel.participant)
+    .where(CommunicationParticipantModel.case_id == SOME_ID)
+    .order_by(
+        CommunicationParticipantModel.message_count.desc(),
+        CommunicationParticipantModel.participant,
+    )
+    .limit(20),
+    "indicators with a value": select(IndicatorModel.id).where(
+        IndicatorModel.value == "203.0.113.7"
+    ),
+    "messages mentioning an indicator": select(MessageIndicatorModel.message_id)
+    .where(
+        MessageIndicatorModel.indicator_id == SOME_ID,
+        MessageIndicatorModel.evidence_id == OTHER_ID,
+    )
+    .order_by(MessageIndicatorModel.message_id),
+    "indicator mentions of an evidence": select(MessageIndicatorModel.id).where(
+        MessageIndicatorModel.evidence_id == SOME_ID
+    ),
+    "near-duplicate clusters of a case": select(
+        NearDuplicateClusterModel.cluster_id
+    ).where(NearDuplicateClusterModel.case_id == SOME_ID),
+    "near-duplicate shares of an evidence": select(NearDuplicateClusterModel.id).where(
+        NearDuplicateClusterModel.evidence_id == SOME_ID
+    ),
+    "watchlists of a case": select(WatchlistModel.id).where(
+        WatchlistModel.case_id == SOME_ID
+    ),
+    "watchlists of a user": select(WatchlistModel.id).where(
+        WatchlistModel.user_id == SOME_ID
+    ),
+    "watchlist hits of a watchlist": select(WatchlistHitModel.message_id).where(
+        WatchlistHitModel.watchlist_id == SOME_ID,
+        WatchlistHitModel.evidence_id == OTHER_ID,
+    ),
+    "watchlist hits of an evidence": select(WatchlistHitModel.id).where(
+        WatchlistHitModel.evidence_id == SOME_ID
+    ),
+    "groups of a user": select(UserGroupAssociationModel.group_id).where(
+        UserGroupAssociationModel.user_id == SOME_ID
+    ),
+    "members of a group": select(UserGroupAssociationModel.user_id).where(
+        UserGroupAssociationModel.group_id == SOME_ID
+    ),
+    "group membership": select(UserGroupAssociationModel.id).where(
+        UserGroupAssociationModel.user_id == SOME_ID,
+        UserGroupAssociationModel.group_id == OTHER_ID,
+    ),
+    "groups a case is shared with": select(SharedCaseGroupModel.group_id).where(
+        SharedCaseGroupModel.case_id == SOME_ID
+    ),
+    "cases shared with a group": select(SharedCaseGroupModel.case_id).where(
+        SharedCaseGroupModel.group_id == SOME_ID
+    ),
+    "cases of a collection": select(CaseCollectionAssociationModel.case_id).where(
+        CaseCollectionAssociationModel.collection_id == SOME_ID
+    ),
+    "collections of a case": select(CaseCollectionAssociationModel.collection_id).where(
+        CaseCollectionAssociationModel.case_id == SOME_ID
+    ),
+}
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def explain(cursor, statement) -> dict:
+    compiled = statement.compile(dialect=postgresql.psycopg2.dialect())
+    cursor.execute(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def main() -> int:
+    session = SessionLocal()
+    failures = 0
+    try:
+        dbapi_connection = session.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            for name, statement in QUERIES.items():
+                nodes = list(plan_nodes(explain(cursor, statement)))
+                seq_scans = sorted(
+                    node["Relation Name"]
+                    for node in nodes
+                    if node["Node Type"] == "Seq Scan"
+                )
+                indexes = sorted(
+                    {node["Index Name"] for node in nodes if "Index Name" in node}
+                )
+                if seq_scans:
+                    failures += 1
+                    print(f"FAIL {name}: sequential scan on {', '.join(seq_scans)}")
+                else:
+                    print(f"ok   {name}: {', '.join(indexes)}")
+    finally:
+        session.rollback()
+        session.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import uuid
+
+from sqlalchemy import delete, select
+
+from project.domain.enums import CaseStatus
+from project.infrastructure.database.models import (
+    CaseModel,
+    EvidenceModel,
+    MessageModel,
+    UserModel,
+)
+
+
+def create_benchmark_case(session) -> uuid.UUID:
+    """Create a throwaway user and case that benchmark evidences can hang off."""
+    user = UserModel(
+        id=uuid.uuid4(),
+        username=f"benchmark-{uuid.uuid4().hex[:8]}",
+        hashed_password="!",
+    )
+    case = CaseModel(
+        id=uuid.uuid4(), user_id=user.id, title="benchmark", status=CaseStatus.OPEN
+    )
+    session.add(user)
+    session.flush()
+    session.add(case)
+    session.commit()
+    return case.id
+
+
+def drop_benchmark_case(session, case_id: uuid.UUID) -> None:
+    evidence_ids = select(EvidenceModel.id).where(EvidenceModel.case_id == case_id)
+    session.execute(
+        delete(MessageModel).where(MessageModel.evidence_id.in_(evidence_ids))
+    )
+    session.execute(delete(EvidenceModel).where(EvidenceModel.case_id == case_id))
+    case = session.get(CaseModel, case_id)
+    user_id = case.user_id
+    session.delete(case)
+    session.flush()
+    session.execute(delete(UserModel).where(UserModel.id == user_id))
+    session.commit()
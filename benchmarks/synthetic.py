@@ -0,0 +1,77 @@
+import csv
+import hashlib
+import random
+import string
+from typing import Sequence
+
+WORDS = (
+    "transfer wallet meeting tonight payment confirm address invoice server "
+    "login password account package delivery call urgent bank crypto"
+).split()
+
+
+def random_handle(rng: random.Random) -> str:
+    return "user_" + "".join(rng.choices(string.ascii_lowercase + string.digits, k=6))
+
+
+def random_indicator(rng: random.Random) -> str:
+    """An IP, domain, URL, email address or file hash, as found in chats."""
+    host = "".join(rng.choices(string.ascii_lowercase, k=8)) + ".example"
+    return rng.choice(
+        [
+            ".".join(str(rng.randint(1, 254)) for _ in range(4)),
+            host,
+            f"https://{host}/download/{rng.randint(1, 10**6)}",
+            f"{random_handle(rng)}@{host}",
+            hashlib.sha256(rng.randbytes(8)).hexdigest(),
+        ]
+    )
+
+
+def random_payload(rng: random.Random, indicators: Sequence[str] = ()) -> str:
+    payload = " ".join(rng.choices(WORDS, k=rng.randint(4, 24)))
+    if indicators:
+        payload += " " + rng.choice(indicators)
+    # Exercise CSV quoting: commas, embedded quotes and multi-line payloads
+    roll = rng.random()
+    if roll < 0.05:
+        payload += ', "quoted" part'
+    elif roll < 0.08:
+        payload += "\nsecond line"
+    return payload
+
+
+def write_synthetic_csv(
+    file_path: str,
+    rows: int,
+    participants: int = 5000,
+    seed: int = 42,
+    indicator_rate: float = 0.0,
+) -> str:
+    """
+    Write a sender,receiver,payload CSV with `rows` data rows. A share
+    `indicator_rate` of the payloads mentions one of a pool of indicators.
+    """
+    rng = random.Random(seed)
+    handles = [random_handle(rng) for _ in range(participants)]
+    # Drawn only when asked for, the default file stays the same for a seed
+    indicators = [
+        random_indicator(rng) for _ in range(participants if indicator_rate else 0)
+    ]
+
+    with open(file_path, mode="w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["sender", "receiver", "payload"])
+        for _ in range(rows):
+            mentioned = (
+                indicators if indicators and rng.random() < indicator_rate else ()
+            )
+            writer.writerow(
+                [
+                    rng.choice(handles),
+                    rng.choice(handles),
+                    random_payload(rng, mentioned),
+                ]
+            )
+
+    return file_path
@@ -13,12 +13,36 @@ from project.presentation.api.authentication.authentication_routes import (
 from project.presentation.api.case_management.case_management_routes import (
     router as case_management_router,
 )
+from project.presentation.api.communication_graph.communication_graph_routes import (
+    router as communication_graph_router,
+)
+from project.presentation.api.evidence_management.evidence_management_routes import (
+    router as evidence_management_router,
+)
 from project.presentation.api.group_management.group_management_routes import (
     router as group_management_router,
 )
+from project.presentation.api.indicators.indicator_routes import (
+    router as indicator_router,
+)
+from project.presentation.api.message_browsing.message_browsing_routes import (
+    router as message_browsing_router,
+)
+from project.presentation.api.near_duplicates.near_duplicate_routes import (
+    router as near_duplicate_router,
+)
+from project.presentation.api.semantic_search.semantic_search_routes import (
+    router as semantic_search_router,
+)
+from project.presentation.api.upload_evidences.evidence_events_routes import (
+    router as evidence_events_router,
+)
 from project.presentation.api.upload_evidences.upload_evidences_routes import (
     router as upload_evidences_router,
 )
+from project.presentation.api.watchlists.watchlist_routes import (
+    router as watchlist_router,
+)
 
 logger = logging.getLogger("uvicorn")
 logging.basicConfig(level=logging.INFO)
@@ -60,6 +84,14 @@ app.include_router(auth_router)
 app.include_router(group_management_router)
 app.include_router(case_management_router)
 app.include_router(upload_evidences_router)
+app.include_router(evidence_events_router)
+app.include_router(evidence_management_router)
+app.include_router(message_browsing_router)
+app.include_router(communication_graph_router)
+app.include_router(indicator_router)
+app.include_router(semantic_search_router)
+app.include_router(near_duplicate_router)
+app.include_router(watchlist_router)
 
 
 @app.on_event("startup")
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+
+class TalkerResponse(BaseModel):
+    participant: str
+    sent: int
+    received: int
+    # Distinct participants messaged or messaged by
+    contacts: int
+    first_seen: datetime
+    last_seen: datetime
+
+
+class EdgeResponse(BaseModel):
+    sender: str
+    receiver: str
+    message_count: int
+    first_seen: datetime
+    last_seen: datetime
+
+
+class EgoNetworkResponse(BaseModel):
+    participant: str
+    # Closest contacts, by messages exchanged with the participant
+    contacts: List[str]
+    # Edges among the participant and its contacts
+    edges: List[EdgeResponse]
+
+
+class ComponentResponse(BaseModel):
+    size: int
+    message_count: int
+    participants: List[str]
+
+
+class ComponentsResponse(BaseModel):
+    # Components of at least the requested size, before the limit
+    total: int
+    components: List[ComponentResponse]
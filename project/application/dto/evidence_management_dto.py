@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Extra
+
+
+class ColumnMapping(BaseModel):
+    """Source column of each message field, sniffed from the header when unset."""
+
+    sender: Optional[str] = None
+    receiver: Optional[str] = None
+    payload: Optional[str] = None
+
+    class Config:
+        extra = Extra.forbid
+
+
+class EvidenceJobResponse(BaseModel):
+    evidence_id: UUID
+    job_id: str
+    filename: str
+
+
+class UploadEvidencesResponse(BaseModel):
+    message: str
+    evidences: List[EvidenceJobResponse] = []
+
+
+class EvidenceProgressResponse(BaseModel):
+    evidence_id: UUID
+    case_id: UUID
+    status: str
+    rows_processed: int
+    rows_rejected: int
+    bytes_processed: int
+    total_bytes: int
+    percent: float
+    chunks_total: int
+    chunks_completed: int
+    rows_per_second: Optional[float] = None
+    bytes_per_second: Optional[float] = None
+    eta_seconds: Optional[float] = None
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class QuarantinedRowResponse(BaseModel):
+    id: UUID
+    line_number: Optional[int] = None
+    byte_offset: Optional[int] = None
+    reason: str
+    raw: Optional[str] = None
+    created_at: Optional[datetime] = None
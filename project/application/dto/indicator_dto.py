@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from project.domain.enums import IndicatorKind
+
+
+class IndicatorCaseResponse(BaseModel):
+    """How often a case mentions an indicator."""
+
+    kind: IndicatorKind
+    value: str
+    case_id: UUID
+    evidences: int
+    messages: int
+    # When the first and last mentioning messages were loaded
+    first_seen: datetime
+    last_seen: datetime
+
+
+class IndicatorMessageResponse(BaseModel):
+    kind: IndicatorKind
+    value: str
+    id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    payload: str
+    created_at: Optional[datetime] = None
+
+
+class IndicatorMessagePageResponse(BaseModel):
+    items: List[IndicatorMessageResponse]
+    # Pass back as `cursor` for the next page, unset on the last one
+    next_cursor: Optional[str] = None
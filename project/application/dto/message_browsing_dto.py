@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class MessageResponse(BaseModel):
+    """A message holding the requested fields only."""
+
+    id: Optional[UUID] = None
+    evidence_id: Optional[UUID] = None
+    sender: Optional[str] = None
+    receiver: Optional[str] = None
+    payload: Optional[str] = None
+    status: Optional[str] = None
+    # Extra columns of the source file, by column name
+    attributes: Optional[Dict[str, Optional[str]]] = None
+    created_at: Optional[datetime] = None
+
+
+class MessagePageResponse(BaseModel):
+    items: List[MessageResponse]
+    # Pass back as `cursor` for the next page, unset on the last one
+    next_cursor: Optional[str] = None
+
+
+class MessageSearchHit(BaseModel):
+    id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    created_at: Optional[datetime] = None
+    rank: float
+    # Passages of the payload, the matched words wrapped in <mark>
+    snippet: str
+
+
+class MessageSearchResponse(BaseModel):
+    items: List[MessageSearchHit]
+    # Pass back as `cursor` for the next page, unset on the last one
+    next_cursor: Optional[str] = None
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class NearDuplicateSampleResponse(BaseModel):
+    id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    payload: str
+    created_at: Optional[datetime] = None
+
+
+class NearDuplicateClusterResponse(BaseModel):
+    cluster_id: UUID
+    message_count: int
+    # Evidences of the case holding messages of the cluster
+    evidence_count: int
+    # The cluster's earliest message, unset once its evidence is deleted
+    sample: Optional[NearDuplicateSampleResponse] = None
+
+
+class NearDuplicateClustersResponse(BaseModel):
+    # Clusters of at least the requested size, before the limit
+    total: int
+    clusters: List[NearDuplicateClusterResponse]
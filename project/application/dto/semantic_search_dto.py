@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SimilarMessageResponse(BaseModel):
+    id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    payload: str
+    created_at: Optional[datetime] = None
+    # Cosine similarity of the two messages' embeddings, 1 for identical ones
+    score: float
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class CreateWatchlistRequest(BaseModel):
+    name: str
+    # Keywords, handles, phone numbers..., matched as whole words ignoring case
+    terms: List[str] = []
+    # Watched in this case only, or in every case of the user when unset
+    case_id: Optional[UUID] = None
+
+
+class UpdateWatchlistRequest(BaseModel):
+    name: Optional[str] = None
+    # Replaces the terms, matched against messages ingested from then on
+    terms: Optional[List[str]] = None
+
+
+class WatchlistResponse(BaseModel):
+    id: UUID
+    user_id: UUID
+    case_id: Optional[UUID] = None
+    name: str
+    revision: int
+    term_count: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class WatchlistDetailResponse(WatchlistResponse):
+    terms: List[str]
+
+
+class WatchlistTermHitResponse(BaseModel):
+    watchlist_id: UUID
+    term: str
+
+
+class WatchlistHitMessageResponse(BaseModel):
+    id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    payload: str
+    created_at: Optional[datetime] = None
+    hits: List[WatchlistTermHitResponse]
+
+
+class WatchlistHitMessagePageResponse(BaseModel):
+    items: List[WatchlistHitMessageResponse]
+    # Pass back as `cursor` for the next page, unset on the last one
+    next_cursor: Optional[str] = None
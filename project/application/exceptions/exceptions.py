@@ -1,6 +1,7 @@
 from project.infrastructure.exceptions.exceptions import (
     AccessDeniedError,
     DuplicateAssociationError,
+    FileTooLargeError,
     NotFoundError,
 )
 
@@ -42,6 +43,20 @@ class ResourceConflictException(BaseAppException):
         super().__init__(message, status_code=409)
 
 
+class PayloadTooLargeException(BaseAppException):
+    """Raised when an uploaded file is larger than allowed"""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=413)
+
+
+class InvalidInputException(BaseAppException):
+    """Raised when a request is well-formed but its content can't be processed"""
+
+    def __init__(self, message: str):
+        super().__init__(message, status_code=422)
+
+
 def handle_repo_exceptions(func):
     async def wrapper(*args, **kwargs):
         try:
@@ -52,5 +67,7 @@ def handle_repo_exceptions(func):
             raise ResourceConflictException(str(e))
         except NotFoundError as e:
             raise ResourceNotFoundException(str(e))
+        except FileTooLargeError as e:
+            raise PayloadTooLargeException(str(e))
 
     return wrapper
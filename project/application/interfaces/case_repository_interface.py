@@ -20,6 +20,10 @@ class ICaseRepository(ABC):
     ) -> Optional[CaseEntity]:
         pass
 
+    @abstractmethod
+    async def check_case_access(self, case_id: UUID, user_id: UUID) -> None:
+        pass
+
     @abstractmethod
     async def update_case(self, case_data: CaseEntity) -> CaseEntity:
         pass
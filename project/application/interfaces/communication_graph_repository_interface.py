@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from project.domain.entities import CommunicationEdgeEntity, EvidenceEntity
+
+
+class ICommunicationGraphRepository(ABC):
+    """The communication graph aggregated at ingest time."""
+
+    # --- Synchronous Methods ---
+    @abstractmethod
+    def add_edges(self, edges: List[CommunicationEdgeEntity]) -> None:
+        """
+        Add the edges of a batch to the counts of the communication graph and
+        merge the components they join, within the transaction of the batch.
+        """
+        pass
+
+    @abstractmethod
+    def clone_edges(self, source_evidence_id: str, evidence: EvidenceEntity) -> None:
+        """
+        Copy the edges of another evidence for `evidence` and merge the
+        components they join, within the transaction of the copy.
+        """
+        pass
+
+    @abstractmethod
+    def rebuild_components(self, case_id: UUID) -> None:
+        """
+        Compute the connected components of a case's communication graph
+        again from its edges, after some were deleted.
+        """
+        pass
+
+    # --- Asynchronous Methods ---
+    @abstractmethod
+    async def top_talkers(self, case_id: UUID, limit: int) -> List[dict]:
+        """
+        The participants of a case with the most messages sent and received.
+
+        Rows hold `participant`, `sent`, `received`, `contacts`, `first_seen`
+        and `last_seen`, busiest first.
+        """
+        pass
+
+    @abstractmethod
+    async def top_contacts(
+        self, case_id: UUID, participant: str, limit: int
+    ) -> List[str]:
+        """The participants exchanging the most messages with `participant`."""
+        pass
+
+    @abstractmethod
+    async def list_edges_between(
+        self, case_id: UUID, participants: List[str]
+    ) -> List[dict]:
+        """
+        The edges of a case whose sender and receiver are both among
+        `participants`, summed over the evidences of the case.
+
+        Rows hold `sender`, `receiver`, `message_count`, `first_seen` and
+        `last_seen`.
+        """
+        pass
+
+    @abstractmethod
+    async def count_components(self, case_id: UUID, min_size: int) -> int:
+        """The connected components of a case with `min_size` participants or more."""
+        pass
+
+    @abstractmethod
+    async def list_components(
+        self, case_id: UUID, min_size: int, limit: int, max_participants: int
+    ) -> List[dict]:
+        """
+        The largest connected components of a case, with `min_size`
+        participants or more, as maintained at ingest time.
+
+        Rows hold `size`, `message_count` and the first `max_participants`
+        `participants` of the component by name, largest component first.
+        """
+        pass
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Optional
+
+
+class IEventPublisher(ABC):
+    @abstractmethod
+    def publish(self, channel: str, event: dict[str, Any]) -> None:
+        """Publish an event; delivery is best effort and never raises."""
+        pass
+
+
+class IEventSubscriber(ABC):
+    @abstractmethod
+    def subscribe(
+        self, channel: str, timeout: float
+    ) -> AsyncIterator[Optional[dict[str, Any]]]:
+        """
+        Yield events published on a channel, or None whenever `timeout`
+        seconds pass without one so that callers can send keep-alives.
+        """
+        pass
+
+
+def case_evidences_channel(case_id) -> str:
+    return f"case:{case_id}:evidences"
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+from project.domain.entities import IngestionCheckpointEntity
+from project.domain.enums import EvidenceFormat
+
+
+@dataclass
+class RejectedRecord:
+    """A record that could not be read, to be quarantined instead of loaded."""
+
+    reason: str
+    line_number: Optional[int] = None
+    byte_offset: Optional[int] = None
+    raw: Optional[str] = None
+
+
+# A parsed (or rejected) record together with the position to resume from once
+# it has been committed, or None for formats that can only be resumed by count
+EvidenceRecord = Tuple[Union[dict, RejectedRecord], Optional[int]]
+
+
+class IEvidenceParser(ABC):
+    # Whether a file can be split into byte ranges that parse independently
+    splittable: bool = False
+
+    @abstractmethod
+    def read_records(
+        self,
+        file_path: str,
+        checkpoint: IngestionCheckpointEntity,
+        required_columns: Sequence[str] = (),
+    ) -> Iterator[EvidenceRecord]:
+        """
+        Lazily yield the records of a file that come after `checkpoint`.
+
+        Splittable parsers read the range [byte_offset, chunk_end); the others
+        start over and skip the records that are already stored or rejected.
+        Malformed records and records with one of `required_columns` absent or
+        blank are yielded as `RejectedRecord`, and reading carries on with the
+        next one.
+        """
+        pass
+
+    def plan_chunks(
+        self, file_path: str, chunk_size: int
+    ) -> List[Tuple[int, Optional[int]]]:
+        """Split a file into `(start, end)` ranges, one range if not splittable."""
+        return [(0, None)]
+
+    def sample_records(self, file_path: str, limit: int) -> List[dict]:
+        """Read the first `limit` records of a file, e.g. to check its columns."""
+        start, end = self.plan_chunks(file_path, 0)[0]
+        checkpoint = IngestionCheckpointEntity(
+            evidence_id=None, chunk_start=start, chunk_end=end, byte_offset=start
+        )
+        with closing(self.read_records(file_path, checkpoint)) as records:
+            sample = [record for record, _ in islice(records, limit)]
+
+        parsed = [record for record in sample if isinstance(record, dict)]
+        if sample and not parsed:
+            raise ValueError(sample[0].reason)
+        return parsed
+
+
+class IEvidenceParserRegistry(ABC):
+    @abstractmethod
+    def get(self, evidence_format: EvidenceFormat) -> IEvidenceParser:
+        """Return the parser of a format, raising ValueError if there is none."""
+        pass
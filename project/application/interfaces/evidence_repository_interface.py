@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import ContextManager, List, Optional
+from uuid import UUID
 
-from project.domain.entities import EvidenceEntity, MessageEntity
+from project.application.utils.message_batch import MessageBatch
+from project.domain.entities import (
+    EvidenceEntity,
+    EvidenceProgressEntity,
+    IngestionCheckpointEntity,
+    QuarantinedRowEntity,
+)
 
 
 class IEvidenceRepository(ABC):
@@ -11,17 +18,80 @@ class IEvidenceRepository(ABC):
         """Persist a new evidence entity."""
         pass
 
+    @abstractmethod
+    def get(self, evidence_id: str) -> Optional[EvidenceEntity]:
+        """Retrieve an evidence entity by its ID."""
+        pass
+
     @abstractmethod
     def update(self, evidence: EvidenceEntity) -> EvidenceEntity:
         """Update an existing evidence entity."""
         pass
 
     @abstractmethod
-    def create_messages(self, messages: List[MessageEntity]) -> None:
-        """Persist bulk message entities."""
+    def get_checkpoint(
+        self, evidence_id: str, chunk_start: int
+    ) -> Optional[IngestionCheckpointEntity]:
+        """Retrieve the ingestion checkpoint of the chunk starting at `chunk_start`."""
+        pass
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+        """
+        Commit the writes made within the context on the repository's session,
+        by it and by the repositories sharing the session, all at once when
+        the context exits, or roll them back if it raises.
+        """
+        pass
+
+    @abstractmethod
+    def create_messages(
+        self,
+        messages: MessageBatch,
+        checkpoint: Optional[IngestionCheckpointEntity] = None,
+        quarantined_rows: Optional[List[QuarantinedRowEntity]] = None,
+    ) -> None:
+        """
+        Write a batch of messages, the records rejected alongside them and the
+        checkpoint, within `transaction`. The checkpoint records the id of the
+        last message written.
+        """
+        pass
+
+    @abstractmethod
+    def clone_messages(self, source_evidence_id: str, evidence: EvidenceEntity) -> None:
+        """
+        Copy the messages of another evidence with their indicator mentions,
+        near-duplicate clusters and the hits of the watchlists applying to the
+        case of `evidence`, and save `evidence`, within `transaction`.
+        """
         pass
 
     # --- Asynchronous Methods ---
+    @abstractmethod
+    async def get_parsed_by_content_hash(
+        self, content_hash: str, column_mapping: dict
+    ) -> Optional[EvidenceEntity]:
+        """
+        Retrieve the latest evidence parsed with the same column mapping from a
+        file with the given SHA-256.
+        """
+        pass
+
+    @abstractmethod
+    async def get_progress(
+        self, evidence_id: UUID, user_id: UUID
+    ) -> EvidenceProgressEntity:
+        """Aggregate the ingestion checkpoints of an evidence the user can access."""
+        pass
+
+    @abstractmethod
+    async def list_quarantined_rows(
+        self, evidence_id: UUID, user_id: UUID, limit: int, offset: int
+    ) -> List[QuarantinedRowEntity]:
+        """List the rejected records of an evidence the user can access."""
+        pass
+
     @abstractmethod
     async def get_by_id(self, evidence_id: str) -> Optional[EvidenceEntity]:
         """Retrieve an evidence entity by its ID."""
@@ -29,10 +99,10 @@ class IEvidenceRepository(ABC):
 
     @abstractmethod
     async def list_by_case_id(self, case_id: str) -> List[EvidenceEntity]:
-        """List all evidences associated with a given case."""
+        """List all evidences associated with a given case, in id order."""
         pass
 
     @abstractmethod
-    async def delete(self, evidence_id: str) -> None:
-        """Delete an evidence by its ID."""
+    async def delete(self, evidence_id: UUID, user_id: UUID) -> None:
+        """Delete an evidence of a case owned by the user, with its messages."""
         pass
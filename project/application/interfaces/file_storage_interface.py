@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+from project.domain.entities import StoredFileEntity
+
 
 class IFileStorage(ABC):
 
     @abstractmethod
-    async def upload_files(self, files) -> List[str]:
-        """Uploads a file and returns its storage path or URL."""
+    async def upload_files(self, files) -> List[StoredFileEntity]:
+        """Uploads files and returns their storage path, size and SHA-256."""
         pass
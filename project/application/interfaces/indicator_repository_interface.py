@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from project.application.utils.indicators import IndicatorMatch
+from project.application.utils.message_batch import MessageBatch
+
+
+class IIndicatorRepository(ABC):
+    """The indicators of compromise extracted at ingest time."""
+
+    # --- Synchronous Methods ---
+    @abstractmethod
+    def add_mentions(
+        self, messages: MessageBatch, indicators: List[IndicatorMatch]
+    ) -> None:
+        """
+        Record the indicators found in the payloads of a batch against their
+        messages, within the transaction of the batch.
+        """
+        pass
+
+    # --- Asynchronous Methods ---
+    @abstractmethod
+    async def list_indicator_cases(
+        self, value: str, kind: Optional[str], user_id: UUID
+    ) -> List[dict]:
+        """
+        The cases the user can access whose messages mention the indicator
+        `value`, of any kind unless `kind` is given.
+
+        Rows hold `kind`, `value`, `case_id`, `evidences`, `messages`,
+        `first_seen` and `last_seen`, the most mentions first.
+        """
+        pass
+
+    @abstractmethod
+    async def list_indicator_messages(
+        self,
+        evidence_ids: List[UUID],
+        value: str,
+        kind: Optional[str],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Page through the messages of the given evidences mentioning the
+        indicator `value` in `(evidence_id, id)` order, starting right after
+        the `(evidence_id, id)` key `after`.
+
+        Rows hold `kind`, `value` and the message's `id`, `evidence_id`,
+        `sender`, `receiver`, `payload` and `created_at`.
+        """
+        pass
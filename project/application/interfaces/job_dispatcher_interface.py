@@ -1,9 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
 
 
 class IJobDispatcher(ABC):
     @abstractmethod
-    def dispatch(self, job_name: str, payload: dict[str, Any]) -> None:
-        """Send a background job to be processed later."""
+    def dispatch(self, job_name: str, payload: dict[str, Any]) -> str:
+        """Send a background job to be processed later and return its job id."""
+        pass
+
+    @abstractmethod
+    def dispatch_chord(
+        self,
+        job_name: str,
+        payloads: List[dict[str, Any]],
+        callback_job_name: str,
+        callback_payload: dict[str, Any],
+    ) -> str:
+        """
+        Send one job per payload in parallel, then run the callback job with the
+        list of their results once every one of them has finished. Returns the
+        job id of the callback.
+        """
         pass
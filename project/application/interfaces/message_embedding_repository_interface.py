@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Optional
+from uuid import UUID
+
+import numpy as np
+
+
+class PendingMessage(NamedTuple):
+    """A message claimed for embedding."""
+
+    evidence_id: UUID
+    id: UUID
+    payload: str
+
+
+class MessageEmbeddings(NamedTuple):
+    """Vectors of messages, row `i` of `vectors` belonging to `ids[i]`."""
+
+    ids: List[UUID]
+    vectors: np.ndarray
+
+
+class IMessageEmbeddingRepository(ABC):
+    """Claims messages left to embed, writes their vectors back and reads them."""
+
+    @abstractmethod
+    def claim_pending_messages(
+        self, limit: int, evidence_id: Optional[str] = None
+    ) -> List[PendingMessage]:
+        """
+        Lock up to `limit` messages that are not embedded yet, of one evidence
+        or of any, in `(evidence_id, id)` order. Messages locked by another job
+        are skipped, so concurrent jobs claim disjoint batches. The claim holds
+        until `save_embeddings` or `release_claimed_messages`.
+        """
+        pass
+
+    @abstractmethod
+    def save_embeddings(
+        self, messages: List[PendingMessage], vectors: np.ndarray
+    ) -> None:
+        """
+        Store the vectors of the claimed messages, row by row, mark them as
+        embedded and end the claim.
+        """
+        pass
+
+    @abstractmethod
+    def release_claimed_messages(self) -> None:
+        """End the claim without writing anything, for another job to retry."""
+        pass
+
+    @abstractmethod
+    def list_embeddings(
+        self, evidence_id: str, limit: int, after: Optional[UUID] = None
+    ) -> MessageEmbeddings:
+        """
+        Page through the vectors of an evidence's embedded messages in id
+        order, starting right after the message id `after`.
+        """
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+import numpy as np
+
+
+class IMessageEncoder(ABC):
+    """Turns message payloads into fixed-length vectors."""
+
+    # Length of every vector
+    dimensions: int
+
+    @abstractmethod
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Encode a batch of texts into a float32 array of shape
+        `(len(texts), dimensions)`. Rows are L2-normalized, so a dot product is
+        a cosine similarity; a text without features encodes to zeros.
+        """
+        pass
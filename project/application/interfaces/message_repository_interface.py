@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# Message columns that can be browsed and projected
+MESSAGE_FIELDS = (
+    "id",
+    "evidence_id",
+    "sender",
+    "receiver",
+    "payload",
+    "status",
+    "attributes",
+    "created_at",
+)
+
+
+class IMessageRepository(ABC):
+    @abstractmethod
+    async def list_messages(
+        self,
+        evidence_ids: List[UUID],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+        sender: Optional[str] = None,
+        receiver: Optional[str] = None,
+        fields: Sequence[str] = MESSAGE_FIELDS,
+    ) -> List[dict]:
+        """
+        Page through the messages of the given evidences in `(evidence_id, id)`
+        order, starting right after the `(evidence_id, id)` key `after`.
+
+        Rows hold the requested `fields` plus the `evidence_id` and `id` keys.
+        """
+        pass
+
+    @abstractmethod
+    async def get_messages(
+        self, keys: List[Tuple[UUID, UUID]], fields: Sequence[str] = MESSAGE_FIELDS
+    ) -> List[dict]:
+        """
+        The messages of the given `(evidence_id, id)` keys, in no particular
+        order; keys of missing messages are left out.
+
+        Rows hold the requested `fields` plus the `evidence_id` and `id` keys.
+        """
+        pass
+
+    @abstractmethod
+    async def get_message_embedding(
+        self, evidence_id: UUID, message_id: UUID
+    ) -> Optional[np.ndarray]:
+        """The vector of a message, unset if it is missing or not embedded yet."""
+        pass
+
+    @abstractmethod
+    async def search_messages(
+        self,
+        evidence_ids: List[UUID],
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Page through the messages of the given evidences whose payload matches
+        the web-search style `query`, best rank first, starting right after the
+        `(rank, evidence_id, id)` key `after`.
+
+        Rows hold `id`, `evidence_id`, `sender`, `receiver`, `created_at`, the
+        `rank` and a `snippet` of the payload with the matches highlighted.
+        """
+        pass
+
+    @abstractmethod
+    def stream_messages(
+        self,
+        evidence_ids: List[UUID],
+        fields: Sequence[str] = MESSAGE_FIELDS,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[Tuple[UUID, List[tuple]]]:
+        """
+        Every message of the given evidences in `(evidence_id, id)` order, read
+        from a server-side cursor in batches of up to `batch_size` rows.
+
+        Yields `(evidence_id, rows)`, rows being tuples of the `fields`.
+        """
+        pass
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import ContextManager, Dict, Sequence
+from uuid import UUID
+
+import numpy as np
+
+from project.application.utils.near_duplicates import NearDuplicateCluster
+
+
+class INearDuplicateIndex(ABC):
+    """
+    The clusters the LSH buckets of a case's messages lead to, per case.
+
+    A batch looks its buckets up, is committed and adds its own while holding
+    `locked`, so batches of a case loaded at once can't start a cluster each
+    for the same near-duplicates. Its buckets are staged before the commit and
+    published after it, a batch committed by a job that died before
+    publishing is published when the job resumes.
+    """
+
+    @abstractmethod
+    def locked(self, case_id: UUID) -> ContextManager[None]:
+        """Hold the case's index, across processes, until the context exits."""
+        pass
+
+    @abstractmethod
+    def find(
+        self, case_id: UUID, buckets: np.ndarray
+    ) -> Dict[int, NearDuplicateCluster]:
+        """The clusters `buckets` already lead to in the case, by bucket."""
+        pass
+
+    @abstractmethod
+    def stage(
+        self,
+        case_id: UUID,
+        batch_key: str,
+        row_count: int,
+        buckets: np.ndarray,
+        bucket_clusters: np.ndarray,
+        clusters: Sequence[NearDuplicateCluster],
+    ) -> None:
+        """
+        Keep `buckets[i]` leading to `clusters[bucket_clusters[i]]` aside until
+        the batch of `batch_key` that brings its checkpoint to `row_count` rows
+        is committed, replacing what an earlier batch of the key left staged.
+        Only under `locked`.
+        """
+        pass
+
+    @abstractmethod
+    def publish(self, case_id: UUID, batch_key: str, committed_rows: int) -> None:
+        """
+        Add the buckets staged for `batch_key` if its checkpoint has reached
+        their row count since, `committed_rows`, or else drop them. Only under
+        `locked`.
+        """
+        pass
+
+    @abstractmethod
+    def drop(self, case_id: UUID) -> None:
+        """Forget every bucket of a case."""
+        pass
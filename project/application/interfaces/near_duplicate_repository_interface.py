@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.near_duplicates import NearDuplicateBatch
+
+
+class INearDuplicateRepository(ABC):
+    """The near-duplicate clusters built at ingest time."""
+
+    # --- Synchronous Methods ---
+    @abstractmethod
+    def add_shares(
+        self, messages: MessageBatch, near_duplicates: NearDuplicateBatch
+    ) -> None:
+        """
+        Add the messages of a batch to the clusters of their case, within the
+        transaction of the batch.
+        """
+        pass
+
+    # --- Asynchronous Methods ---
+    @abstractmethod
+    async def list_clusters(
+        self, case_id: UUID, min_size: int, limit: int, offset: int
+    ) -> List[dict]:
+        """
+        The clusters of a case holding at least `min_size` messages, largest
+        first.
+
+        Rows hold `cluster_id`, `message_count`, `evidence_count`, the
+        `evidence_id` and `message_id` of a sample message and `total`, the
+        number of clusters before the limit.
+        """
+        pass
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, NamedTuple, Sequence
+from uuid import UUID
+
+import numpy as np
+
+
+class VectorMatch(NamedTuple):
+    """A message close to the query vector, by cosine similarity."""
+
+    evidence_id: UUID
+    id: UUID
+    score: float
+
+
+class IVectorIndex(ABC):
+    """Approximate nearest-neighbour search over message vectors, per evidence."""
+
+    @abstractmethod
+    def add(self, evidence_id: UUID, ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        """
+        Index the vectors of an evidence's messages, row `i` of `vectors`
+        belonging to `ids[i]`. Safe to call from concurrent jobs; a message
+        indexed twice is still found once.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self, evidence_ids: Sequence[UUID], query: np.ndarray, limit: int
+    ) -> List[VectorMatch]:
+        """Up to `limit` messages of the evidences closest to `query`, best first."""
+        pass
+
+    @abstractmethod
+    def drop(self, evidence_id: UUID) -> None:
+        """Forget every vector of an evidence."""
+        pass
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+from uuid import UUID
+
+from project.application.utils.watchlists import WatchlistHit
+
+
+class IWatchlistMatcher(ABC):
+    """Finds the terms of the watchlists applying to a case in message payloads."""
+
+    @abstractmethod
+    def match(self, case_id: UUID, texts: Sequence[str]) -> List[WatchlistHit]:
+        """
+        Every term of the case's watchlists found in `texts` as whole words,
+        once per text, term and watchlist.
+        """
+        pass
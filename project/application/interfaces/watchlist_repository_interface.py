@@ -0,0 +1,83 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.watchlists import WatchlistHit
+from project.domain.entities import WatchlistEntity
+
+
+class IWatchlistRepository(ABC):
+    # --- Synchronous Methods ---
+    @abstractmethod
+    def get_case_watchlist_revisions(self, case_id: UUID) -> List[Tuple[UUID, int]]:
+        """
+        The id and revision of every watchlist applying to a case: its own and
+        those of its owner that apply to all of their cases.
+        """
+        pass
+
+    @abstractmethod
+    def get_watchlist_terms(
+        self, watchlist_ids: Sequence[UUID]
+    ) -> Dict[UUID, List[str]]:
+        """The terms of the given watchlists, by id."""
+        pass
+
+    @abstractmethod
+    def add_hits(
+        self, messages: MessageBatch, watchlist_hits: List[WatchlistHit]
+    ) -> None:
+        """
+        Record the watchlist terms found in the payloads of a batch against
+        their messages, within the transaction of the batch.
+        """
+        pass
+
+    # --- Asynchronous Methods ---
+    @abstractmethod
+    async def create_watchlist(self, watchlist: WatchlistEntity) -> WatchlistEntity:
+        pass
+
+    @abstractmethod
+    async def get_watchlists_by_user(self, user_id: UUID) -> List[WatchlistEntity]:
+        """The user's watchlists, without their terms."""
+        pass
+
+    @abstractmethod
+    async def get_watchlist(self, watchlist_id: UUID, user_id: UUID) -> WatchlistEntity:
+        """A watchlist of the user, with its terms."""
+        pass
+
+    @abstractmethod
+    async def update_watchlist(self, watchlist: WatchlistEntity) -> WatchlistEntity:
+        """
+        Save the name and terms of a watchlist of its user. Changed terms bump
+        its revision, and the hits of the terms removed are deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_watchlist(self, watchlist_id: UUID, user_id: UUID) -> None:
+        """Delete a watchlist of the user and its hits."""
+        pass
+
+    @abstractmethod
+    async def list_hit_messages(
+        self,
+        evidence_ids: List[UUID],
+        watchlist_id: Optional[UUID],
+        term: Optional[str],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Page through the messages of the given evidences hitting a watchlist in
+        `(evidence_id, id)` order, starting right after the `(evidence_id, id)`
+        key `after`; only hits of `watchlist_id` or `term` if given.
+
+        Rows hold the message's `id`, `evidence_id`, `sender`, `receiver`,
+        `payload` and `created_at`, and the `watchlist_ids` and `terms` of its
+        hits, pairwise.
+        """
+        pass
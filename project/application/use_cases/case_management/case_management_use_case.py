@@ -1,7 +1,9 @@
 import uuid
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from fastapi.concurrency import run_in_threadpool
+
 from project.application.dto.case_management_dto import (
     CaseResponse,
     CollectionResponse,
@@ -12,13 +14,21 @@ from project.application.dto.case_management_dto import (
 )
 from project.application.exceptions.exceptions import handle_repo_exceptions
 from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.near_duplicate_index_interface import (
+    INearDuplicateIndex,
+)
 from project.domain.entities import CaseEntity, CollectionEntity
 from project.domain.enums import CaseStatus
 
 
 class CaseManagementUseCase:
-    def __init__(self, case_repo: ICaseRepository):
+    def __init__(
+        self,
+        case_repo: ICaseRepository,
+        near_duplicate_index: Optional[INearDuplicateIndex] = None,
+    ):
         self.case_repo = case_repo
+        self.near_duplicate_index = near_duplicate_index
 
     # ----------------------------
     # CASES
@@ -112,6 +122,8 @@ class CaseManagementUseCase:
     async def delete_case(self, case_id: UUID, user_id: UUID) -> None:
         """Delete a case by ID."""
         await self.case_repo.delete_case(case_id, user_id)
+        if self.near_duplicate_index:
+            await run_in_threadpool(self.near_duplicate_index.drop, case_id)
 
     # ----------------------------
     # CASE COLLECTIONS
@@ -0,0 +1,88 @@
+from typing import List
+from uuid import UUID
+
+from project.application.dto.communication_graph_dto import (
+    ComponentResponse,
+    ComponentsResponse,
+    EdgeResponse,
+    EgoNetworkResponse,
+    TalkerResponse,
+)
+from project.application.exceptions.exceptions import (
+    ResourceNotFoundException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.communication_graph_repository_interface import (
+    ICommunicationGraphRepository,
+)
+
+
+class CommunicationGraphUseCase:
+    """
+    Who talks to whom in a case. Every query reads the edges and components
+    aggregated at ingest time, never the messages themselves.
+    """
+
+    def __init__(
+        self, graph_repo: ICommunicationGraphRepository, case_repo: ICaseRepository
+    ):
+        self.graph_repo = graph_repo
+        self.case_repo = case_repo
+
+    @handle_repo_exceptions
+    async def top_talkers(
+        self, case_id: UUID, user_id: UUID, limit: int
+    ) -> List[TalkerResponse]:
+        await self.case_repo.check_case_access(case_id, user_id)
+
+        rows = await self.graph_repo.top_talkers(case_id, limit)
+        return [TalkerResponse(**row) for row in rows]
+
+    @handle_repo_exceptions
+    async def ego_network(
+        self, case_id: UUID, user_id: UUID, participant: str, limit: int
+    ) -> EgoNetworkResponse:
+        """A participant, its closest contacts and the edges among all of them."""
+        await self.case_repo.check_case_access(case_id, user_id)
+
+        contacts = await self.graph_repo.top_contacts(case_id, participant, limit)
+        if not contacts:
+            raise ResourceNotFoundException(
+                f"No messages from or to {participant} in this case"
+            )
+        edges = await self.graph_repo.list_edges_between(
+            case_id, [participant, *contacts]
+        )
+
+        return EgoNetworkResponse(
+            participant=participant,
+            contacts=contacts,
+            edges=[EdgeResponse(**edge) for edge in edges],
+        )
+
+    @handle_repo_exceptions
+    async def connected_components(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        limit: int,
+        min_size: int = 2,
+        max_participants: int = 100,
+    ) -> ComponentsResponse:
+        """
+        Groups of participants linked by messages in either direction, largest
+        first, each listing up to `max_participants` of its members by name.
+        Components are maintained at ingest time, nothing is computed here.
+        """
+        await self.case_repo.check_case_access(case_id, user_id)
+
+        total = await self.graph_repo.count_components(case_id, min_size)
+        components = await self.graph_repo.list_components(
+            case_id, min_size, limit, max_participants
+        )
+
+        return ComponentsResponse(
+            total=total,
+            components=[ComponentResponse(**component) for component in components],
+        )
@@ -0,0 +1,99 @@
+from itertools import groupby
+from typing import List, Optional
+
+import numpy as np
+
+from project.application.interfaces.message_embedding_repository_interface import (
+    IMessageEmbeddingRepository,
+    PendingMessage,
+)
+from project.application.interfaces.message_encoder_interface import IMessageEncoder
+from project.application.interfaces.vector_index_interface import IVectorIndex
+from project.core.config import settings
+
+
+class EmbedMessagesUseCase:
+    def __init__(
+        self,
+        embedding_repository: IMessageEmbeddingRepository,
+        encoder: IMessageEncoder,
+        vector_index: Optional[IVectorIndex] = None,
+    ):
+        self.embedding_repository = embedding_repository
+        self.encoder = encoder
+        self.vector_index = vector_index
+
+    def execute(
+        self, evidence_id: Optional[str] = None, batch_size: Optional[int] = None
+    ):
+        """
+        Celery task to embed the messages that are not embedded yet, of one
+        evidence or of every evidence, until none is left.
+
+        Each batch is claimed, encoded and written back in one transaction.
+        Concurrent jobs skip each other's claims, so embedding scales with the
+        number of jobs, and a job that dies leaves its batch to the others.
+        Vectors are indexed before they are written back: a batch that fails
+        in between is indexed again by its next job rather than not at all.
+        """
+        batch_size = batch_size or settings.embedding.batch_size
+        total = 0
+        while True:
+            messages = self.embedding_repository.claim_pending_messages(
+                batch_size, evidence_id
+            )
+            if not messages:
+                break
+
+            try:
+                vectors = self.encoder.encode([message.payload for message in messages])
+                self._index(messages, vectors)
+                self.embedding_repository.save_embeddings(messages, vectors)
+            except Exception:
+                self.embedding_repository.release_claimed_messages()
+                raise
+
+            total += len(messages)
+            print(f"✅ Embedded {len(messages)} messages")
+
+        return {
+            "message": f"Embedded {total} messages",
+            "embedded_messages": total,
+        }
+
+    def index_evidence(self, evidence_id: str, batch_size: Optional[int] = None):
+        """
+        Celery task to index the messages of an evidence that are already
+        embedded, such as those copied from an identical upload.
+        """
+        batch_size = batch_size or settings.embedding.batch_size
+        total = 0
+        after = None
+        while True:
+            page = self.embedding_repository.list_embeddings(
+                evidence_id, batch_size, after
+            )
+            if not page.ids:
+                break
+            self.vector_index.add(evidence_id, page.ids, page.vectors)
+            total += len(page.ids)
+            after = page.ids[-1]
+
+        print(f"✅ Indexed {total} messages of evidence {evidence_id}")
+        return {
+            "message": f"Indexed {total} messages",
+            "indexed_messages": total,
+        }
+
+    def _index(self, messages: List[PendingMessage], vectors: np.ndarray) -> None:
+        if not self.vector_index:
+            return
+        # Claimed in evidence order, so each evidence is one run of rows
+        start = 0
+        for evidence_id, group in groupby(
+            messages, lambda message: message.evidence_id
+        ):
+            ids = [message.id for message in group]
+            end = start + len(ids)
+            self.vector_index.add(evidence_id, ids, vectors[start:end])
+            start = end
@@ -0,0 +1,30 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from project.application.exceptions.exceptions import handle_repo_exceptions
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.event_publisher_interface import (
+    IEventSubscriber,
+    case_evidences_channel,
+)
+from project.core.config import settings
+
+
+class EvidenceEventsUseCase:
+    def __init__(self, case_repo: ICaseRepository, event_subscriber: IEventSubscriber):
+        self.case_repo = case_repo
+        self.event_subscriber = event_subscriber
+
+    @handle_repo_exceptions
+    async def authorize(self, case_id: UUID, user_id: UUID) -> None:
+        await self.case_repo.check_case_access(case_id, user_id)
+
+    async def stream(self, case_id: UUID) -> AsyncIterator[Optional[dict]]:
+        """
+        Yield the ingestion events of every evidence of a case as workers
+        publish them, and None after each quiet heartbeat interval.
+        """
+        async for event in self.event_subscriber.subscribe(
+            case_evidences_channel(case_id), settings.events.heartbeat_interval
+        ):
+            yield event
@@ -0,0 +1,114 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from project.application.dto.evidence_management_dto import (
+    EvidenceProgressResponse,
+    QuarantinedRowResponse,
+)
+from project.application.exceptions.exceptions import handle_repo_exceptions
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
+from project.application.interfaces.vector_index_interface import IVectorIndex
+from project.domain.enums import EvidenceStatus
+
+
+class EvidenceManagementUseCase:
+    def __init__(
+        self,
+        evidence_repo: IEvidenceRepository,
+        vector_index: Optional[IVectorIndex] = None,
+        job_dispatcher: Optional[IJobDispatcher] = None,
+    ):
+        self.evidence_repo = evidence_repo
+        self.vector_index = vector_index
+        self.job_dispatcher = job_dispatcher
+
+    # ----------------------------
+    # EVIDENCE CRUD
+    # ----------------------------
+    @handle_repo_exceptions
+    async def delete_evidence(self, evidence_id: UUID, user_id: UUID) -> None:
+        """Delete an evidence and everything parsed from it."""
+        evidence = await self.evidence_repo.get_by_id(evidence_id)
+        await self.evidence_repo.delete(evidence_id, user_id)
+        if self.vector_index:
+            await run_in_threadpool(self.vector_index.drop, evidence_id)
+        # Its edges may have been all that held components of its case together
+        if self.job_dispatcher:
+            self.job_dispatcher.dispatch(
+                "rebuild_communication_components", {"case_id": str(evidence.case_id)}
+            )
+
+    # ----------------------------
+    # INGESTION PROGRESS
+    # ----------------------------
+    @handle_repo_exceptions
+    async def get_progress(
+        self, evidence_id: UUID, user_id: UUID
+    ) -> EvidenceProgressResponse:
+        """Report how far the parse of an evidence has got, with throughput and ETA."""
+        progress = await self.evidence_repo.get_progress(evidence_id, user_id)
+
+        finished = progress.status == EvidenceStatus.PARSED
+        total_bytes = progress.total_bytes
+        bytes_processed = total_bytes if finished else progress.bytes_processed
+        percent = 100.0 if finished or not total_bytes else 0.0
+        if total_bytes and not finished:
+            percent = round(min(bytes_processed / total_bytes, 1.0) * 100, 2)
+
+        rows_per_second = bytes_per_second = eta_seconds = None
+        if progress.started_at and progress.updated_at:
+            elapsed = (progress.updated_at - progress.started_at).total_seconds()
+            if elapsed > 0:
+                rows_per_second = round(progress.rows_processed / elapsed, 1)
+                bytes_per_second = round(progress.bytes_processed / elapsed, 1)
+
+        if finished:
+            eta_seconds = 0.0
+        elif bytes_per_second and progress.status == EvidenceStatus.PROCESSING:
+            eta_seconds = round((total_bytes - bytes_processed) / bytes_per_second, 1)
+
+        return EvidenceProgressResponse(
+            evidence_id=progress.evidence_id,
+            case_id=progress.case_id,
+            status=progress.status,
+            rows_processed=progress.rows_processed,
+            rows_rejected=progress.rows_rejected,
+            bytes_processed=bytes_processed,
+            total_bytes=total_bytes,
+            percent=percent,
+            chunks_total=progress.chunks_total,
+            chunks_completed=progress.chunks_completed,
+            rows_per_second=rows_per_second,
+            bytes_per_second=bytes_per_second,
+            eta_seconds=eta_seconds,
+            started_at=progress.started_at,
+            updated_at=progress.updated_at,
+        )
+
+    # ----------------------------
+    # QUARANTINE
+    # ----------------------------
+    @handle_repo_exceptions
+    async def list_quarantined_rows(
+        self, evidence_id: UUID, user_id: UUID, limit: int, offset: int
+    ) -> List[QuarantinedRowResponse]:
+        """List the records of an evidence that were rejected during the parse."""
+        rows = await self.evidence_repo.list_quarantined_rows(
+            evidence_id, user_id, limit, offset
+        )
+        return [
+            QuarantinedRowResponse(
+                id=row.id,
+                line_number=row.line_number,
+                byte_offset=row.byte_offset,
+                reason=row.reason,
+                raw=row.raw,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
@@ -0,0 +1,105 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from project.application.dto.indicator_dto import (
+    IndicatorCaseResponse,
+    IndicatorMessagePageResponse,
+    IndicatorMessageResponse,
+)
+from project.application.exceptions.exceptions import (
+    InvalidInputException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.indicator_repository_interface import (
+    IIndicatorRepository,
+)
+from project.application.utils.indicators import parse_indicator
+from project.application.utils.message_cursor import (
+    decode_message_cursor,
+    encode_message_cursor,
+)
+from project.domain.enums import IndicatorKind
+
+
+class IndicatorUseCase:
+    """
+    Where indicators of compromise are mentioned. Lookups read the mentions
+    recorded at ingest time, never the message payloads.
+    """
+
+    def __init__(
+        self,
+        indicator_repo: IIndicatorRepository,
+        evidence_repo: IEvidenceRepository,
+        case_repo: ICaseRepository,
+    ):
+        self.indicator_repo = indicator_repo
+        self.evidence_repo = evidence_repo
+        self.case_repo = case_repo
+
+    @handle_repo_exceptions
+    async def lookup(
+        self, user_id: UUID, value: str, kind: Optional[IndicatorKind] = None
+    ) -> List[IndicatorCaseResponse]:
+        """The cases the user can access mentioning an indicator."""
+        value, kind = self._normalize(value, kind)
+
+        rows = await self.indicator_repo.list_indicator_cases(value, kind, user_id)
+        return [IndicatorCaseResponse(**row) for row in rows]
+
+    @handle_repo_exceptions
+    async def list_case_messages(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        value: str,
+        kind: Optional[IndicatorKind],
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> IndicatorMessagePageResponse:
+        """Page through the messages of a case mentioning an indicator."""
+        value, kind = self._normalize(value, kind)
+        after = None
+        if cursor:
+            try:
+                after = decode_message_cursor(cursor)
+            except ValueError as e:
+                raise InvalidInputException(str(e))
+
+        await self.case_repo.check_case_access(case_id, user_id)
+        evidences = await self.evidence_repo.list_by_case_id(case_id)
+
+        # One row more than asked tells whether there is a next page
+        rows = await self.indicator_repo.list_indicator_messages(
+            [evidence.id for evidence in evidences], value, kind, limit + 1, after
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_message_cursor(rows[-1]["evidence_id"], rows[-1]["id"])
+
+        return IndicatorMessagePageResponse(
+            items=[IndicatorMessageResponse(**row) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _normalize(
+        value: str, kind: Optional[IndicatorKind]
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Normalize the value the way ingestion does, so `HXXP://Evil[.]com` finds
+        `http://evil.com`. Values that aren't recognized are looked up as given.
+        """
+        value = value.strip()
+        if not value:
+            raise InvalidInputException("Indicator value must not be empty")
+
+        parsed = parse_indicator(value)
+        if parsed and (kind is None or parsed[0] == kind):
+            kind, value = parsed
+        return value, kind.value if kind else None
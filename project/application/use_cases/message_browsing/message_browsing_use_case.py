@@ -0,0 +1,234 @@
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from project.application.dto.message_browsing_dto import (
+    MessagePageResponse,
+    MessageResponse,
+    MessageSearchHit,
+    MessageSearchResponse,
+)
+from project.application.exceptions.exceptions import (
+    InvalidInputException,
+    UnauthorizedAccessException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.message_repository_interface import (
+    MESSAGE_FIELDS,
+    IMessageRepository,
+)
+from project.application.utils.message_cursor import (
+    decode_message_cursor,
+    decode_search_cursor,
+    encode_message_cursor,
+    encode_search_cursor,
+)
+from project.application.utils.message_export import (
+    ExportFormat,
+    get_export_format,
+    gzip_chunks,
+)
+from project.domain.entities import EvidenceEntity
+
+# Rows fetched per round trip of an export's server-side cursor
+EXPORT_BATCH_ROWS = 5000
+
+
+class MessageBrowsingUseCase:
+    def __init__(
+        self,
+        message_repo: IMessageRepository,
+        evidence_repo: IEvidenceRepository,
+        case_repo: ICaseRepository,
+    ):
+        self.message_repo = message_repo
+        self.evidence_repo = evidence_repo
+        self.case_repo = case_repo
+
+    @handle_repo_exceptions
+    async def list_evidence_messages(
+        self,
+        evidence_id: UUID,
+        user_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        sender: Optional[str] = None,
+        receiver: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> MessagePageResponse:
+        """Page through the messages of one evidence."""
+        evidence = await self.evidence_repo.get_by_id(evidence_id)
+        if not evidence:
+            raise UnauthorizedAccessException("Evidence not found or access denied")
+        await self.case_repo.check_case_access(evidence.case_id, user_id)
+
+        return await self._get_page([evidence], limit, cursor, sender, receiver, fields)
+
+    @handle_repo_exceptions
+    async def list_case_messages(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        sender: Optional[str] = None,
+        receiver: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> MessagePageResponse:
+        """Page through the messages of a case, one evidence after the other."""
+        await self.case_repo.check_case_access(case_id, user_id)
+        evidences = await self.evidence_repo.list_by_case_id(case_id)
+
+        return await self._get_page(evidences, limit, cursor, sender, receiver, fields)
+
+    @handle_repo_exceptions
+    async def search_case_messages(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> MessageSearchResponse:
+        """Full-text search of the message payloads of a case, best match first."""
+        if not query.strip():
+            raise InvalidInputException("Search query must not be empty")
+        after = self._parse_cursor(cursor, decode_search_cursor)
+
+        await self.case_repo.check_case_access(case_id, user_id)
+        evidences = await self.evidence_repo.list_by_case_id(case_id)
+
+        rows = await self.message_repo.search_messages(
+            [evidence.id for evidence in evidences], query, limit + 1, after=after
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_search_cursor(
+                last["rank"], last["evidence_id"], last["id"]
+            )
+
+        return MessageSearchResponse(
+            items=[MessageSearchHit(**row) for row in rows], next_cursor=next_cursor
+        )
+
+    @handle_repo_exceptions
+    async def export_case_messages(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        format: str,
+        gzip: bool = False,
+        fields: Optional[str] = None,
+    ) -> Tuple[ExportFormat, AsyncIterator[bytes]]:
+        """
+        Validate the export and check access up front, then hand back the
+        format and the lazily encoded bytes of every message of the case.
+        """
+        projection = self._parse_fields(fields)
+        try:
+            export_format = get_export_format(format, gzip)
+        except ValueError as e:
+            raise InvalidInputException(str(e))
+
+        await self.case_repo.check_case_access(case_id, user_id)
+        evidences = await self.evidence_repo.list_by_case_id(case_id)
+        attribute_names = {evidence.id: evidence.attributes for evidence in evidences}
+
+        attributes_index = (
+            projection.index("attributes") if "attributes" in projection else None
+        )
+
+        async def batches():
+            async for evidence_id, rows in self.message_repo.stream_messages(
+                [evidence.id for evidence in evidences], projection, EXPORT_BATCH_ROWS
+            ):
+                if attributes_index is not None:
+                    # Stored positionally, named after the evidence's extra columns
+                    names = attribute_names.get(evidence_id) or []
+                    rows = [list(row) for row in rows]
+                    for row in rows:
+                        if row[attributes_index] is not None:
+                            row[attributes_index] = dict(
+                                zip(names, row[attributes_index])
+                            )
+                yield rows
+
+        chunks = export_format.encode(batches(), projection)
+        if gzip:
+            chunks = gzip_chunks(chunks)
+        return export_format, chunks
+
+    async def _get_page(
+        self,
+        evidences: List[EvidenceEntity],
+        limit: int,
+        cursor: Optional[str],
+        sender: Optional[str],
+        receiver: Optional[str],
+        fields: Optional[str],
+    ) -> MessagePageResponse:
+        projection = self._parse_fields(fields)
+        after = self._parse_cursor(cursor)
+
+        # One row more than asked tells whether there is a next page
+        rows = await self.message_repo.list_messages(
+            [evidence.id for evidence in evidences],
+            limit + 1,
+            after=after,
+            sender=sender,
+            receiver=receiver,
+            fields=projection,
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_message_cursor(rows[-1]["evidence_id"], rows[-1]["id"])
+
+        attribute_names = {evidence.id: evidence.attributes for evidence in evidences}
+        return MessagePageResponse(
+            items=[self._to_response(row, projection, attribute_names) for row in rows],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+        if not fields:
+            return MESSAGE_FIELDS
+
+        projection = tuple(
+            dict.fromkeys(field.strip() for field in fields.split(",") if field.strip())
+        )
+        unknown = [field for field in projection if field not in MESSAGE_FIELDS]
+        if unknown or not projection:
+            raise InvalidInputException(
+                f"Unknown message field(s): {', '.join(unknown) or fields}. "
+                f"Choose from {', '.join(MESSAGE_FIELDS)}"
+            )
+        return projection
+
+    @staticmethod
+    def _parse_cursor(cursor: Optional[str], decode=decode_message_cursor):
+        if not cursor:
+            return None
+        try:
+            return decode(cursor)
+        except ValueError as e:
+            raise InvalidInputException(str(e))
+
+    @staticmethod
+    def _to_response(
+        row: dict,
+        projection: Tuple[str, ...],
+        attribute_names: Dict[UUID, List[str]],
+    ) -> MessageResponse:
+        values = {field: row[field] for field in projection}
+        if "attributes" in values and values["attributes"] is not None:
+            # Stored positionally, named after the evidence's extra columns
+            names = attribute_names.get(row["evidence_id"]) or []
+            values["attributes"] = dict(zip(names, values["attributes"]))
+        return MessageResponse(**values)
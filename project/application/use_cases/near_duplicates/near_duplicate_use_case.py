@@ -0,0 +1,66 @@
+from uuid import UUID
+
+from project.application.dto.near_duplicate_dto import (
+    NearDuplicateClusterResponse,
+    NearDuplicateClustersResponse,
+    NearDuplicateSampleResponse,
+)
+from project.application.exceptions.exceptions import handle_repo_exceptions
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.interfaces.near_duplicate_repository_interface import (
+    INearDuplicateRepository,
+)
+
+SAMPLE_MESSAGE_FIELDS = ("sender", "receiver", "payload", "created_at")
+
+
+class NearDuplicateUseCase:
+    """
+    Groups of messages of a case with nearly the same text: templated
+    messages, forwards, copies. Clusters are counted at ingest time, a listing
+    only reads their counts and one sample message each.
+    """
+
+    def __init__(
+        self,
+        near_duplicate_repo: INearDuplicateRepository,
+        message_repo: IMessageRepository,
+        case_repo: ICaseRepository,
+    ):
+        self.near_duplicate_repo = near_duplicate_repo
+        self.message_repo = message_repo
+        self.case_repo = case_repo
+
+    @handle_repo_exceptions
+    async def list_clusters(
+        self, case_id: UUID, user_id: UUID, min_size: int, limit: int, offset: int
+    ) -> NearDuplicateClustersResponse:
+        """The clusters of a case with at least `min_size` messages, largest first."""
+        await self.case_repo.check_case_access(case_id, user_id)
+
+        rows = await self.near_duplicate_repo.list_clusters(
+            case_id, min_size, limit, offset
+        )
+        samples = await self.message_repo.get_messages(
+            [(row["evidence_id"], row["message_id"]) for row in rows],
+            SAMPLE_MESSAGE_FIELDS,
+        )
+        samples_by_key = {(row["evidence_id"], row["id"]): row for row in samples}
+
+        clusters = []
+        for row in rows:
+            sample = samples_by_key.get((row["evidence_id"], row["message_id"]))
+            clusters.append(
+                NearDuplicateClusterResponse(
+                    cluster_id=row["cluster_id"],
+                    message_count=row["message_count"],
+                    evidence_count=row["evidence_count"],
+                    sample=NearDuplicateSampleResponse(**sample) if sample else None,
+                )
+            )
+        return NearDuplicateClustersResponse(
+            total=rows[0]["total"] if rows else 0, clusters=clusters
+        )
@@ -1,83 +1,629 @@
-import csv
 import os
-import uuid
+from contextlib import nullcontext
+from typing import ContextManager, List, Optional, Tuple
+from uuid import UUID
 
+import numpy as np
+
+from project.application.interfaces.communication_graph_repository_interface import (
+    ICommunicationGraphRepository,
+)
+from project.application.interfaces.event_publisher_interface import (
+    IEventPublisher,
+    case_evidences_channel,
+)
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParser,
+    IEvidenceParserRegistry,
+    RejectedRecord,
+)
 from project.application.interfaces.evidence_repository_interface import (
     IEvidenceRepository,
 )
-from project.domain.entities import EvidenceEntity, MessageEntity
-from project.domain.enums import EvidenceStatus
+from project.application.interfaces.indicator_repository_interface import (
+    IIndicatorRepository,
+)
+from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
+from project.application.interfaces.near_duplicate_index_interface import (
+    INearDuplicateIndex,
+)
+from project.application.interfaces.near_duplicate_repository_interface import (
+    INearDuplicateRepository,
+)
+from project.application.interfaces.watchlist_matcher_interface import IWatchlistMatcher
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.application.utils.evidence_format import detect_evidence_format
+from project.application.utils.evidence_schema import (
+    MESSAGE_FIELDS,
+    resolve_evidence_schema,
+)
+from project.application.utils.indicators import extract_indicators
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.near_duplicates import (
+    NearDuplicateBatch,
+    assign_clusters,
+    lsh_buckets,
+    resolve_clusters,
+)
+from project.application.utils.uuid7 import uuid7
+from project.application.utils.watchlists import WatchlistHit
+from project.core.config import settings
+from project.domain.entities import (
+    CommunicationEdgeEntity,
+    EvidenceEntity,
+    IngestionCheckpointEntity,
+    QuarantinedRowEntity,
+)
+from project.domain.enums import EvidenceFormat, EvidenceStatus, MessageStatus
 
 
 class ParseEvidencesUseCase:
     def __init__(
         self,
         evidence_repository: IEvidenceRepository,
+        parser_registry: IEvidenceParserRegistry,
+        job_dispatcher: Optional[IJobDispatcher] = None,
+        event_publisher: Optional[IEventPublisher] = None,
+        near_duplicate_index: Optional[INearDuplicateIndex] = None,
+        watchlist_matcher: Optional[IWatchlistMatcher] = None,
+        communication_graph_repository: Optional[ICommunicationGraphRepository] = None,
+        indicator_repository: Optional[IIndicatorRepository] = None,
+        near_duplicate_repository: Optional[INearDuplicateRepository] = None,
+        watchlist_repository: Optional[IWatchlistRepository] = None,
     ):
         self.evidence_repository = evidence_repository
+        self.parser_registry = parser_registry
+        self.job_dispatcher = job_dispatcher
+        self.event_publisher = event_publisher
+        self.near_duplicate_index = near_duplicate_index
+        self.watchlist_matcher = watchlist_matcher
+        # Sharing the session of `evidence_repository`, what they derive from a
+        # batch is committed with it. A feature without its repository is skipped.
+        self.communication_graph_repository = communication_graph_repository
+        self.indicator_repository = indicator_repository
+        self.near_duplicate_repository = near_duplicate_repository
+        self.watchlist_repository = watchlist_repository
 
-    def execute(self, case_id: str, file_path: str):
+    def execute(
+        self,
+        case_id: str,
+        file_path: str,
+        evidence_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ):
         """
         Celery task to parse uploaded evidence files.
+
+        The parser is picked from the format of the upload. Files of splittable
+        formats larger than the configured chunk size are split on record
+        boundaries and fanned out as one `parse_evidence_chunk` job per chunk;
+        `finalize` then marks the evidence once every chunk has committed.
+
+        Records that can't be read are quarantined with their line number and
+        the reason, and the rest of the file keeps loading.
+
+        Re-running with the same `evidence_id` resumes from the committed
+        checkpoints of that evidence instead of starting over.
         """
 
         if not os.path.exists(file_path):
             return {"error": f"File not found: {file_path}"}
 
-        buffer = []
-        batch_size = 50000
-        total = 0
-
-        # Create Evidence record with status "Processing"
-        evidence_entity = EvidenceEntity(
-            id=uuid.uuid4(),
-            case_id=case_id,
-            source=file_path,
-            status=EvidenceStatus.PROCESSING,
-            format="csv",
-            metadata={"original_filename": os.path.basename(file_path)},
-            attributes=["sender", "receiver", "payload"],
-        )
-        self.evidence_repository.create(evidence_entity)
-        print(f"Started parsing file: {file_path}")
-
         try:
-            with open(file_path, mode="r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    message = MessageEntity(
-                        id=uuid.uuid4(),
-                        evidence_id=evidence_entity.id,
-                        status=EvidenceStatus.PROCESSING,
-                        sender=row["sender"],
-                        receiver=row["receiver"],
-                        payload=row["payload"],
-                    )
-                    buffer.append(message)
-
-                    if len(buffer) >= batch_size:
-                        self.evidence_repository.create_messages(buffer)
+            evidence_entity = self._start_evidence(
+                case_id, file_path, evidence_id, metadata
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+        if evidence_entity.status == EvidenceStatus.PARSED:
+            return {
+                "message": f"Evidence {evidence_entity.id} is already parsed",
+                "total_rows": evidence_entity.metadata.get("total_rows", 0),
+            }
 
-                        total += len(buffer)
-                        print(f"✅ Inserted {len(buffer)} messages")
+        try:
+            parser = self._get_parser(evidence_entity)
 
-                        buffer.clear()
+            chunk_size = settings.evidence.parallel_chunk_size
+            if not (
+                self.job_dispatcher
+                and parser.splittable
+                and os.path.getsize(file_path) > chunk_size
+            ):
+                chunk_size = 0
+            chunks = parser.plan_chunks(file_path, chunk_size)
+            if len(chunks) > 1:
+                return self._dispatch_chunks(evidence_entity, file_path, chunks)
 
-                # Final batch buffer:
-                self.evidence_repository.create_messages(buffer)
-                total += len(buffer)
-                print(f"✅ Inserted {len(buffer)} messages")
+            start, end = chunks[0]
+            checkpoint = self._load_range(
+                evidence_entity, parser, file_path, start, end
+            )
+            total = checkpoint.row_count
+            rejected = checkpoint.rejected_count
 
             # Update Evidence status to "Parsed"
             evidence_entity.status = EvidenceStatus.PARSED
+            evidence_entity.metadata["total_rows"] = total
+            evidence_entity.metadata["rejected_rows"] = rejected
             self.evidence_repository.update(evidence_entity)
+            self._publish(
+                evidence_entity, "completed", total_rows=total, rejected_rows=rejected
+            )
+            self._dispatch_embedding(evidence_entity)
 
             return {
                 "message": f"Parsed {total} rows successfully from {os.path.basename(file_path)}",
                 "total_rows": total,
+                "rejected_rows": rejected,
             }
 
         except Exception as e:
             evidence_entity.status = EvidenceStatus.FAILED
             self.evidence_repository.update(evidence_entity)
+            self._publish(evidence_entity, "failed", error=str(e))
             return {"error": str(e)}
+
+    def clone(
+        self,
+        case_id: str,
+        file_path: str,
+        source_evidence_id: str,
+        evidence_id: Optional[str] = None,
+        metadata: Optional[dict] = None,
+    ):
+        """
+        Register an upload whose content was already parsed for another evidence
+        by copying that evidence's messages instead of parsing the file again.
+        """
+        source_entity = self.evidence_repository.get(source_evidence_id)
+        if not source_entity or source_entity.status != EvidenceStatus.PARSED:
+            return self.execute(case_id, file_path, evidence_id, metadata)
+
+        evidence_entity = self._start_evidence(
+            case_id, file_path, evidence_id, metadata
+        )
+        if evidence_entity.status == EvidenceStatus.PARSED:
+            return {
+                "message": f"Evidence {evidence_entity.id} is already parsed",
+                "total_rows": evidence_entity.metadata.get("total_rows", 0),
+            }
+
+        try:
+            total = source_entity.metadata.get("total_rows", 0)
+            evidence_entity.status = EvidenceStatus.PARSED
+            evidence_entity.metadata["total_rows"] = total
+            evidence_entity.metadata["cloned_from"] = str(source_entity.id)
+            # Committed together with the copy, so a retry never clones twice
+            with self.evidence_repository.transaction():
+                self.evidence_repository.clone_messages(
+                    source_entity.id, evidence_entity
+                )
+                if self.communication_graph_repository:
+                    self.communication_graph_repository.clone_edges(
+                        source_entity.id, evidence_entity
+                    )
+            self._publish(evidence_entity, "completed", total_rows=total)
+            # Messages copied before their source was embedded are still pending,
+            # the others only have to be indexed
+            self._dispatch_embedding(evidence_entity, index_embedded=True)
+
+            return {
+                "message": f"Reused {total} rows of evidence {source_entity.id}",
+                "total_rows": total,
+            }
+
+        except Exception as e:
+            evidence_entity.status = EvidenceStatus.FAILED
+            self.evidence_repository.update(evidence_entity)
+            self._publish(evidence_entity, "failed", error=str(e))
+            return {"error": str(e)}
+
+    def execute_chunk(self, evidence_id: str, file_path: str, start: int, end: int):
+        """
+        Parse and load the records in the byte range [start, end) of a file.
+        Errors are returned rather than raised so that `finalize` always runs.
+        """
+        try:
+            evidence_entity = self.evidence_repository.get(evidence_id)
+            if not evidence_entity:
+                return {"error": f"Evidence not found: {evidence_id}"}
+
+            parser = self._get_parser(evidence_entity)
+            checkpoint = self._load_range(
+                evidence_entity, parser, file_path, start, end
+            )
+            return {
+                "total_rows": checkpoint.row_count,
+                "rejected_rows": checkpoint.rejected_count,
+            }
+        except Exception as e:
+            return {"error": str(e)}
+
+    def finalize(self, evidence_id: str, chunk_results: List[dict]):
+        """Mark a chunked evidence as parsed once all of its chunks have committed."""
+        evidence_entity = self.evidence_repository.get(evidence_id)
+        if not evidence_entity:
+            return {"error": f"Evidence not found: {evidence_id}"}
+
+        errors = [result["error"] for result in chunk_results if "error" in result]
+        total = sum(result.get("total_rows", 0) for result in chunk_results)
+        rejected = sum(result.get("rejected_rows", 0) for result in chunk_results)
+
+        evidence_entity.status = (
+            EvidenceStatus.FAILED if errors else EvidenceStatus.PARSED
+        )
+        evidence_entity.metadata["total_rows"] = total
+        evidence_entity.metadata["rejected_rows"] = rejected
+        self.evidence_repository.update(evidence_entity)
+
+        if errors:
+            self._publish(
+                evidence_entity, "failed", error="; ".join(errors), total_rows=total
+            )
+            return {"error": "; ".join(errors), "total_rows": total}
+
+        self._publish(
+            evidence_entity, "completed", total_rows=total, rejected_rows=rejected
+        )
+        self._dispatch_embedding(evidence_entity)
+
+        return {
+            "message": f"Parsed {total} rows from {len(chunk_results)} chunks",
+            "total_rows": total,
+            "rejected_rows": rejected,
+        }
+
+    def _start_evidence(
+        self,
+        case_id: str,
+        file_path: str,
+        evidence_id: Optional[str],
+        metadata: Optional[dict],
+    ) -> EvidenceEntity:
+        evidence_entity = (
+            self.evidence_repository.get(evidence_id) if evidence_id else None
+        )
+        if evidence_entity:
+            if evidence_entity.status != EvidenceStatus.PARSED:
+                evidence_entity.status = EvidenceStatus.PROCESSING
+                self.evidence_repository.update(evidence_entity)
+            print(f"Resuming evidence {evidence_entity.id} from file: {file_path}")
+            return evidence_entity
+
+        metadata = {
+            "original_filename": os.path.basename(file_path),
+            "size": os.path.getsize(file_path),
+            **(metadata or {}),
+        }
+        evidence_format = detect_evidence_format(
+            file_path, metadata["original_filename"], metadata.get("content_type")
+        )
+        # Checked on a sample first, a file that doesn't fit never gets a record
+        column_mapping, extra_columns = resolve_evidence_schema(
+            self.parser_registry.get(evidence_format),
+            file_path,
+            metadata.get("column_mapping"),
+        )
+        metadata["column_mapping"] = column_mapping
+
+        # Create Evidence record with status "Processing"
+        evidence_entity = EvidenceEntity(
+            id=evidence_id or uuid7(),
+            case_id=case_id,
+            source=file_path,
+            status=EvidenceStatus.PROCESSING,
+            format=evidence_format.value,
+            metadata=metadata,
+            attributes=extra_columns,
+            content_hash=metadata.get("sha256"),
+        )
+        self.evidence_repository.create(evidence_entity)
+        self._publish(
+            evidence_entity,
+            "started",
+            filename=evidence_entity.metadata["original_filename"],
+            size=evidence_entity.metadata["size"],
+        )
+        print(f"Started parsing file: {file_path}")
+        return evidence_entity
+
+    def _dispatch_chunks(
+        self, evidence_entity: EvidenceEntity, file_path: str, chunks: List[tuple]
+    ):
+        payloads = [
+            {
+                "evidence_id": str(evidence_entity.id),
+                "file_path": file_path,
+                "start": start,
+                "end": end,
+            }
+            for start, end in chunks
+        ]
+        # Saved before dispatching: the finalize job may update the evidence
+        # as soon as the chunks are out
+        evidence_entity.metadata["chunks"] = len(chunks)
+        self.evidence_repository.update(evidence_entity)
+
+        job_id = self.job_dispatcher.dispatch_chord(
+            job_name="parse_evidence_chunk",
+            payloads=payloads,
+            callback_job_name="finalize_evidence_parse",
+            callback_payload={"evidence_id": str(evidence_entity.id)},
+        )
+        print(f"Dispatched {len(chunks)} chunks for file: {file_path}")
+
+        return {
+            "message": f"Dispatched {len(chunks)} chunks for {file_path}",
+            "chunks": len(chunks),
+            "job_id": job_id,
+        }
+
+    def _dispatch_embedding(
+        self, evidence_entity: EvidenceEntity, index_embedded: bool = False
+    ) -> None:
+        """
+        Queue the embedding of the evidence's messages, as several jobs that
+        claim their batches in turn, so more workers embed it faster. With
+        `index_embedded`, the messages already embedded are indexed too.
+        """
+        if not self.job_dispatcher:
+            return
+        payload = {"evidence_id": str(evidence_entity.id)}
+        if index_embedded:
+            self.job_dispatcher.dispatch("index_message_embeddings", payload)
+        for _ in range(settings.embedding.parallel_jobs):
+            self.job_dispatcher.dispatch("embed_messages", payload)
+        print(f"Dispatched embedding of evidence {evidence_entity.id}")
+
+    def _get_parser(self, evidence_entity: EvidenceEntity) -> IEvidenceParser:
+        return self.parser_registry.get(EvidenceFormat(evidence_entity.format))
+
+    def _load_range(
+        self,
+        evidence_entity: EvidenceEntity,
+        parser: IEvidenceParser,
+        file_path: str,
+        start: int,
+        end: Optional[int],
+    ) -> IngestionCheckpointEntity:
+        evidence_id = evidence_entity.id
+        checkpoint = self.evidence_repository.get_checkpoint(evidence_id, start)
+        if not checkpoint:
+            checkpoint = IngestionCheckpointEntity(
+                evidence_id=evidence_id,
+                chunk_start=start,
+                chunk_end=end,
+                byte_offset=start,
+            )
+        if checkpoint.row_count and self.near_duplicate_index:
+            # The last batch's buckets, if its job died before publishing them
+            with self.near_duplicate_index.locked(evidence_entity.case_id):
+                self.near_duplicate_index.publish(
+                    evidence_entity.case_id,
+                    self._batch_key(checkpoint),
+                    checkpoint.row_count,
+                )
+        if checkpoint.completed:
+            return checkpoint
+        if checkpoint.row_count or checkpoint.rejected_count:
+            print(
+                f"Resuming at position {checkpoint.byte_offset} after "
+                f"{checkpoint.row_count} rows and {checkpoint.rejected_count} rejects"
+            )
+
+        # Evidences created before column mapping hold the message fields only
+        column_mapping = evidence_entity.metadata.get("column_mapping")
+        extra_columns = evidence_entity.attributes if column_mapping else []
+        if not column_mapping:
+            column_mapping = {field: field for field in MESSAGE_FIELDS}
+        sender_column = column_mapping["sender"]
+        receiver_column = column_mapping["receiver"]
+        payload_column = column_mapping["payload"]
+        required_columns = (sender_column, receiver_column, payload_column)
+
+        batch = MessageBatch(evidence_id, MessageStatus.PROCESSING)
+        quarantine = []
+        batch_size = settings.evidence.batch_size
+        batch_bytes = settings.evidence.batch_bytes
+
+        records = parser.read_records(file_path, checkpoint, required_columns)
+        for record, offset in records:
+            if isinstance(record, RejectedRecord):
+                quarantine.append(
+                    QuarantinedRowEntity(
+                        evidence_id=evidence_id,
+                        reason=record.reason,
+                        line_number=record.line_number,
+                        byte_offset=record.byte_offset,
+                        raw=record.raw,
+                    )
+                )
+                if len(quarantine) >= batch_size:
+                    self._commit_batch(
+                        evidence_entity, batch, quarantine, checkpoint, offset
+                    )
+                continue
+
+            batch.append(
+                record.get(sender_column) or "",
+                record.get(receiver_column) or "",
+                record.get(payload_column) or "",
+                (
+                    [record.get(column) for column in extra_columns]
+                    if extra_columns
+                    else None
+                ),
+            )
+
+            # Bounded by memory first, long texts make for fewer rows per batch
+            if batch.nbytes >= batch_bytes or len(batch) >= batch_size:
+                self._commit_batch(
+                    evidence_entity, batch, quarantine, checkpoint, offset
+                )
+
+        # Final batch buffer:
+        checkpoint.completed = True
+        final_offset = end if end is not None else os.path.getsize(file_path)
+        self._commit_batch(evidence_entity, batch, quarantine, checkpoint, final_offset)
+
+        return checkpoint
+
+    def _commit_batch(
+        self,
+        evidence_entity: EvidenceEntity,
+        batch: MessageBatch,
+        quarantine: List[QuarantinedRowEntity],
+        checkpoint: IngestionCheckpointEntity,
+        byte_offset: Optional[int],
+    ) -> None:
+        """Load and then empty `batch` and `quarantine`, advancing `checkpoint`."""
+        if byte_offset is not None:
+            checkpoint.byte_offset = byte_offset
+        checkpoint.row_count += len(batch)
+        checkpoint.rejected_count += len(quarantine)
+
+        edges = self._edges(evidence_entity, batch)
+        # Extracted while the payloads are at hand, a later pass would read
+        # every message back from the database
+        indicators = (
+            extract_indicators(batch.payloads) if self.indicator_repository else []
+        )
+        watchlist_hits = self._match_watchlists(evidence_entity, batch)
+        # Hashed before taking the case's index, only the lookup and the commit
+        # wait for the other batches of the case
+        buckets = lsh_buckets(batch.payloads) if self._clusters(batch) else None
+        with self._near_duplicate_lock(evidence_entity, batch):
+            near_duplicates = self._near_duplicates(evidence_entity, buckets)
+            if near_duplicates:
+                # Ids of evidences created from job payloads are still strings
+                self.near_duplicate_index.stage(
+                    near_duplicates.case_id,
+                    self._batch_key(checkpoint),
+                    checkpoint.row_count,
+                    near_duplicates.bucket_keys,
+                    near_duplicates.bucket_clusters,
+                    resolve_clusters(
+                        near_duplicates,
+                        UUID(str(evidence_entity.id)),
+                        batch.assign_ids(),
+                    ),
+                )
+            with self.evidence_repository.transaction():
+                self.evidence_repository.create_messages(batch, checkpoint, quarantine)
+                if indicators:
+                    self.indicator_repository.add_mentions(batch, indicators)
+                if near_duplicates and near_duplicates.clusters:
+                    self.near_duplicate_repository.add_shares(batch, near_duplicates)
+                if watchlist_hits:
+                    self.watchlist_repository.add_hits(batch, watchlist_hits)
+                # Last, the case's lock it takes is then never held while
+                # waiting on rows locked by a parallel chunk waiting for it
+                if edges:
+                    self.communication_graph_repository.add_edges(edges)
+            # Only once committed, the index never leads to clusters rolled back
+            if near_duplicates:
+                self.near_duplicate_index.publish(
+                    near_duplicates.case_id,
+                    self._batch_key(checkpoint),
+                    checkpoint.row_count,
+                )
+        print(f"✅ Inserted {len(batch)} messages")
+        if quarantine:
+            print(f"⚠️ Quarantined {len(quarantine)} rows")
+        batch.clear()
+        quarantine.clear()
+
+        self._publish(
+            evidence_entity,
+            "progress",
+            chunk_start=checkpoint.chunk_start,
+            byte_offset=checkpoint.byte_offset,
+            rows_processed=checkpoint.row_count,
+            rows_rejected=checkpoint.rejected_count,
+            chunk_completed=checkpoint.completed,
+        )
+
+    def _edges(
+        self, evidence_entity: EvidenceEntity, batch: MessageBatch
+    ) -> List[CommunicationEdgeEntity]:
+        """The batch's share of the case's communication graph."""
+        if not self.communication_graph_repository:
+            return []
+        return [
+            CommunicationEdgeEntity(
+                case_id=evidence_entity.case_id,
+                evidence_id=evidence_entity.id,
+                sender=sender,
+                receiver=receiver,
+                message_count=count,
+            )
+            for (sender, receiver), count in batch.edge_counts().items()
+        ]
+
+    def _clusters(self, batch: MessageBatch) -> bool:
+        return (
+            bool(batch)
+            and self.near_duplicate_index is not None
+            and self.near_duplicate_repository is not None
+        )
+
+    def _near_duplicate_lock(
+        self, evidence_entity: EvidenceEntity, batch: MessageBatch
+    ) -> ContextManager[None]:
+        """
+        The case's near-duplicate index, held from the lookup of a batch's
+        buckets until they are added, so parallel chunks of the case don't
+        start a cluster each for the same near-duplicates.
+        """
+        if not self._clusters(batch):
+            return nullcontext()
+        return self.near_duplicate_index.locked(evidence_entity.case_id)
+
+    @staticmethod
+    def _batch_key(checkpoint: IngestionCheckpointEntity) -> str:
+        """Names the buckets a chunk's batch stages, one batch at a time."""
+        return f"{checkpoint.evidence_id}:{checkpoint.chunk_start}"
+
+    def _near_duplicates(
+        self,
+        evidence_entity: EvidenceEntity,
+        buckets: Optional[Tuple[np.ndarray, np.ndarray]],
+    ) -> Optional[NearDuplicateBatch]:
+        """
+        Cluster the batch's messages with their near-duplicates in the case,
+        matched through the LSH buckets of their MinHash signatures: only the
+        buckets of the batch are looked up, never the case's other messages.
+        """
+        if buckets is None:
+            return None
+        keys, has_buckets = buckets
+        known = self.near_duplicate_index.find(evidence_entity.case_id, keys)
+        return assign_clusters(evidence_entity.case_id, keys, has_buckets, known)
+
+    def _match_watchlists(
+        self, evidence_entity: EvidenceEntity, batch: MessageBatch
+    ) -> List[WatchlistHit]:
+        """
+        Match the batch against every watchlist of the case at once, one pass
+        over its payloads whatever the number of terms.
+        """
+        if not batch or not (self.watchlist_matcher and self.watchlist_repository):
+            return []
+        return self.watchlist_matcher.match(evidence_entity.case_id, batch.payloads)
+
+    def _publish(self, evidence_entity: EvidenceEntity, event_type: str, **data):
+        """Notify live subscribers of the evidence's case; never fails the parse."""
+        if not self.event_publisher:
+            return
+        self.event_publisher.publish(
+            case_evidences_channel(evidence_entity.case_id),
+            {
+                "type": event_type,
+                "evidence_id": str(evidence_entity.id),
+                "case_id": str(evidence_entity.case_id),
+                **data,
+            },
+        )
@@ -0,0 +1,79 @@
+from typing import List
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from project.application.dto.semantic_search_dto import SimilarMessageResponse
+from project.application.exceptions.exceptions import (
+    ResourceNotFoundException,
+    UnauthorizedAccessException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.interfaces.vector_index_interface import IVectorIndex
+
+SIMILAR_MESSAGE_FIELDS = ("sender", "receiver", "payload", "created_at")
+
+
+class SemanticSearchUseCase:
+    """
+    Messages of a case that mean much the same as a given one. Candidates
+    come from the vector index, only the best of them are read back.
+    """
+
+    def __init__(
+        self,
+        message_repo: IMessageRepository,
+        evidence_repo: IEvidenceRepository,
+        case_repo: ICaseRepository,
+        vector_index: IVectorIndex,
+    ):
+        self.message_repo = message_repo
+        self.evidence_repo = evidence_repo
+        self.case_repo = case_repo
+        self.vector_index = vector_index
+
+    @handle_repo_exceptions
+    async def find_similar_messages(
+        self, evidence_id: UUID, message_id: UUID, user_id: UUID, limit: int
+    ) -> List[SimilarMessageResponse]:
+        """The messages of the case closest to one of its messages, best first."""
+        evidence = await self.evidence_repo.get_by_id(evidence_id)
+        if not evidence:
+            raise UnauthorizedAccessException("Evidence not found or access denied")
+        await self.case_repo.check_case_access(evidence.case_id, user_id)
+
+        query = await self.message_repo.get_message_embedding(evidence_id, message_id)
+        if query is None:
+            raise ResourceNotFoundException("Message not found or not embedded yet")
+        evidences = await self.evidence_repo.list_by_case_id(evidence.case_id)
+
+        # Scans memory-mapped files, kept off the event loop; one more match
+        # than asked makes up for the message itself
+        matches = await run_in_threadpool(
+            self.vector_index.search,
+            [evidence.id for evidence in evidences],
+            query,
+            limit + 1,
+        )
+        matches = [match for match in matches if match.id != message_id][:limit]
+
+        rows = await self.message_repo.get_messages(
+            [(match.evidence_id, match.id) for match in matches],
+            SIMILAR_MESSAGE_FIELDS,
+        )
+        rows_by_key = {(row["evidence_id"], row["id"]): row for row in rows}
+        # Messages deleted since they were indexed are skipped
+        return [
+            SimilarMessageResponse(
+                **rows_by_key[(match.evidence_id, match.id)], score=match.score
+            )
+            for match in matches
+            if (match.evidence_id, match.id) in rows_by_key
+        ]
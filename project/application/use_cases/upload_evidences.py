@@ -1,24 +1,115 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 
+from project.application.dto.evidence_management_dto import (
+    EvidenceJobResponse,
+    UploadEvidencesResponse,
+)
+from project.application.exceptions.exceptions import (
+    InvalidInputException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParserRegistry,
+)
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
 from project.application.interfaces.file_storage_interface import IFileStorage
 from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
+from project.application.utils.evidence_format import detect_evidence_format
+from project.application.utils.evidence_schema import resolve_evidence_schema
+from project.application.utils.uuid7 import uuid7
+from project.domain.entities import StoredFileEntity
 
 
 class UploadEvidencesUseCase:
-    def __init__(self, file_storage: IFileStorage, job_dispatcher: IJobDispatcher):
+    def __init__(
+        self,
+        file_storage: IFileStorage,
+        job_dispatcher: IJobDispatcher,
+        evidence_repository: IEvidenceRepository,
+        parser_registry: IEvidenceParserRegistry,
+    ):
         self.file_storage = file_storage
         self.job_dispatcher = job_dispatcher
+        self.evidence_repository = evidence_repository
+        self.parser_registry = parser_registry
 
-    async def execute(self, case_id: str, evidences: List[UploadFile]):
+    @handle_repo_exceptions
+    async def execute(
+        self,
+        case_id: str,
+        evidences: List[UploadFile],
+        column_mapping: Optional[Dict[str, str]] = None,
+    ) -> UploadEvidencesResponse:
         # Save file to upload directory
         saved_files = await self.file_storage.upload_files(evidences)
 
+        # Validate every file before queueing any, so a bad upload fails as a whole
+        column_mappings = [
+            await run_in_threadpool(self._resolve_mapping, saved_file, column_mapping)
+            for saved_file in saved_files
+        ]
+        jobs = []
+
         # Call background job to parse each file
-        for file_path in saved_files:
-            payload = {"case_id": case_id, "file_path": file_path}
+        for saved_file, resolved_mapping in zip(saved_files, column_mappings):
+            # The evidence id is fixed up front so that retries resume the same record
+            payload = {
+                "case_id": case_id,
+                "file_path": saved_file.path,
+                "evidence_id": str(uuid7()),
+                "metadata": {
+                    "original_filename": saved_file.filename,
+                    "content_type": saved_file.content_type,
+                    "size": saved_file.size,
+                    "sha256": saved_file.sha256,
+                    "column_mapping": resolved_mapping,
+                },
+            }
+
+            # Identical content was already parsed the same way: copy its rows instead
+            parsed_evidence = await self.evidence_repository.get_parsed_by_content_hash(
+                saved_file.sha256, resolved_mapping
+            )
+            if parsed_evidence:
+                payload["source_evidence_id"] = str(parsed_evidence.id)
+                job_id = self.job_dispatcher.dispatch(
+                    job_name="clone_evidence", payload=payload
+                )
+            else:
+                job_id = self.job_dispatcher.dispatch(
+                    job_name="parse_evidence_file", payload=payload
+                )
 
-            self.job_dispatcher.dispatch(
-                job_name="parse_evidence_file", payload=payload
+            jobs.append(
+                EvidenceJobResponse(
+                    evidence_id=payload["evidence_id"],
+                    job_id=job_id,
+                    filename=saved_file.filename,
+                )
+            )
+
+        return UploadEvidencesResponse(
+            message="Evidences uploaded successfully", evidences=jobs
+        )
+
+    def _resolve_mapping(
+        self, saved_file: StoredFileEntity, column_mapping: Optional[Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Check the file's format and columns on a sample of its first records."""
+        try:
+            evidence_format = detect_evidence_format(
+                saved_file.path, saved_file.filename, saved_file.content_type
+            )
+            resolved_mapping, _ = resolve_evidence_schema(
+                self.parser_registry.get(evidence_format),
+                saved_file.path,
+                column_mapping,
             )
+        except ValueError as e:
+            raise InvalidInputException(f"{saved_file.filename}: {e}")
+        return resolved_mapping
@@ -0,0 +1,162 @@
+from typing import List, Optional
+from uuid import UUID
+
+from project.application.dto.watchlist_dto import (
+    CreateWatchlistRequest,
+    UpdateWatchlistRequest,
+    WatchlistDetailResponse,
+    WatchlistHitMessagePageResponse,
+    WatchlistHitMessageResponse,
+    WatchlistResponse,
+    WatchlistTermHitResponse,
+)
+from project.application.exceptions.exceptions import (
+    InvalidInputException,
+    handle_repo_exceptions,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.application.utils.message_cursor import (
+    decode_message_cursor,
+    encode_message_cursor,
+)
+from project.application.utils.uuid7 import uuid7
+from project.application.utils.watchlists import normalize_terms, normalize_text
+from project.domain.entities import WatchlistEntity
+
+
+class WatchlistUseCase:
+    """
+    Watchlists of terms matched against every message at ingest time. Hits are
+    recorded then, a lookup never scans the message payloads.
+    """
+
+    def __init__(
+        self,
+        watchlist_repo: IWatchlistRepository,
+        evidence_repo: IEvidenceRepository,
+        case_repo: ICaseRepository,
+    ):
+        self.watchlist_repo = watchlist_repo
+        self.evidence_repo = evidence_repo
+        self.case_repo = case_repo
+
+    # ----------------------------
+    # WATCHLIST CRUD
+    # ----------------------------
+    @handle_repo_exceptions
+    async def create_watchlist(
+        self, watchlist_request: CreateWatchlistRequest, user_id: UUID
+    ) -> WatchlistDetailResponse:
+        """Create a watchlist of the user, for one of their cases or all of them."""
+        terms = self._normalize_terms(watchlist_request.terms)
+        if watchlist_request.case_id:
+            await self.case_repo.check_case_access(watchlist_request.case_id, user_id)
+
+        watchlist = await self.watchlist_repo.create_watchlist(
+            WatchlistEntity(
+                id=uuid7(),
+                user_id=user_id,
+                name=watchlist_request.name,
+                terms=terms,
+                case_id=watchlist_request.case_id,
+            )
+        )
+        return WatchlistDetailResponse(**vars(watchlist))
+
+    @handle_repo_exceptions
+    async def get_watchlists_by_user(self, user_id: UUID) -> List[WatchlistResponse]:
+        watchlists = await self.watchlist_repo.get_watchlists_by_user(user_id)
+        return [WatchlistResponse(**vars(watchlist)) for watchlist in watchlists]
+
+    @handle_repo_exceptions
+    async def get_watchlist(
+        self, watchlist_id: UUID, user_id: UUID
+    ) -> WatchlistDetailResponse:
+        watchlist = await self.watchlist_repo.get_watchlist(watchlist_id, user_id)
+        return WatchlistDetailResponse(**vars(watchlist))
+
+    @handle_repo_exceptions
+    async def update_watchlist(
+        self,
+        watchlist_id: UUID,
+        user_id: UUID,
+        watchlist_request: UpdateWatchlistRequest,
+    ) -> WatchlistDetailResponse:
+        """
+        Rename a watchlist or replace its terms. Messages already ingested keep
+        their hits of the terms still watched.
+        """
+        watchlist = await self.watchlist_repo.get_watchlist(watchlist_id, user_id)
+        if watchlist_request.name:
+            watchlist.name = watchlist_request.name
+        if watchlist_request.terms is not None:
+            watchlist.terms = self._normalize_terms(watchlist_request.terms)
+
+        watchlist = await self.watchlist_repo.update_watchlist(watchlist)
+        return WatchlistDetailResponse(**vars(watchlist))
+
+    @handle_repo_exceptions
+    async def delete_watchlist(self, watchlist_id: UUID, user_id: UUID) -> None:
+        await self.watchlist_repo.delete_watchlist(watchlist_id, user_id)
+
+    # ----------------------------
+    # HITS
+    # ----------------------------
+    @handle_repo_exceptions
+    async def list_case_hits(
+        self,
+        case_id: UUID,
+        user_id: UUID,
+        watchlist_id: Optional[UUID],
+        term: Optional[str],
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> WatchlistHitMessagePageResponse:
+        """Page through the messages of a case hitting a watchlist."""
+        after = None
+        if cursor:
+            try:
+                after = decode_message_cursor(cursor)
+            except ValueError as e:
+                raise InvalidInputException(str(e))
+
+        await self.case_repo.check_case_access(case_id, user_id)
+        evidences = await self.evidence_repo.list_by_case_id(case_id)
+
+        # One row more than asked tells whether there is a next page
+        rows = await self.watchlist_repo.list_hit_messages(
+            [evidence.id for evidence in evidences],
+            watchlist_id,
+            normalize_text(term) if term else None,
+            limit + 1,
+            after,
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_message_cursor(rows[-1]["evidence_id"], rows[-1]["id"])
+
+        items = []
+        for row in rows:
+            hits = [
+                WatchlistTermHitResponse(watchlist_id=hit_watchlist_id, term=hit_term)
+                for hit_watchlist_id, hit_term in zip(
+                    row.pop("watchlist_ids"), row.pop("terms")
+                )
+            ]
+            items.append(WatchlistHitMessageResponse(**row, hits=hits))
+        return WatchlistHitMessagePageResponse(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _normalize_terms(terms: List[str]) -> List[str]:
+        """Normalize the terms the way payloads are before matching."""
+        try:
+            return normalize_terms(terms)
+        except ValueError as e:
+            raise InvalidInputException(str(e))
@@ -0,0 +1,51 @@
+import gzip
+import io
+from typing import BinaryIO, Optional
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSION_EXTENSIONS = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+
+def detect_compression(stream: BinaryIO) -> Optional[str]:
+    """Identify a gzip or zstd stream from its magic bytes, leaving it in place."""
+    position = stream.tell()
+    magic = stream.read(4)
+    stream.seek(position)
+
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    if magic == ZSTD_MAGIC:
+        return "zstd"
+    return None
+
+
+def is_compressed(file_path: str) -> bool:
+    with open(file_path, mode="rb") as f:
+        return detect_compression(f) is not None
+
+
+def decompress_stream(stream: BinaryIO) -> BinaryIO:
+    """
+    Wrap a seekable binary stream so that reads return decompressed bytes.
+    Uncompressed streams are returned as they are. Nothing is written to disk.
+    """
+    compression = detect_compression(stream)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError(
+                "zstd-compressed evidence requires the 'zstandard' package"
+            )
+        # A bare stream reader can't be iterated by line the way `GzipFile` is
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(stream))
+    return stream
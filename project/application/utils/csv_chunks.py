@@ -0,0 +1,118 @@
+import csv
+import mmap
+import os
+import re
+from typing import List, Optional, Tuple
+
+NEWLINE = b"\n"
+# A quoted field: anything but quotes, or escaped quote pairs, up to its
+# closing quote
+QUOTED_FIELD = re.compile(rb'"(?:[^"]++|"")*+"')
+# Text outside quoted fields: quoted fields, which open at the start of a
+# field, and quotes anywhere else, which are text
+UNQUOTED_SPAN = re.compile(rb'(?:[^"]++|(?<=[,\r\n])"(?:[^"]++|"")*+"|(?<![,\r\n])")*+')
+BLOCK_SIZE = 1 << 20
+
+
+class CsvLineReader:
+    """
+    Iterate the decoded lines of a byte range of a CSV file.
+
+    `offset` is the absolute byte offset of everything handed out so far, so
+    right after `csv.reader` yields a row it points at the start of the next
+    record (the reader never reads ahead of the record it returns).
+    `line_count` is the number of lines handed out since `start`.
+    Decompressing streams can't seek, they are read from where they stand.
+    """
+
+    def __init__(self, f, start: int, end: Optional[int] = None, encoding="utf-8"):
+        if f.seekable():
+            f.seek(start)
+        self.lines = iter(f)
+        self.offset = start
+        self.line_count = 0
+        self.end = end
+        self.encoding = encoding
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        if self.end is not None and self.offset >= self.end:
+            raise StopIteration
+        line = next(self.lines)
+        self.offset += len(line)
+        self.line_count += 1
+        return line.decode(self.encoding)
+
+
+def count_lines(file_path: str, end: int) -> int:
+    """Count the line breaks in the first `end` bytes of a file."""
+    count = 0
+    with open(file_path, mode="rb") as f:
+        while end > 0:
+            block = f.read(min(BLOCK_SIZE, end))
+            if not block:
+                break
+            count += block.count(NEWLINE)
+            end -= len(block)
+    return count
+
+
+def read_csv_header(file_path: str) -> Tuple[List[str], int]:
+    """Return the header fields and the byte offset of the first data record."""
+    with open(file_path, mode="rb") as f:
+        lines = CsvLineReader(f, start=0)
+        header = next(csv.reader(lines), [])
+        return header, lines.offset
+
+
+def plan_csv_chunks(
+    file_path: str, chunk_size: int
+) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split the data section of a CSV file into `(start, end)` byte ranges of
+    roughly `chunk_size` bytes that begin and end on record boundaries.
+
+    A newline only ends a record outside a quoted field. As in `csv.reader`,
+    a quote only opens a field at its start, so the stray quote of an
+    unquoted field (`my 27" monitor`) is text. Spans of text and whole quoted
+    fields are skipped by regular expressions over the mapped file, a record
+    at a time only around the planned boundaries.
+    """
+    header, data_start = read_csv_header(file_path)
+    file_size = os.path.getsize(file_path)
+
+    chunks = []
+    chunk_start = data_start
+    target = chunk_start + chunk_size
+
+    if target < file_size:
+        with open(file_path, mode="rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            # Every byte before `position` is outside any quoted field
+            position = data_start
+            while target < file_size:
+                newline = data.find(NEWLINE, max(position, target))
+                if newline == -1:
+                    break
+
+                position = UNQUOTED_SPAN.match(data, position, newline).end()
+                if position < newline:
+                    # A quoted field opens before the newline and runs past it
+                    field = QUOTED_FIELD.match(data, position)
+                    if not field:
+                        break
+                    position = field.end()
+                    continue
+
+                position = newline + 1
+                chunks.append((chunk_start, position))
+                chunk_start = position
+                target = position + chunk_size
+
+    if chunk_start < file_size:
+        chunks.append((chunk_start, file_size))
+
+    return header, chunks
@@ -0,0 +1,27 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+
+# Vectors are stored as their raw little-endian float32 values, the memory
+# layout of the workers, so decoding one is a view over the bytes
+EMBEDDING_DTYPE = np.dtype("<f4")
+
+Buffer = Union[bytes, memoryview]
+
+
+def encode_embeddings(vectors: np.ndarray) -> List[bytes]:
+    """Stored form of each row of a `(count, dimensions)` array."""
+    vectors = np.ascontiguousarray(vectors, dtype=EMBEDDING_DTYPE)
+    return [row.tobytes() for row in vectors]
+
+
+def decode_embedding(data: Buffer) -> np.ndarray:
+    """Read-only vector over a stored embedding, without copying it."""
+    return np.frombuffer(data, dtype=EMBEDDING_DTYPE)
+
+
+def decode_embeddings(rows: Sequence[Buffer]) -> np.ndarray:
+    """Stored embeddings of the same length stacked into one 2-D array."""
+    if not rows:
+        return np.empty((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.frombuffer(b"".join(rows), dtype=EMBEDDING_DTYPE).reshape(len(rows), -1)
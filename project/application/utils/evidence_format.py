@@ -0,0 +1,78 @@
+import os
+import zipfile
+from typing import Optional
+
+from project.application.utils.compression import (
+    COMPRESSION_EXTENSIONS,
+    decompress_stream,
+)
+from project.domain.enums import EvidenceFormat
+
+EXTENSIONS = {
+    ".csv": EvidenceFormat.CSV,
+    ".txt": EvidenceFormat.CSV,
+    ".xlsx": EvidenceFormat.EXCEL,
+    ".xlsm": EvidenceFormat.EXCEL,
+    ".jsonl": EvidenceFormat.JSONL,
+    ".ndjson": EvidenceFormat.JSONL,
+    ".zip": EvidenceFormat.ZIP,
+}
+
+CONTENT_TYPES = {
+    "text/csv": EvidenceFormat.CSV,
+    "text/plain": EvidenceFormat.CSV,
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": (
+        EvidenceFormat.EXCEL
+    ),
+    "application/vnd.ms-excel.sheet.macroenabled.12": EvidenceFormat.EXCEL,
+    "application/x-ndjson": EvidenceFormat.JSONL,
+    "application/jsonl": EvidenceFormat.JSONL,
+    "application/zip": EvidenceFormat.ZIP,
+    "application/x-zip-compressed": EvidenceFormat.ZIP,
+}
+
+ZIP_MAGIC = b"PK\x03\x04"
+OLE_MAGIC = b"\xd0\xcf\x11\xe0"
+XLSX_WORKBOOK = "xl/workbook.xml"
+
+
+def format_from_filename(filename: Optional[str]) -> Optional[EvidenceFormat]:
+    """Map a filename to a format, looking through `.gz`/`.zst` suffixes."""
+    stem, extension = os.path.splitext((filename or "").lower())
+    if extension in COMPRESSION_EXTENSIONS:
+        extension = os.path.splitext(stem)[1]
+    return EXTENSIONS.get(extension)
+
+
+def detect_evidence_format(
+    file_path: str,
+    filename: Optional[str] = None,
+    content_type: Optional[str] = None,
+) -> EvidenceFormat:
+    """
+    Pick the format of an uploaded evidence from its original filename, then
+    its declared content type, and finally from the leading bytes of the file
+    (uploads often come as `application/octet-stream` or without extension).
+    """
+    evidence_format = format_from_filename(filename)
+    if evidence_format:
+        return evidence_format
+
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CONTENT_TYPES:
+        return CONTENT_TYPES[media_type]
+
+    with open(file_path, mode="rb") as f:
+        if f.read(len(ZIP_MAGIC)) == ZIP_MAGIC:
+            with zipfile.ZipFile(f) as archive:
+                if XLSX_WORKBOOK in archive.namelist():
+                    return EvidenceFormat.EXCEL
+            return EvidenceFormat.ZIP
+        f.seek(0)
+        head = decompress_stream(f).read(4096)
+
+    if head.startswith(OLE_MAGIC):
+        raise ValueError("Legacy .xls workbooks are not supported, save as .xlsx")
+    if head.lstrip().startswith(b"{"):
+        return EvidenceFormat.JSONL
+    return EvidenceFormat.CSV
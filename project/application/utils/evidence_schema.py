@@ -0,0 +1,100 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+from project.application.interfaces.evidence_parser_interface import IEvidenceParser
+
+MESSAGE_FIELDS = ("sender", "receiver", "payload")
+
+# Normalized header names recognised for each message field, in priority order
+FIELD_ALIASES = {
+    "sender": (
+        "sender",
+        "from",
+        "sender_id",
+        "sender_name",
+        "from_user",
+        "author",
+        "source",
+        "src",
+    ),
+    "receiver": (
+        "receiver",
+        "to",
+        "receiver_id",
+        "recipient",
+        "recipient_id",
+        "to_user",
+        "destination",
+        "dst",
+    ),
+    "payload": ("payload", "message", "body", "text", "content", "msg"),
+}
+
+SAMPLE_SIZE = 100
+
+
+def normalize_column(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.strip().lower()).strip("_")
+
+
+def infer_column_mapping(
+    columns: List[str], column_mapping: Optional[Dict[str, str]] = None
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Map each message field to a column of the file and list the other
+    columns, which are kept per message as extra attributes.
+
+    Fields missing from `column_mapping` are matched against known header
+    aliases; a ValueError explains what could not be mapped.
+    """
+    column_mapping = column_mapping or {}
+    unknown_fields = set(column_mapping) - set(MESSAGE_FIELDS)
+    if unknown_fields:
+        raise ValueError(f"Unknown message fields in mapping: {sorted(unknown_fields)}")
+
+    normalized = {}
+    for column in columns:
+        normalized.setdefault(normalize_column(column), column)
+
+    mapping = {}
+    for field in MESSAGE_FIELDS:
+        if field in column_mapping:
+            if column_mapping[field] not in columns:
+                raise ValueError(
+                    f"Column '{column_mapping[field]}' mapped to {field} "
+                    f"is not in the file, found {columns}"
+                )
+            mapping[field] = column_mapping[field]
+            continue
+
+        candidates = (normalized.get(alias) for alias in FIELD_ALIASES[field])
+        column = next((c for c in candidates if c and c not in mapping.values()), None)
+        if not column:
+            raise ValueError(
+                f"No {field} column found in {columns}, pass a column_mapping"
+            )
+        mapping[field] = column
+
+    extra_columns = [column for column in columns if column not in mapping.values()]
+    return mapping, extra_columns
+
+
+def resolve_evidence_schema(
+    parser: IEvidenceParser,
+    file_path: str,
+    column_mapping: Optional[Dict[str, str]] = None,
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Check a file against the column mapping on a sample of its first records,
+    so that a file that can't be loaded is rejected before the full parse.
+    """
+    try:
+        sample = parser.sample_records(file_path, SAMPLE_SIZE)
+    except Exception as e:
+        raise ValueError(f"Could not read the evidence file: {e}") from e
+    if not sample:
+        raise ValueError("The evidence file contains no records")
+
+    # Records of some formats (JSONL, archives) don't all share the same keys
+    columns = list(dict.fromkeys(name for record in sample for name in record if name))
+    return infer_column_mapping(columns, column_mapping)
@@ -0,0 +1,129 @@
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from project.application.utils.uuid7 import uuid7
+
+
+class ComponentMerge(NamedTuple):
+    """
+    A connected component of a case once a batch of edges is added: the
+    components it absorbs, the participants new to the case it gains, and
+    its size and message count after the batch.
+    """
+
+    component_id: UUID
+    # Known components folded into this one, their participants relabeled
+    merged_ids: List[UUID]
+    new_participants: List[str]
+    size: int
+    message_count: int
+
+
+class _DisjointSet:
+    """Union-find with path halving and union by size."""
+
+    def __init__(self):
+        self.parent: Dict[Hashable, Hashable] = {}
+        self.size: Dict[Hashable, int] = {}
+
+    def find(self, node: Hashable) -> Hashable:
+        root = self.parent.setdefault(node, node)
+        while root != self.parent[root]:
+            self.parent[root] = self.parent[self.parent[root]]
+            root = self.parent[root]
+        return root
+
+    def union(self, a: Hashable, b: Hashable) -> None:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size.get(a, 1) < self.size.get(b, 1):
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] = self.size.get(a, 1) + self.size.get(b, 1)
+
+
+def connected_components(
+    edges: Iterable[Tuple[str, str, int]],
+) -> List[Tuple[List[str], int]]:
+    """
+    Weakly connected components of a directed, weighted graph, as
+    `(members, total weight)` pairs, the largest component first.
+
+    Union-find with path halving and union by size, near linear in the
+    number of edges.
+    """
+    nodes = _DisjointSet()
+    weights: List[Tuple[str, int]] = []
+    for sender, receiver, weight in edges:
+        nodes.union(sender, receiver)
+        weights.append((sender, weight))
+
+    members: Dict[Hashable, List[str]] = {}
+    for node in list(nodes.parent):
+        members.setdefault(nodes.find(node), []).append(node)
+    totals: Dict[Hashable, int] = dict.fromkeys(members, 0)
+    for node, weight in weights:
+        totals[nodes.find(node)] += weight
+
+    components = [(sorted(nodes), totals[root]) for root, nodes in members.items()]
+    components.sort(key=lambda component: (-len(component[0]), -component[1]))
+    return components
+
+
+def merge_components(
+    edges: Iterable[Tuple[str, str, int]],
+    known: Dict[str, Tuple[UUID, int, int]],
+) -> List[ComponentMerge]:
+    """
+    Fold a batch of `(sender, receiver, message_count)` edges into the
+    components already stored for a case, given the `(component_id, size,
+    message_count)` of the batch's participants known to the case.
+
+    Only the components the batch touches are returned. Those it joins keep
+    the id of the largest, so relabeling moves the fewest participants.
+    """
+    nodes = _DisjointSet()
+    components: Dict[UUID, Tuple[int, int]] = {}
+    # Known participants stand in for their whole component
+    for participant, (component_id, size, message_count) in known.items():
+        nodes.union(participant, component_id)
+        components[component_id] = (size, message_count)
+
+    weights: List[Tuple[str, int]] = []
+    for sender, receiver, message_count in edges:
+        nodes.union(sender, receiver)
+        weights.append((sender, message_count))
+
+    merged: Dict[Hashable, List[UUID]] = {}
+    new_participants: Dict[Hashable, List[str]] = {}
+    added: Dict[Hashable, int] = {}
+    for node in list(nodes.parent):
+        root = nodes.find(node)
+        if isinstance(node, UUID):
+            merged.setdefault(root, []).append(node)
+        elif node not in known:
+            new_participants.setdefault(root, []).append(node)
+        added.setdefault(root, 0)
+    for sender, message_count in weights:
+        added[nodes.find(sender)] += message_count
+
+    merges = []
+    for root, message_count in added.items():
+        component_ids = merged.get(root, [])
+        participants = new_participants.get(root, [])
+        survivor: Optional[UUID] = max(
+            component_ids, key=lambda id_: (components[id_][0], id_), default=None
+        )
+        merges.append(
+            ComponentMerge(
+                component_id=survivor or uuid7(),
+                merged_ids=[id_ for id_ in component_ids if id_ != survivor],
+                new_participants=sorted(participants),
+                size=sum(components[id_][0] for id_ in component_ids)
+                + len(participants),
+                message_count=sum(components[id_][1] for id_ in component_ids)
+                + message_count,
+            )
+        )
+    return merges
@@ -0,0 +1,224 @@
+import hashlib
+import ipaddress
+import re
+import uuid
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+from project.domain.enums import IndicatorKind
+
+# Namespace of the indicator ids, derived from kind and value so every worker
+# computes the same id without a round trip
+INDICATOR_NAMESPACE = uuid.UUID("296ca023-926e-431f-b7be-043a472e5434")
+
+_BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BASE58_INDEX = {char: index for index, char in enumerate(_BASE58)}
+_BECH32 = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+_BECH32_GENERATOR = (0x3B6A57B2, 0x26508E6D, 0x1EA119FA, 0x3D4233DD, 0x2A1462B3)
+# Checksum constants of bech32 (segwit v0) and bech32m (v1 and later)
+_BECH32_CONSTANTS = (1, 0x2BC830A3)
+
+# Dots as written, or defanged the way reports and tickets usually do it
+_DOT = r"(?:\.|\[\.\]|\(\.\)|\[dot\])"
+_OCTET = r"(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)"
+_LABEL = r"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?"
+_TLD = r"[a-z]{2,24}"
+
+# One pass over the text finds every kind. At a given position the first
+# alternative wins, so URLs and emails are taken whole before their domains.
+_INDICATOR_PATTERN = re.compile(
+    rf"""
+    (?P<url>\b(?:https?|hxxps?|ftp)(?::|\[:\])//[^\s<>"'`]+)
+    | (?P<email>\b[a-z0-9][a-z0-9._%+-]*(?:@|\[@\])(?:{_LABEL}{_DOT})+{_TLD}\b)
+    | (?P<ethereum>\b0x[0-9a-f]{{40}}\b)
+    | (?P<hash>\b(?:[0-9a-f]{{64}}|[0-9a-f]{{40}}|[0-9a-f]{{32}})\b)
+    | (?P<bitcoin>(?-i:\b(?:bc1[{_BECH32}]{{39,59}}|[13][{_BASE58}]{{25,34}})\b))
+    | (?P<ipv4>(?<![\d.])(?:{_OCTET}{_DOT}){{3}}{_OCTET}(?!\d|\.\d))
+    | (?P<ipv6>(?<![\w:])(?:[0-9a-f]{{0,4}}:){{2,7}}[0-9a-f]{{0,4}}(?![\w:]))
+    | (?P<domain>\b(?:{_LABEL}{_DOT})+{_TLD}\b)
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_DOMAIN_PATTERN = re.compile(rf"(?:{_LABEL}\.)+{_TLD}", re.IGNORECASE)
+_DEFANGED = re.compile(r"\[\.\]|\(\.\)|\[dot\]|\[@\]|\[:\]|^hxxp", re.IGNORECASE)
+_REFANGED = {"[.]": ".", "(.)": ".", "[dot]": ".", "[@]": "@", "[:]": ":"}
+
+_HASH_KINDS = {
+    32: IndicatorKind.MD5,
+    40: IndicatorKind.SHA1,
+    64: IndicatorKind.SHA256,
+}
+
+# Suffixes of file names far more often than domains, although a few of them
+# (.zip, .py, .sh) are top-level domains as well
+FILE_EXTENSIONS = frozenset(
+    """
+    exe dll sys bat cmd ps1 vbs js jar py sh msi apk txt log csv json xml html
+    htm php asp aspx jsp doc docx xls xlsx ppt pptx pdf rtf png jpg jpeg gif bmp
+    svg mp3 mp4 wav avi mov zip rar gz tar tgz iso img bin dat tmp bak ini cfg
+    conf yml yaml md
+    """.split()
+)
+
+# Longer values, mostly URLs, are dropped: a B-tree index entry can't exceed
+# about 2.7 kB and one overflow would fail the whole ingestion batch
+MAX_INDICATOR_LENGTH = 2048
+
+# Shortest indicator made of letters and digits only, a legacy Bitcoin address
+_MIN_ALPHANUMERIC_LENGTH = 26
+
+# Trailing characters of a URL that belong to the surrounding sentence
+_URL_TRAILING = ".,;:!?)]}'\""
+
+
+class IndicatorMatch(NamedTuple):
+    """An indicator found in the payload at position `row` of a batch."""
+
+    row: int
+    kind: IndicatorKind
+    value: str
+
+
+def indicator_id(kind: IndicatorKind, value: str) -> uuid.UUID:
+    """Stable id of a normalized indicator."""
+    return uuid.uuid5(INDICATOR_NAMESPACE, f"{kind.value}:{value}")
+
+
+def extract_indicators(payloads: Sequence[str]) -> List[IndicatorMatch]:
+    """
+    Every distinct indicator of each payload, normalized.
+
+    Most words can't be or hold an indicator: letters and digits only, and
+    shorter than any hash or wallet. Those are skipped with a `str` method, the
+    regex only scans the remaining words, joined into one text for a single
+    pass. No pattern crosses whitespace, so no match can span two words.
+    """
+    rows = []
+    words = []
+    for row, payload in enumerate(payloads):
+        for word in payload.split():
+            if len(word) >= _MIN_ALPHANUMERIC_LENGTH or not word.isalnum():
+                rows.append(row)
+                words.append(word)
+
+    text = "\n".join(words)
+    # Offset right after each word's separator, to map matches to their row
+    word_ends = list(accumulate(len(word) + 1 for word in words))
+
+    matches = {}
+    for match in _INDICATOR_PATTERN.finditer(text):
+        row = rows[bisect_right(word_ends, match.start())]
+        for kind, value in _normalize(match.lastgroup, match.group()):
+            matches.setdefault((row, kind, value))
+    return [IndicatorMatch(*key) for key in matches]
+
+
+def parse_indicator(value: str) -> Optional[Tuple[IndicatorKind, str]]:
+    """Kind and normalized value of a single indicator, None if it isn't one."""
+    match = _INDICATOR_PATTERN.fullmatch(value.strip())
+    if not match:
+        return None
+    indicators = _normalize(match.lastgroup, match.group())
+    return indicators[0] if indicators else None
+
+
+# The same few indicators tend to recur throughout an evidence
+@lru_cache(maxsize=65536)
+def _normalize(group: str, raw: str) -> Tuple[Tuple[IndicatorKind, str], ...]:
+    return tuple(
+        (kind, value)
+        for kind, value in _normalize_match(group, raw)
+        if len(value) <= MAX_INDICATOR_LENGTH
+    )
+
+
+def _normalize_match(group: str, raw: str) -> List[Tuple[IndicatorKind, str]]:
+    if group == "hash":
+        return [(_HASH_KINDS[len(raw)], raw.lower())]
+    if group == "ethereum":
+        return [(IndicatorKind.ETHEREUM, raw.lower())]
+    if group == "bitcoin":
+        valid = _valid_bech32(raw) if raw.startswith("bc1") else _valid_base58(raw)
+        return [(IndicatorKind.BITCOIN, raw)] if valid else []
+
+    value = _refang(raw)
+    if group == "url":
+        return _normalize_url(value.rstrip(_URL_TRAILING))
+    if group == "email":
+        return [(IndicatorKind.EMAIL, value.lower())]
+    if group in ("ipv4", "ipv6"):
+        return _normalize_ip(value)
+    return _normalize_domain(value)
+
+
+def _refang(value: str) -> str:
+    return _DEFANGED.sub(
+        lambda match: _REFANGED.get(match.group().lower(), "http"), value
+    )
+
+
+def _normalize_url(value: str) -> List[Tuple[IndicatorKind, str]]:
+    try:
+        parts = urlsplit(value)
+        host = parts.hostname
+    except ValueError:
+        return []
+    if not host:
+        return []
+
+    url = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), *parts[2:]))
+    # The host is an indicator of its own, looked up without the rest of the URL
+    if _DOMAIN_PATTERN.fullmatch(host):
+        return [(IndicatorKind.URL, url), *_normalize_domain(host)]
+    return [(IndicatorKind.URL, url), *_normalize_ip(host)]
+
+
+def _normalize_ip(value: str) -> List[Tuple[IndicatorKind, str]]:
+    try:
+        address = ipaddress.ip_address(value)
+    except ValueError:
+        # Times, MAC addresses and the like match the IPv6 candidate pattern
+        return []
+    if address.is_unspecified:
+        return []
+    kind = IndicatorKind.IPV4 if address.version == 4 else IndicatorKind.IPV6
+    return [(kind, address.compressed)]
+
+
+def _normalize_domain(value: str) -> List[Tuple[IndicatorKind, str]]:
+    value = value.lower()
+    if value.rsplit(".", 1)[-1] in FILE_EXTENSIONS:
+        return []
+    return [(IndicatorKind.DOMAIN, value)]
+
+
+def _valid_base58(address: str) -> bool:
+    # Legacy addresses decode to 25 bytes ending in a double SHA-256 checksum
+    number = 0
+    for char in address:
+        number = number * 58 + _BASE58_INDEX[char]
+    try:
+        raw = number.to_bytes(25, "big")
+    except OverflowError:
+        return False
+    checksum = hashlib.sha256(hashlib.sha256(raw[:-4]).digest()).digest()
+    return checksum[:4] == raw[-4:]
+
+
+def _valid_bech32(address: str) -> bool:
+    hrp, _, data = address.rpartition("1")
+    values = [ord(char) >> 5 for char in hrp] + [0]
+    values += [ord(char) & 31 for char in hrp]
+    values += [_BECH32.index(char) for char in data]
+
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1FFFFFF) << 5 ^ value
+        for index, generator in enumerate(_BECH32_GENERATOR):
+            if (top >> index) & 1:
+                checksum ^= generator
+    return checksum in _BECH32_CONSTANTS
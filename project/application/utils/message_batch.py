@@ -0,0 +1,107 @@
+import uuid
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from project.application.utils.uuid7 import uuid7
+
+# Approximate cost of a row on top of its text: a string header per field and
+# a list slot per column
+ROW_OVERHEAD = 3 * 49 + 4 * 8
+ATTRIBUTE_OVERHEAD = 49 + 8
+
+MessageRow = Tuple[uuid.UUID, str, str, str, str, str, Optional[List[Optional[str]]]]
+
+
+class MessageBatch:
+    """
+    Columnar buffer of the parsed messages of one evidence awaiting a bulk load.
+
+    Each field lives in a plain list per column instead of one entity per
+    message, and the time-ordered message ids are only generated while the
+    batch is written, or staged with its near-duplicate buckets, so a batch
+    costs little more than its text. `nbytes`
+    estimates that cost, which lets callers bound a batch by memory rather than
+    by row count.
+    """
+
+    __slots__ = (
+        "evidence_id",
+        "status",
+        "senders",
+        "receivers",
+        "payloads",
+        "attributes",
+        "nbytes",
+        "ids",
+        "last_id",
+    )
+
+    def __init__(self, evidence_id, status: str):
+        self.evidence_id = evidence_id
+        self.status = status
+        self.senders: List[str] = []
+        self.receivers: List[str] = []
+        self.payloads: List[str] = []
+        self.attributes: List[Optional[List[Optional[str]]]] = []
+        self.nbytes = 0
+        self.ids: List[uuid.UUID] = []
+        self.last_id: Optional[uuid.UUID] = None
+
+    def __len__(self) -> int:
+        return len(self.senders)
+
+    def append(
+        self,
+        sender: str,
+        receiver: str,
+        payload: str,
+        attributes: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        self.senders.append(sender)
+        self.receivers.append(receiver)
+        self.payloads.append(payload)
+        self.attributes.append(attributes)
+
+        self.nbytes += ROW_OVERHEAD + len(sender) + len(receiver) + len(payload)
+        if attributes:
+            self.nbytes += sum(
+                ATTRIBUTE_OVERHEAD + len(value or "") for value in attributes
+            )
+
+    def rows(self) -> Iterator[MessageRow]:
+        """
+        Yield `(id, evidence_id, sender, receiver, payload, status, attributes)`
+        tuples, assigning each message its id unless `assign_ids` did already;
+        `ids` and `last_id` follow along.
+        """
+        columns = zip(self.senders, self.receivers, self.payloads, self.attributes)
+        for row, (sender, receiver, payload, attributes) in enumerate(columns):
+            if row == len(self.ids):
+                self.ids.append(uuid7())
+            self.last_id = self.ids[row]
+            yield (
+                self.last_id,
+                self.evidence_id,
+                sender,
+                receiver,
+                payload,
+                self.status,
+                attributes,
+            )
+
+    def assign_ids(self) -> List[uuid.UUID]:
+        """The ids of the batch's messages, generated ahead of writing them."""
+        self.ids.extend(uuid7() for _ in range(len(self) - len(self.ids)))
+        return self.ids
+
+    def edge_counts(self) -> Dict[Tuple[str, str], int]:
+        """Number of messages per `(sender, receiver)` pair of the batch."""
+        return Counter(zip(self.senders, self.receivers))
+
+    def clear(self) -> None:
+        self.senders.clear()
+        self.receivers.clear()
+        self.payloads.clear()
+        self.attributes.clear()
+        self.ids.clear()
+        self.nbytes = 0
@@ -0,0 +1,39 @@
+import base64
+import binascii
+import struct
+from typing import Tuple
+from uuid import UUID
+
+
+def encode_message_cursor(evidence_id: UUID, message_id: UUID) -> str:
+    """Opaque, URL-safe cursor for the `(evidence_id, id)` key of a message."""
+    raw = evidence_id.bytes + message_id.bytes
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_message_cursor(cursor: str) -> Tuple[UUID, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+    if len(raw) != 32:
+        raise ValueError("Invalid cursor")
+    return UUID(bytes=raw[:16]), UUID(bytes=raw[16:])
+
+
+def encode_search_cursor(rank: float, evidence_id: UUID, message_id: UUID) -> str:
+    """Opaque cursor for the `(rank, evidence_id, id)` key of a search hit."""
+    # Ranks are float4, packed as such they round-trip exactly
+    raw = struct.pack(">f", rank) + evidence_id.bytes + message_id.bytes
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, UUID, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid cursor")
+    if len(raw) != 36:
+        raise ValueError("Invalid cursor")
+    (rank,) = struct.unpack(">f", raw[:4])
+    return rank, UUID(bytes=raw[4:20]), UUID(bytes=raw[20:])
@@ -0,0 +1,219 @@
+import csv
+import importlib.util
+import io
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional, Sequence
+from uuid import UUID
+
+# Rows of a Parquet row group, bigger groups compress better but are held longer
+PARQUET_ROW_GROUP_ROWS = 50_000
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    media_type: str
+    extension: str
+    encode: Callable[
+        [AsyncIterator[List[Sequence]], Sequence[str]], AsyncIterator[bytes]
+    ]
+    # Parquet pages are compressed already, gzip would only add latency
+    compressible: bool = True
+    # Optional package the encoder imports
+    requires: Optional[str] = None
+
+
+def _to_json(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _text_converters(fields: Sequence[str]) -> list:
+    # The csv module writes None as an empty field and str() for the rest
+    converters = {
+        "attributes": lambda value: (
+            None if value is None else json.dumps(value, ensure_ascii=False)
+        ),
+        "created_at": lambda value: None if value is None else value.isoformat(),
+    }
+    return [converters.get(field) for field in fields]
+
+
+async def encode_csv(
+    batches: AsyncIterator[List[Sequence]], fields: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """CSV with a header row, attributes as a JSON object."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    converters = list(enumerate(_text_converters(fields)))
+    converters = [(index, convert) for index, convert in converters if convert]
+
+    # Sent before the first row is fetched, the download starts right away
+    writer.writerow(fields)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            if converters:
+                row = list(row)
+                for index, convert in converters:
+                    row[index] = convert(row[index])
+            writer.writerow(row)
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def encode_ndjson(
+    batches: AsyncIterator[List[Sequence]], fields: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """One JSON object per line."""
+    async for rows in batches:
+        yield "".join(
+            json.dumps(dict(zip(fields, row)), default=_to_json, ensure_ascii=False)
+            + "\n"
+            for row in rows
+        ).encode("utf-8")
+
+
+class _ParquetSink:
+    """
+    Write-only file collecting what the Parquet writer emits until it is
+    drained. The position keeps counting across drains, the file footer
+    records the offsets of the row groups.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(pa, fields: Sequence[str]):
+    types = {
+        "created_at": pa.timestamp("us", tz="UTC"),
+        "attributes": pa.map_(pa.string(), pa.string()),
+    }
+    return pa.schema([(field, types.get(field, pa.string())) for field in fields])
+
+
+def _parquet_column(field: str, values: tuple) -> list:
+    if field == "attributes":
+        return [None if value is None else list(value.items()) for value in values]
+    if field == "created_at":
+        return list(values)
+    return [None if value is None else str(value) for value in values]
+
+
+async def encode_parquet(
+    batches: AsyncIterator[List[Sequence]], fields: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """
+    Parquet, one row group per `PARQUET_ROW_GROUP_ROWS` rows. Batches are
+    converted to Arrow as they arrive, only the compact columnar copy is held
+    until its row group is written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _parquet_schema(pa, fields)
+    sink = _ParquetSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+
+    def write_row_group(record_batches: list) -> bytes:
+        writer.write_table(pa.Table.from_batches(record_batches, schema=schema))
+        return sink.drain()
+
+    pending = []
+    pending_rows = 0
+    async for rows in batches:
+        if not rows:
+            continue
+        columns = zip(*rows)
+        pending.append(
+            pa.RecordBatch.from_arrays(
+                [
+                    _parquet_column(field, values)
+                    for field, values in zip(fields, columns)
+                ],
+                schema=schema,
+            )
+        )
+        pending_rows += len(rows)
+        if pending_rows >= PARQUET_ROW_GROUP_ROWS:
+            yield write_row_group(pending)
+            pending = []
+            pending_rows = 0
+    if pending:
+        yield write_row_group(pending)
+
+    writer.close()
+    yield sink.drain()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Gzip a byte stream on the fly. Every chunk is flushed through, so the
+    client receives each one as soon as it is encoded.
+    """
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+EXPORT_FORMATS = {
+    "csv": ExportFormat("text/csv", "csv", encode_csv),
+    "ndjson": ExportFormat("application/x-ndjson", "ndjson", encode_ndjson),
+    "parquet": ExportFormat(
+        "application/vnd.apache.parquet",
+        "parquet",
+        encode_parquet,
+        compressible=False,
+        requires="pyarrow",
+    ),
+}
+
+
+def get_export_format(name: str, gzip: bool = False) -> ExportFormat:
+    """
+    Look up an export format, checked before the response starts since an
+    error can no longer change its status once the first bytes are out.
+    """
+    export_format = EXPORT_FORMATS.get(name)
+    if export_format is None:
+        raise ValueError(
+            f"Unknown export format: {name}. Choose from {', '.join(EXPORT_FORMATS)}"
+        )
+    if export_format.requires and not importlib.util.find_spec(export_format.requires):
+        raise ValueError(
+            f"{name} export requires the '{export_format.requires}' package"
+        )
+    if gzip and not export_format.compressible:
+        raise ValueError(f"{name} exports are compressed already")
+    return export_format
@@ -0,0 +1,189 @@
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+
+# Signatures of BANDS x ROWS MinHash values. Two texts share a bucket, one
+# band of the signature, with probability 1 - (1 - J^ROWS)^BANDS for a
+# Jaccard similarity J of their shingles: ~93% at 0.8, ~28% at 0.5, ~4% at 0.3.
+BANDS = 5
+ROWS = 4
+SHINGLE_BYTES = 4
+# Only the head of longer texts is compared, bounding a batch's cost
+MAX_CHARS = 4_000
+# Shingles hashed at a time, 512 KiB of them and as much of hashes
+BLOCK_SHINGLES = 65536
+
+_DIGITS = re.compile(r"\d+")
+_HALF = np.uint64(32)
+
+_rng = np.random.default_rng(0x6D696E68617368)
+# Random multiply-add-shift functions standing in for the permutations
+_MULTIPLIERS = _rng.integers(1, 2**64, size=BANDS * ROWS, dtype=np.uint64) | 1
+_INCREMENTS = _rng.integers(0, 2**64, size=BANDS * ROWS, dtype=np.uint64)
+# Each band's values folded into one 64-bit bucket key, different per band
+_BAND_WEIGHTS = _rng.integers(1, 2**64, size=(BANDS, ROWS), dtype=np.uint64)
+
+
+class NearDuplicateCluster(NamedTuple):
+    """A cluster found in the index, named after its first message."""
+
+    id: UUID
+    # Evidence of the first message
+    evidence_id: UUID
+
+
+class ClusterShare(NamedTuple):
+    """The messages of a batch falling into one near-duplicate cluster."""
+
+    # Unset for a cluster the batch starts, which takes the id of its first
+    # message once the batch is written
+    cluster: Optional[NearDuplicateCluster]
+    # Positions of the messages in the batch
+    rows: List[int]
+
+
+class NearDuplicateBatch(NamedTuple):
+    case_id: UUID
+    clusters: List[ClusterShare]
+    # Buckets first seen in this batch, the i-th leading to the cluster
+    # `clusters[bucket_clusters[i]]`
+    bucket_keys: np.ndarray
+    bucket_clusters: np.ndarray
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercased, numbers blanked and whitespace collapsed, so messages from one
+    template differing in codes, amounts or times compare as the same text.
+    """
+    return " ".join(_DIGITS.sub("0", text[:MAX_CHARS].lower()).split())
+
+
+def lsh_buckets(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LSH buckets of each text's MinHash signature over its byte 4-grams, as a
+    `(count, BANDS)` int64 array, with a mask of the texts that have any.
+    Empty texts have none and stay out of every cluster.
+
+    The batch is hashed at once: texts are laid end to end as UTF-8 bytes and
+    each hash function applied to every 4-gram in one array operation, then
+    reduced to its minimum per text. Shingles are processed in blocks that
+    stay in the CPU cache across the hash functions, twice as fast as
+    streaming the whole batch through memory for each of them.
+    """
+    normalized = [normalize(text).encode("utf-8") for text in texts]
+    has_buckets = np.fromiter(map(bool, normalized), dtype=bool, count=len(texts))
+    # Texts shorter than a shingle are padded to make one
+    encoded = [data.ljust(SHINGLE_BYTES) for data in normalized if data]
+    if not encoded:
+        return np.zeros((0, BANDS), dtype=np.int64), has_buckets
+
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    text_of = np.repeat(np.arange(len(encoded)), lengths)
+
+    # The 4-gram starting at each byte, kept if it doesn't run into the next text
+    last = SHINGLE_BYTES - 1
+    end = len(data) - last
+    shingles = np.zeros(end, dtype=np.uint32)
+    for offset in range(SHINGLE_BYTES):
+        shingles = (shingles << np.uint32(8)) | data[offset:][:end]
+    inside = text_of[:end] == text_of[last:]
+    shingles = shingles[inside].astype(np.uint64)
+    starts = np.flatnonzero(np.r_[True, np.diff(text_of[:end][inside]) != 0])
+
+    signatures = np.empty((BANDS * ROWS, len(encoded)), dtype=np.uint64)
+    hashes = np.empty(min(len(shingles), BLOCK_SHINGLES * 2), dtype=np.uint64)
+    # Blocks of whole texts, of about BLOCK_SHINGLES shingles
+    bounds = np.unique(
+        np.searchsorted(starts, np.arange(0, len(shingles), BLOCK_SHINGLES))
+    )
+    bounds = np.r_[bounds, len(encoded)]
+    for first, stop in zip(bounds[:-1], bounds[1:]):
+        low = starts[first]
+        high = starts[stop] if stop < len(encoded) else len(shingles)
+        block = shingles[low:high]
+        block_starts = starts[first:stop] - low
+        if len(block) > len(hashes):
+            hashes = np.empty(len(block), dtype=np.uint64)
+        block_hashes = hashes[: len(block)]
+        for i in range(BANDS * ROWS):
+            np.multiply(block, _MULTIPLIERS[i], out=block_hashes)
+            block_hashes += _INCREMENTS[i]
+            block_hashes >>= _HALF
+            np.minimum.reduceat(
+                block_hashes, block_starts, out=signatures[i, first:stop]
+            )
+
+    keys = (signatures.T.reshape(-1, BANDS, ROWS) * _BAND_WEIGHTS).sum(axis=2)
+    return keys.view(np.int64), has_buckets
+
+
+def assign_clusters(
+    case_id: UUID,
+    buckets: np.ndarray,
+    has_buckets: np.ndarray,
+    known: Dict[int, NearDuplicateCluster],
+) -> NearDuplicateBatch:
+    """
+    Place each message in the cluster of the first of its buckets already
+    mapped to one, by an earlier message of the batch or in `known`, or start
+    a cluster for it. Its buckets not mapped yet then lead to its cluster, so
+    later near-duplicates of any member join it as well.
+
+    Most messages share no bucket with any other; they start a cluster each
+    without going through the loop.
+    """
+    rows = np.flatnonzero(has_buckets)
+    _, inverse, counts = np.unique(buckets, return_inverse=True, return_counts=True)
+    shared = counts[inverse.reshape(buckets.shape)] > 1
+    if known:
+        shared |= np.isin(buckets, np.fromiter(known, dtype=np.int64, count=len(known)))
+    alone = ~shared.any(axis=1)
+
+    clusters = [ClusterShare(None, [row]) for row in rows[alone].tolist()]
+    bucket_keys = [buckets[alone].ravel()]
+    bucket_clusters = [np.repeat(np.arange(len(clusters)), BANDS)]
+
+    # Known clusters and those started in the loop, by id or by their index
+    mapped: Dict[int, Union[NearDuplicateCluster, int]] = dict(known)
+    indexes: Dict[Union[NearDuplicateCluster, int], int] = {}
+    new_keys: List[int] = []
+    new_clusters: List[int] = []
+    for row, keys in zip(rows[~alone].tolist(), buckets[~alone].tolist()):
+        cluster = next((mapped[key] for key in keys if key in mapped), None)
+        index = indexes.get(cluster)
+        if index is None:
+            index = len(clusters)
+            clusters.append(ClusterShare(cluster, []))
+            if cluster is None:
+                cluster = index
+            indexes[cluster] = index
+        clusters[index].rows.append(row)
+        for key in keys:
+            if key not in mapped:
+                mapped[key] = cluster
+                new_keys.append(key)
+                new_clusters.append(index)
+
+    return NearDuplicateBatch(
+        case_id,
+        clusters,
+        np.concatenate(bucket_keys + [np.array(new_keys, dtype=np.int64)]),
+        np.concatenate(bucket_clusters + [np.array(new_clusters, dtype=np.int64)]),
+    )
+
+
+def resolve_clusters(
+    near_duplicates: NearDuplicateBatch, evidence_id: UUID, message_ids: List[UUID]
+) -> List[NearDuplicateCluster]:
+    """
+    The cluster of each share once the batch's messages, of `evidence_id`,
+    have their ids: clusters the batch started are named after their first.
+    """
+    return [
+        share.cluster or NearDuplicateCluster(message_ids[share.rows[0]], evidence_id)
+        for share in near_duplicates.clusters
+    ]
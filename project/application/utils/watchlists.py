@@ -0,0 +1,42 @@
+from typing import Iterable, List, NamedTuple
+from uuid import UUID
+
+# Shorter terms would hit most messages, longer ones aren't keywords anymore
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 256
+MAX_TERMS = 100_000
+
+
+class WatchlistHit(NamedTuple):
+    """A term of a watchlist found in the payload at position `row` of a batch."""
+
+    row: int
+    watchlist_id: UUID
+    term: str
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercased with whitespace runs collapsed to one space, the way terms are
+    stored, so `John  Doe` on two lines still matches `john doe`.
+    """
+    return " ".join(text.lower().split())
+
+
+def normalize_terms(terms: Iterable[str]) -> List[str]:
+    """
+    Normalized terms without duplicates, in their first order. Raises
+    `ValueError` for a term too short or too long, or too many of them.
+    """
+    normalized = {}
+    for term in terms:
+        term = normalize_text(term)
+        if not MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH:
+            raise ValueError(
+                f"Terms must be {MIN_TERM_LENGTH} to {MAX_TERM_LENGTH} "
+                f"characters long, got {term!r}"
+            )
+        normalized[term] = None
+    if len(normalized) > MAX_TERMS:
+        raise ValueError(f"A watchlist holds at most {MAX_TERMS} terms")
+    return list(normalized)
@@ -57,9 +57,53 @@ class AppInfo:
 @dataclass(frozen=True)
 class EvidenceConfig:
     upload_directory: str = os.getenv("UPLOAD_DIRECTORY", ".uploads")
+    # A batch is loaded once its buffered text reaches `batch_bytes`, or at the
+    # latest after `batch_size` rows
+    batch_bytes: int = int(os.getenv("EVIDENCE_BATCH_BYTES", 8 * 1024 * 1024))
+    batch_size: int = int(os.getenv("EVIDENCE_BATCH_SIZE", 50000))
+    # "copy" streams batches through PostgreSQL COPY, "insert" uses multi-row INSERT
+    bulk_load_method: str = os.getenv("EVIDENCE_BULK_LOAD_METHOD", "copy")
+    # Files larger than this are split into chunks parsed by parallel jobs (0 = off)
+    parallel_chunk_size: int = int(
+        os.getenv("EVIDENCE_PARALLEL_CHUNK_SIZE", 256 * 1024 * 1024)
+    )
+    upload_chunk_size: int = int(os.getenv("EVIDENCE_UPLOAD_CHUNK_SIZE", 1024 * 1024))
+    max_upload_size: int = int(
+        os.getenv("EVIDENCE_MAX_UPLOAD_SIZE", 20 * 1024 * 1024 * 1024)
+    )
+    # LSH buckets of each case's messages, see `LshBucketIndex`
+    near_duplicate_directory: str = os.getenv(
+        "EVIDENCE_NEAR_DUPLICATE_DIRECTORY", ".near_duplicates"
+    )
+    # Compiled watchlists shared by the workers, see `AhoCorasickWatchlistMatcher`
+    watchlist_cache_directory: str = os.getenv(
+        "EVIDENCE_WATCHLIST_CACHE_DIRECTORY", ".watchlists"
+    )
 
     def __post_init__(self):
         os.makedirs(self.upload_directory, exist_ok=True)
+        os.makedirs(self.near_duplicate_directory, exist_ok=True)
+        os.makedirs(self.watchlist_cache_directory, exist_ok=True)
+
+
+# --- Embedding Configuration ---
+@dataclass(frozen=True)
+class EmbeddingConfig:
+    # Name of the message encoder, see `build_message_encoder`
+    encoder: str = os.getenv("EMBEDDING_ENCODER", "hashing")
+    dimensions: int = int(os.getenv("EMBEDDING_DIMENSIONS", 256))
+    # Messages claimed, encoded and written back per transaction
+    batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", 5000))
+    # Jobs dispatched per parsed evidence, each claiming batches of its own
+    parallel_jobs: int = int(os.getenv("EMBEDDING_PARALLEL_JOBS", 4))
+    # Vector index of each evidence, searched by probing the `index_probes`
+    # closest of its `index_lists` lists, see `IvfVectorIndex`
+    index_directory: str = os.getenv("EMBEDDING_INDEX_DIRECTORY", ".indexes")
+    index_lists: int = int(os.getenv("EMBEDDING_INDEX_LISTS", 512))
+    index_probes: int = int(os.getenv("EMBEDDING_INDEX_PROBES", 16))
+
+    def __post_init__(self):
+        os.makedirs(self.index_directory, exist_ok=True)
 
 
 # --- Celery Configuration ---
@@ -70,6 +114,14 @@ class CeleryConfig:
     result_backend: str = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
 
 
+# --- Event Stream Configuration ---
+@dataclass(frozen=True)
+class EventsConfig:
+    # "redis" publishes over the Celery broker, "memory" keeps events in-process
+    backend: str = os.getenv("EVENTS_BACKEND", "redis")
+    heartbeat_interval: int = int(os.getenv("EVENTS_HEARTBEAT_INTERVAL", 15))
+
+
 # --- Main Configuration Container ---
 @dataclass(frozen=True)
 class Settings:
@@ -78,7 +130,9 @@ class Settings:
     fastapi: FastAPIConfig = FastAPIConfig()
     app: AppInfo = AppInfo()
     evidence: EvidenceConfig = EvidenceConfig()
+    embedding: EmbeddingConfig = EmbeddingConfig()
     celery: CeleryConfig = CeleryConfig()
+    events: EventsConfig = EventsConfig()
 
 
 # Shared global instance
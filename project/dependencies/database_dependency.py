@@ -1,8 +1,39 @@
+from project.application.interfaces.event_publisher_interface import (
+    IEventPublisher,
+    IEventSubscriber,
+)
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParserRegistry,
+)
 from project.application.interfaces.file_storage_interface import IFileStorage
 from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
+from project.application.interfaces.message_encoder_interface import IMessageEncoder
+from project.application.interfaces.near_duplicate_index_interface import (
+    INearDuplicateIndex,
+)
+from project.application.interfaces.vector_index_interface import IVectorIndex
+from project.application.interfaces.watchlist_matcher_interface import IWatchlistMatcher
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.core.config import settings
 from project.infrastructure.celery_tasks.celery_app import CeleryJobDispatcher
 from project.infrastructure.database.session import AsyncSessionLocal, SessionLocal
+from project.infrastructure.encoders.encoder_registry import build_message_encoder
+from project.infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from project.infrastructure.events.redis_event_bus import (
+    RedisEventPublisher,
+    RedisEventSubscriber,
+)
 from project.infrastructure.file_storage.local_storage_service import LocalFileStorage
+from project.infrastructure.near_duplicate_index.lsh_bucket_index import LshBucketIndex
+from project.infrastructure.parsers.parser_registry import build_parser_registry
+from project.infrastructure.vector_index.ivf_vector_index import IvfVectorIndex
+from project.infrastructure.watchlists.aho_corasick_matcher import (
+    AhoCorasickWatchlistMatcher,
+)
+
+in_memory_event_bus = InMemoryEventBus()
 
 
 async def get_async_db():
@@ -21,3 +52,43 @@ def get_file_storage() -> IFileStorage:
 
 def get_job_dispatcher() -> IJobDispatcher:
     return CeleryJobDispatcher()
+
+
+def get_parser_registry() -> IEvidenceParserRegistry:
+    return build_parser_registry()
+
+
+def get_message_encoder() -> IMessageEncoder:
+    return build_message_encoder(
+        settings.embedding.encoder, settings.embedding.dimensions
+    )
+
+
+def get_vector_index() -> IVectorIndex:
+    return IvfVectorIndex(
+        settings.embedding.index_directory,
+        lists=settings.embedding.index_lists,
+        probes=settings.embedding.index_probes,
+    )
+
+
+def get_near_duplicate_index() -> INearDuplicateIndex:
+    return LshBucketIndex(settings.evidence.near_duplicate_directory)
+
+
+def get_watchlist_matcher(watchlist_repo: IWatchlistRepository) -> IWatchlistMatcher:
+    return AhoCorasickWatchlistMatcher(
+        watchlist_repo, settings.evidence.watchlist_cache_directory
+    )
+
+
+def get_event_publisher() -> IEventPublisher:
+    if settings.events.backend == "memory":
+        return in_memory_event_bus
+    return RedisEventPublisher()
+
+
+def get_event_subscriber() -> IEventSubscriber:
+    if settings.events.backend == "memory":
+        return in_memory_event_bus
+    return RedisEventSubscriber()
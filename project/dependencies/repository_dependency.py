@@ -1,16 +1,40 @@
 from fastapi import Depends
 
 from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.communication_graph_repository_interface import (
+    ICommunicationGraphRepository,
+)
 from project.application.interfaces.evidence_repository_interface import (
     IEvidenceRepository,
 )
 from project.application.interfaces.group_repository_interface import IGroupRepository
+from project.application.interfaces.indicator_repository_interface import (
+    IIndicatorRepository,
+)
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.interfaces.near_duplicate_repository_interface import (
+    INearDuplicateRepository,
+)
 from project.application.interfaces.user_repository_interface import IUserRepository
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
 from project.dependencies.database_dependency import get_async_db
 from project.infrastructure.repositories.case_repository import CaseRepository
+from project.infrastructure.repositories.communication_graph_repository import (
+    CommunicationGraphRepository,
+)
 from project.infrastructure.repositories.evidence_repository import EvidenceRepository
 from project.infrastructure.repositories.group_repository import GroupRepository
+from project.infrastructure.repositories.indicator_repository import IndicatorRepository
+from project.infrastructure.repositories.message_repository import MessageRepository
+from project.infrastructure.repositories.near_duplicate_repository import (
+    NearDuplicateRepository,
+)
 from project.infrastructure.repositories.user_repository import UserRepository
+from project.infrastructure.repositories.watchlist_repository import WatchlistRepository
 
 
 async def get_user_repo(db=Depends(get_async_db)) -> IUserRepository:
@@ -27,3 +51,27 @@ async def get_evidence_repo(db=Depends(get_async_db)) -> IEvidenceRepository:
 
 async def get_group_repo(db=Depends(get_async_db)) -> IGroupRepository:
     return GroupRepository(db)
+
+
+async def get_message_repo(db=Depends(get_async_db)) -> IMessageRepository:
+    return MessageRepository(db)
+
+
+async def get_communication_graph_repo(
+    db=Depends(get_async_db),
+) -> ICommunicationGraphRepository:
+    return CommunicationGraphRepository(db)
+
+
+async def get_indicator_repo(db=Depends(get_async_db)) -> IIndicatorRepository:
+    return IndicatorRepository(db)
+
+
+async def get_near_duplicate_repo(
+    db=Depends(get_async_db),
+) -> INearDuplicateRepository:
+    return NearDuplicateRepository(db)
+
+
+async def get_watchlist_repo(db=Depends(get_async_db)) -> IWatchlistRepository:
+    return WatchlistRepository(db)
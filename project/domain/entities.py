@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from project.domain.enums import CaseStatus, EvidenceStatus, UserRole
+from project.domain.enums import CaseStatus, EvidenceStatus, MessageStatus, UserRole
 
 
 @dataclass
@@ -36,10 +36,60 @@ class EvidenceEntity:
     format: str
     metadata: Dict[str, Any]
     attributes: List[str]
+    content_hash: Optional[str] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 
+@dataclass
+class StoredFileEntity:
+    path: str
+    filename: str
+    size: int
+    sha256: str
+    content_type: Optional[str] = None
+
+
+@dataclass
+class IngestionCheckpointEntity:
+    evidence_id: UUID
+    chunk_start: int
+    byte_offset: int
+    chunk_end: Optional[int] = None
+    row_count: int = 0
+    rejected_count: int = 0
+    last_message_id: Optional[UUID] = None
+    completed: bool = False
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class QuarantinedRowEntity:
+    evidence_id: UUID
+    reason: str
+    line_number: Optional[int] = None
+    byte_offset: Optional[int] = None
+    raw: Optional[str] = None
+    id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass
+class EvidenceProgressEntity:
+    evidence_id: UUID
+    case_id: UUID
+    status: EvidenceStatus
+    total_bytes: int
+    bytes_processed: int
+    rows_processed: int
+    rows_rejected: int
+    chunks_total: int
+    chunks_completed: int
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 @dataclass
 class CaseEntity:
     id: UUID
@@ -61,12 +111,27 @@ class MessageEntity:
     sender: str
     receiver: str
     payload: str
-    status: EvidenceStatus
+    status: MessageStatus
     embeddings: List[float] = None
+    # Values of the evidence's extra columns, in the order of its `attributes`
+    attributes: Optional[List[Optional[str]]] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 
+@dataclass
+class CommunicationEdgeEntity:
+    """Messages one participant sent another within an evidence."""
+
+    case_id: UUID
+    evidence_id: UUID
+    sender: str
+    receiver: str
+    message_count: int
+    first_seen: Optional[datetime] = None
+    last_seen: Optional[datetime] = None
+
+
 @dataclass
 class CollectionEntity:
     id: UUID
@@ -119,3 +184,18 @@ class SharedCaseGroupEntity:
     case_id: UUID
     group_id: UUID
     created_at: Optional[datetime] = None
+
+
+@dataclass
+class WatchlistEntity:
+    id: UUID
+    user_id: UUID
+    name: str
+    # Normalized, see `normalize_terms`; unset when listed without them
+    terms: Optional[List[str]] = None
+    # Watched in this case only, or in every case of the user when unset
+    case_id: Optional[UUID] = None
+    revision: int = 1
+    term_count: int = 0
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
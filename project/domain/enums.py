@@ -15,6 +15,8 @@ class CaseStatus(str, Enum):
 class EvidenceFormat(str, Enum):
     CSV = "csv"
     EXCEL = "excel"
+    JSONL = "jsonl"
+    ZIP = "zip"
 
 
 class EvidenceStatus(str, Enum):
@@ -27,3 +29,16 @@ class EvidenceStatus(str, Enum):
 class MessageStatus(str, Enum):
     PROCESSING = "processing"
     EMBEDDED = "embedded"
+
+
+class IndicatorKind(str, Enum):
+    IPV4 = "ipv4"
+    IPV6 = "ipv6"
+    DOMAIN = "domain"
+    URL = "url"
+    EMAIL = "email"
+    MD5 = "md5"
+    SHA1 = "sha1"
+    SHA256 = "sha256"
+    BITCOIN = "bitcoin"
+    ETHEREUM = "ethereum"
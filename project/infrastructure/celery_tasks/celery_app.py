@@ -1,4 +1,4 @@
-from celery import Celery
+from celery import Celery, chord
 
 from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
 from project.core.config import settings
@@ -14,5 +14,17 @@ celery.autodiscover_tasks(["project.infrastructure.celery_tasks"])
 
 class CeleryJobDispatcher(IJobDispatcher):
 
-    def dispatch(self, job_name: str, payload: dict):
-        celery.send_task(job_name, args=[payload])
+    def dispatch(self, job_name: str, payload: dict) -> str:
+        return celery.send_task(job_name, args=[payload]).id
+
+    def dispatch_chord(
+        self,
+        job_name: str,
+        payloads: list,
+        callback_job_name: str,
+        callback_payload: dict,
+    ) -> str:
+        header = [celery.signature(job_name, args=[payload]) for payload in payloads]
+        # The callback is called as callback(results, callback_payload)
+        callback = celery.signature(callback_job_name, args=[callback_payload])
+        return chord(header)(callback).id
@@ -1,23 +1,210 @@
+from project.application.use_cases.embed_messages import EmbedMessagesUseCase
 from project.application.use_cases.parse_evidence import ParseEvidencesUseCase
-from project.dependencies.database_dependency import get_sync_db
-from project.infrastructure.celery_tasks.celery_app import celery
+from project.dependencies.database_dependency import (
+    get_event_publisher,
+    get_message_encoder,
+    get_near_duplicate_index,
+    get_parser_registry,
+    get_sync_db,
+    get_vector_index,
+    get_watchlist_matcher,
+)
+from project.infrastructure.celery_tasks.celery_app import CeleryJobDispatcher, celery
+from project.infrastructure.repositories.communication_graph_repository import (
+    CommunicationGraphRepository,
+)
 from project.infrastructure.repositories.evidence_repository import EvidenceRepository
+from project.infrastructure.repositories.indicator_repository import IndicatorRepository
+from project.infrastructure.repositories.message_embedding_repository import (
+    MessageEmbeddingRepository,
+)
+from project.infrastructure.repositories.near_duplicate_repository import (
+    NearDuplicateRepository,
+)
+from project.infrastructure.repositories.watchlist_repository import WatchlistRepository
 
 
-@celery.task(name="parse_evidence_file")
+def ingest_repositories(db) -> dict:
+    """
+    The repositories a parse writes a batch through, on the one session so
+    the batch commits at once, with the watchlist matcher reading the terms.
+    """
+    watchlist_repository = WatchlistRepository(db)
+    return {
+        "evidence_repository": EvidenceRepository(db),
+        "communication_graph_repository": CommunicationGraphRepository(db),
+        "indicator_repository": IndicatorRepository(db),
+        "near_duplicate_repository": NearDuplicateRepository(db),
+        "watchlist_repository": watchlist_repository,
+        "watchlist_matcher": get_watchlist_matcher(watchlist_repository),
+    }
+
+
+# Acknowledge only once a task has finished, so that a job whose worker dies
+# mid-file is redelivered and resumes from its last committed checkpoint.
+@celery.task(name="parse_evidence_file", acks_late=True, reject_on_worker_lost=True)
 def parse_evidence_file(payload: dict):
     """
     Celery background task to parse uploaded evidence files.
     """
     print(f"Receiving payload: {payload}")
     db = get_sync_db()
-    repo = EvidenceRepository(db)
 
     case_id = payload["case_id"]
     file_path = payload["file_path"]
 
     use_case = ParseEvidencesUseCase(
-        evidence_repository=repo,
+        parser_registry=get_parser_registry(),
+        job_dispatcher=CeleryJobDispatcher(),
+        event_publisher=get_event_publisher(),
+        near_duplicate_index=get_near_duplicate_index(),
+        **ingest_repositories(db),
+    )
+
+    try:
+        return use_case.execute(
+            case_id=case_id,
+            file_path=file_path,
+            evidence_id=payload.get("evidence_id"),
+            metadata=payload.get("metadata"),
+        )
+    finally:
+        db.close()
+
+
+@celery.task(name="clone_evidence", acks_late=True, reject_on_worker_lost=True)
+def clone_evidence(payload: dict):
+    """
+    Celery background task to reuse the messages of an identical, already
+    parsed upload for a new evidence.
+    """
+    print(f"Receiving payload: {payload}")
+    db = get_sync_db()
+    use_case = ParseEvidencesUseCase(
+        evidence_repository=EvidenceRepository(db),
+        parser_registry=get_parser_registry(),
+        job_dispatcher=CeleryJobDispatcher(),
+        event_publisher=get_event_publisher(),
+        communication_graph_repository=CommunicationGraphRepository(db),
+    )
+
+    try:
+        return use_case.clone(
+            case_id=payload["case_id"],
+            file_path=payload["file_path"],
+            source_evidence_id=payload["source_evidence_id"],
+            evidence_id=payload.get("evidence_id"),
+            metadata=payload.get("metadata"),
+        )
+    finally:
+        db.close()
+
+
+@celery.task(name="parse_evidence_chunk", acks_late=True, reject_on_worker_lost=True)
+def parse_evidence_chunk(payload: dict):
+    """
+    Celery background task to parse one byte range of a large evidence file.
+    """
+    db = get_sync_db()
+    use_case = ParseEvidencesUseCase(
+        parser_registry=get_parser_registry(),
+        event_publisher=get_event_publisher(),
+        near_duplicate_index=get_near_duplicate_index(),
+        **ingest_repositories(db),
+    )
+
+    try:
+        return use_case.execute_chunk(
+            evidence_id=payload["evidence_id"],
+            file_path=payload["file_path"],
+            start=payload["start"],
+            end=payload["end"],
+        )
+    finally:
+        db.close()
+
+
+@celery.task(name="finalize_evidence_parse")
+def finalize_evidence_parse(chunk_results: list, payload: dict):
+    """
+    Chord callback run once every chunk of an evidence file has been parsed.
+    """
+    db = get_sync_db()
+    use_case = ParseEvidencesUseCase(
+        evidence_repository=EvidenceRepository(db),
+        parser_registry=get_parser_registry(),
+        job_dispatcher=CeleryJobDispatcher(),
+        event_publisher=get_event_publisher(),
+    )
+
+    try:
+        return use_case.finalize(
+            evidence_id=payload["evidence_id"], chunk_results=chunk_results
+        )
+    finally:
+        db.close()
+
+
+@celery.task(
+    name="rebuild_communication_components",
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def rebuild_communication_components(payload: dict):
+    """
+    Celery background task to compute the connected components of a case's
+    communication graph again once one of its evidences is deleted.
+    """
+    db = get_sync_db()
+    try:
+        CommunicationGraphRepository(db).rebuild_components(payload["case_id"])
+    finally:
+        db.close()
+
+
+# Redelivered if its worker dies, the messages it had claimed are unlocked by
+# then and left to whichever job claims them next
+@celery.task(name="embed_messages", acks_late=True, reject_on_worker_lost=True)
+def embed_messages(payload: dict):
+    """
+    Celery background task to embed the messages not embedded yet, of the
+    payload's evidence or of any evidence.
+    """
+    db = get_sync_db()
+    use_case = EmbedMessagesUseCase(
+        embedding_repository=MessageEmbeddingRepository(db),
+        encoder=get_message_encoder(),
+        vector_index=get_vector_index(),
+    )
+
+    try:
+        return use_case.execute(
+            evidence_id=payload.get("evidence_id"),
+            batch_size=payload.get("batch_size"),
+        )
+    finally:
+        db.close()
+
+
+@celery.task(
+    name="index_message_embeddings", acks_late=True, reject_on_worker_lost=True
+)
+def index_message_embeddings(payload: dict):
+    """
+    Celery background task to index the messages of the payload's evidence
+    that were embedded before it existed, such as those of a cloned upload.
+    """
+    db = get_sync_db()
+    use_case = EmbedMessagesUseCase(
+        embedding_repository=MessageEmbeddingRepository(db),
+        encoder=get_message_encoder(),
+        vector_index=get_vector_index(),
     )
 
-    use_case.execute(case_id=case_id, file_path=file_path)
+    try:
+        return use_case.index_evidence(
+            evidence_id=payload["evidence_id"],
+            batch_size=payload.get("batch_size"),
+        )
+    finally:
+        db.close()
@@ -1,10 +1,33 @@
-import uuid
-
-from sqlalchemy import JSON, UUID, Column, DateTime, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import backref, declarative_base, declarative_mixin, relationship
-
-from project.domain.enums import UserRole
+import re
+
+from sqlalchemy import (
+    JSON,
+    UUID,
+    BigInteger,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+    desc,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import (
+    backref,
+    declarative_base,
+    declarative_mixin,
+    deferred,
+    relationship,
+)
+
+from project.application.utils.uuid7 import uuid7
+from project.domain.enums import MessageStatus, UserRole
 
 Base = declarative_base()
 
@@ -16,7 +39,8 @@ schema_args = {"schema": schema_name}
 class CommonModelMixin:
     """Shared base fields for all models."""
 
-    id = Column(UUID, primary_key=True, default=uuid.uuid4)
+    # Time-ordered, so new rows append to the primary key index
+    id = Column(UUID, primary_key=True, default=uuid7)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -47,7 +71,9 @@ class CaseModel(CommonModelMixin, Base):
     __tablename__ = "cases"
     __table_args__ = schema_args
 
-    user_id = Column(UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False)
+    user_id = Column(
+        UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False, index=True
+    )
     title = Column(String, nullable=False)
     status = Column(String, nullable=False)
     description = Column(String, nullable=True)
@@ -69,26 +95,383 @@ class EvidenceModel(CommonModelMixin, Base):
     __tablename__ = "evidences"
     __table_args__ = schema_args
 
-    case_id = Column(UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False)
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False, index=True
+    )
     source = Column(String, nullable=False)
     format = Column(String, nullable=False)
     status = Column(String, nullable=False)
     metadata_json = Column("metadata", JSONB, nullable=True)
     attributes = Column(ARRAY(String), nullable=True)
+    # SHA-256 of the stored blob, used to reuse already parsed uploads
+    content_hash = Column(String(64), nullable=True, index=True)
+
+
+# The messages table is hash-partitioned by evidence into this many partitions,
+# named `messages_p<remainder>` and created by the migrations
+MESSAGE_PARTITIONS = 16
+MESSAGE_PARTITION_PATTERN = re.compile(r"^messages_p\d+$")
+
+# Payloads are indexed verbatim, without stemming or stop words, so handles,
+# hosts and hashes match as written. Only their head is indexed, a tsvector
+# is capped at 1 MB and an overflow would fail the whole ingestion batch.
+MESSAGE_SEARCH_CONFIG = "simple"
+MESSAGE_SEARCH_MAX_CHARS = 100_000
 
 
 class MessageModel(CommonModelMixin, Base):
+    """
+    Every message of an evidence lives in the same partition, and the primary
+    key leads with the evidence, so per-evidence scans and deletes only touch
+    one partition and one key range of its index. Messages are paged through
+    in `(evidence_id, id)` order.
+    """
+
     __tablename__ = "messages"
-    __table_args__ = schema_args
+    __table_args__ = (
+        # Keyset pages of an evidence filtered on a participant
+        Index("ix_security_platform_messages_sender", "evidence_id", "sender", "id"),
+        Index(
+            "ix_security_platform_messages_receiver", "evidence_id", "receiver", "id"
+        ),
+        Index(
+            "ix_security_platform_messages_payload_tsv",
+            "payload_tsv",
+            postgresql_using="gin",
+        ),
+        # Messages left to embed, claimed in key order by the embedding jobs
+        Index(
+            "ix_security_platform_messages_pending_embedding",
+            "evidence_id",
+            "id",
+            postgresql_where=text(f"status = '{MessageStatus.PROCESSING.value}'"),
+        ),
+        {"postgresql_partition_by": "HASH (evidence_id)", **schema_args},
+    )
 
+    # Declared before the mixin's `id`, so the primary key is (evidence_id, id)
     evidence_id = Column(
-        UUID, ForeignKey(f"{schema_name}.evidences.id"), nullable=False
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        primary_key=True,
     )
     sender = Column(String, nullable=False)
     receiver = Column(String, nullable=False)
     payload = Column(String, nullable=False)
     status = Column(String, nullable=False)
-    embeddings = Column(JSON, nullable=True)
+    # Raw float32 values of the message's vector, see `decode_embedding`
+    embeddings = Column(LargeBinary, nullable=True)
+    # Extra columns of the source file, named by the evidence's `attributes`
+    attributes = Column(JSON, nullable=True)
+    # Kept up to date by PostgreSQL, never loaded with the row
+    payload_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"to_tsvector('{MESSAGE_SEARCH_CONFIG}'::regconfig, "
+                f"left(payload, {MESSAGE_SEARCH_MAX_CHARS}))",
+                persisted=True,
+            ),
+        )
+    )
+
+
+class IngestionCheckpointModel(CommonModelMixin, Base):
+    """Progress of one byte range of an evidence file, committed with each batch."""
+
+    __tablename__ = "ingestion_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("evidence_id", "chunk_start"),
+        schema_args,
+    )
+
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    chunk_start = Column(BigInteger, nullable=False)
+    chunk_end = Column(BigInteger, nullable=True)
+    byte_offset = Column(BigInteger, nullable=False)
+    row_count = Column(BigInteger, nullable=False, default=0)
+    rejected_count = Column(BigInteger, nullable=False, default=0, server_default="0")
+    last_message_id = Column(UUID, nullable=True)
+    completed = Column(Boolean, nullable=False, default=False)
+
+
+class QuarantinedRowModel(CommonModelMixin, Base):
+    """An evidence record that could not be loaded, with where and why."""
+
+    __tablename__ = "quarantined_rows"
+    __table_args__ = schema_args
+
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    line_number = Column(BigInteger, nullable=True)
+    byte_offset = Column(BigInteger, nullable=True)
+    reason = Column(String, nullable=False)
+    raw = Column(String, nullable=True)
+
+
+class CommunicationEdgeModel(CommonModelMixin, Base):
+    """
+    Communication graph of a case, aggregated at ingest time: how many
+    messages a sender sent a receiver in one evidence, and when the first and
+    last of them were loaded. Kept per evidence so deleting or cloning an
+    evidence deletes or copies its share of the graph.
+    """
+
+    __tablename__ = "communication_edges"
+    __table_args__ = (
+        UniqueConstraint("evidence_id", "sender", "receiver"),
+        # Edges of a case by either end, for talkers, ego networks and components
+        Index("ix_security_platform_communication_edges_sender", "case_id", "sender"),
+        Index(
+            "ix_security_platform_communication_edges_receiver", "case_id", "receiver"
+        ),
+        schema_args,
+    )
+
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"), nullable=False
+    )
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    sender = Column(String, nullable=False)
+    receiver = Column(String, nullable=False)
+    message_count = Column(BigInteger, nullable=False)
+    first_seen = Column(DateTime(timezone=True), nullable=False)
+    last_seen = Column(DateTime(timezone=True), nullable=False)
+
+
+class CommunicationComponentModel(CommonModelMixin, Base):
+    """
+    Connected component of a case's communication graph, maintained at
+    ingest time: batches merge the components their edges join, an evidence
+    deleted has its case's components rebuilt from the edges left.
+    """
+
+    __tablename__ = "communication_components"
+    __table_args__ = (
+        # Largest components of a case first, read backward
+        Index(
+            "ix_security_platform_communication_components_case_id",
+            "case_id",
+            "size",
+            "message_count",
+            "id",
+        ),
+        schema_args,
+    )
+
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"), nullable=False
+    )
+    size = Column(BigInteger, nullable=False)
+    message_count = Column(BigInteger, nullable=False)
+
+
+class CommunicationParticipantModel(CommonModelMixin, Base):
+    """
+    Every participant of a case's communication graph: its component, and the
+    messages it sent and received, its contacts and when its first and last
+    edges were loaded, summed over the case's evidences at ingest time.
+    """
+
+    __tablename__ = "communication_participants"
+    __table_args__ = (
+        UniqueConstraint("case_id", "participant"),
+        # Members of a component, to list them or relabel them on a merge
+        Index(
+            "ix_security_platform_communication_participants_component_id",
+            "component_id",
+            "participant",
+        ),
+        # Busiest participants of a case first, ties by name
+        Index(
+            "ix_security_platform_communication_participants_message_count",
+            "case_id",
+            desc("message_count"),
+            "participant",
+        ),
+        schema_args,
+    )
+
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"), nullable=False
+    )
+    participant = Column(String, nullable=False)
+    component_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.communication_components.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    sent = Column(BigInteger, nullable=False, server_default="0")
+    received = Column(BigInteger, nullable=False, server_default="0")
+    message_count = Column(BigInteger, Computed("sent + received", persisted=True))
+    # Participants it exchanged messages with, itself included if it messaged
+    # itself, see `CommunicationContactModel`
+    contacts = Column(BigInteger, nullable=False, server_default="0")
+    first_seen = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_seen = Column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+class CommunicationContactModel(CommonModelMixin, Base):
+    """
+    Two participants of a case that exchanged messages, either way, stored
+    once with the lesser name first. Inserting the pairs of a batch tells
+    which are new to the case, each adding a contact to both participants.
+    """
+
+    __tablename__ = "communication_contacts"
+    __table_args__ = (
+        UniqueConstraint("case_id", "participant", "contact"),
+        schema_args,
+    )
+
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"), nullable=False
+    )
+    participant = Column(String, nullable=False)
+    contact = Column(String, nullable=False)
+
+
+class IndicatorModel(CommonModelMixin, Base):
+    """
+    An indicator of compromise extracted from message payloads, stored once
+    per normalized kind and value. Its id is derived from both, see
+    `indicator_id`, so ingestion workers never look it up.
+    """
+
+    __tablename__ = "indicators"
+    __table_args__ = (
+        Index("ix_security_platform_indicators_value", "value"),
+        schema_args,
+    )
+
+    kind = Column(String, nullable=False)
+    value = Column(String, nullable=False)
+
+
+class MessageIndicatorModel(CommonModelMixin, Base):
+    """A message mentioning an indicator, recorded at ingest time."""
+
+    __tablename__ = "message_indicators"
+    __table_args__ = (
+        # Deleting an evidence deletes its mentions by cascade
+        Index("ix_security_platform_message_indicators_evidence_id", "evidence_id"),
+        schema_args,
+    )
+
+    # Declared before the mixin's `id`, so the primary key leads with the
+    # indicator and finds every mention of it, evidence by evidence. Not a
+    # foreign key: indicators are written just before their mentions and never
+    # deleted, and checking every row would cost more than inserting it.
+    indicator_id = Column(UUID, primary_key=True)
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    message_id = Column(UUID, primary_key=True)
+
+
+class NearDuplicateClusterModel(CommonModelMixin, Base):
+    """
+    How many messages of an evidence fall into a near-duplicate cluster of its
+    case, counted at ingest time. Only clusters of more than one message have
+    rows, the buckets leading to the others are kept in the near-duplicate
+    index. A cluster is named after its first message, and counted per
+    evidence so deleting or cloning an evidence deletes or copies its share.
+    """
+
+    __tablename__ = "near_duplicate_clusters"
+    __table_args__ = (
+        # Also lists the clusters of a case in order, for summing their shares
+        UniqueConstraint("case_id", "cluster_id", "evidence_id"),
+        # Deleting an evidence deletes its shares by cascade
+        Index(
+            "ix_security_platform_near_duplicate_clusters_evidence_id", "evidence_id"
+        ),
+        schema_args,
+    )
+
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"), nullable=False
+    )
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    cluster_id = Column(UUID, nullable=False)
+    message_count = Column(BigInteger, nullable=False)
+    # First message of the evidence in the cluster
+    sample_message_id = Column(UUID, nullable=False)
+
+
+class WatchlistModel(CommonModelMixin, Base):
+    """
+    Terms matched against the payloads of every message ingested into its
+    case, or into every case of its user when it has none.
+    """
+
+    __tablename__ = "watchlists"
+    __table_args__ = schema_args
+
+    user_id = Column(
+        UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False, index=True
+    )
+    case_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.cases.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    name = Column(String, nullable=False)
+    terms = Column(ARRAY(String), nullable=False)
+    # Bumped whenever the terms change, compiled matchers are cached by it
+    revision = Column(BigInteger, nullable=False, default=1)
+
+
+class WatchlistHitModel(CommonModelMixin, Base):
+    """A message containing a term of a watchlist, recorded at ingest time."""
+
+    __tablename__ = "watchlist_hits"
+    __table_args__ = (
+        # The hits of a watchlist, deleted with it, and its pages of messages
+        Index(
+            "ix_security_platform_watchlist_hits_watchlist_id",
+            "watchlist_id",
+            "evidence_id",
+            "message_id",
+        ),
+        schema_args,
+    )
+
+    # Declared before the mixin's `id`, so the primary key pages through the
+    # hits of an evidence in message order. Deleting the evidence deletes them
+    # by cascade. Not a foreign key to the watchlist: one deleted while a
+    # batch is matched must not fail the batch, its hits are deleted with it.
+    evidence_id = Column(
+        UUID,
+        ForeignKey(f"{schema_name}.evidences.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    message_id = Column(UUID, primary_key=True)
+    watchlist_id = Column(UUID, nullable=False)
+    term = Column(String, nullable=False)
 
 
 class CollectionModel(CommonModelMixin, Base):
@@ -105,11 +488,17 @@ class CollectionModel(CommonModelMixin, Base):
     )
 
 
+# Association tables are unique on their pair, which also indexes lookups by its
+# leading column; the other column gets an index of its own
+
+
 class CaseCollectionAssociationModel(CommonModelMixin, Base):
     __tablename__ = "case_collection_associations"
-    __table_args__ = schema_args
+    __table_args__ = (UniqueConstraint("collection_id", "case_id"), schema_args)
 
-    case_id = Column(UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False)
+    case_id = Column(
+        UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False, index=True
+    )
     collection_id = Column(
         UUID, ForeignKey(f"{schema_name}.collections.id"), nullable=False
     )
@@ -130,23 +519,29 @@ class GroupModel(CommonModelMixin, Base):
 
 class UserGroupAssociationModel(CommonModelMixin, Base):
     __tablename__ = "user_group_associations"
-    __table_args__ = schema_args
+    __table_args__ = (UniqueConstraint("user_id", "group_id"), schema_args)
 
     user_id = Column(UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False)
-    group_id = Column(UUID, ForeignKey(f"{schema_name}.groups.id"), nullable=False)
+    group_id = Column(
+        UUID, ForeignKey(f"{schema_name}.groups.id"), nullable=False, index=True
+    )
 
 
 class SharedCaseUserModel(CommonModelMixin, Base):
     __tablename__ = "shared_case_users"
-    __table_args__ = schema_args
+    __table_args__ = (UniqueConstraint("case_id", "user_id"), schema_args)
 
     case_id = Column(UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False)
-    user_id = Column(UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False)
+    user_id = Column(
+        UUID, ForeignKey(f"{schema_name}.users.id"), nullable=False, index=True
+    )
 
 
 class SharedCaseGroupModel(CommonModelMixin, Base):
     __tablename__ = "shared_case_groups"
-    __table_args__ = schema_args
+    __table_args__ = (UniqueConstraint("case_id", "group_id"), schema_args)
 
     case_id = Column(UUID, ForeignKey(f"{schema_name}.cases.id"), nullable=False)
-    group_id = Column(UUID, ForeignKey(f"{schema_name}.groups.id"), nullable=False)
+    group_id = Column(
+        UUID, ForeignKey(f"{schema_name}.groups.id"), nullable=False, index=True
+    )
@@ -0,0 +1,14 @@
+from project.application.interfaces.message_encoder_interface import IMessageEncoder
+from project.infrastructure.encoders.hashing_encoder import HashingEncoder
+
+MESSAGE_ENCODERS = {
+    "hashing": HashingEncoder,
+}
+
+
+def build_message_encoder(name: str, dimensions: int) -> IMessageEncoder:
+    encoder = MESSAGE_ENCODERS.get(name)
+    if encoder is None:
+        choices = ", ".join(MESSAGE_ENCODERS)
+        raise ValueError(f"Unknown message encoder: {name}. Choose from {choices}")
+    return encoder(dimensions=dimensions)
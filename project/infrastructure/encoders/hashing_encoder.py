@@ -0,0 +1,93 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from project.application.interfaces.message_encoder_interface import IMessageEncoder
+
+_PRIME = np.uint64(0x100000001B3)
+# Finalizer of MurmurHash3, spreads the n-gram hashes over every bit
+_MIX_1 = np.uint64(0xFF51AFD7ED558CCD)
+_MIX_2 = np.uint64(0xC4CEB9FE1A85EC53)
+_SHIFT = np.uint64(33)
+_HALF = np.uint64(32)
+_SIGN_BIT = np.uint64(31)
+_ONE = np.uint64(1)
+
+
+class HashingEncoder(IMessageEncoder):
+    """
+    Bag of character n-grams hashed straight into `dimensions` signed buckets,
+    a random projection of the n-gram counts that needs no vocabulary, model
+    or network. Counts are damped logarithmically, so a repeated n-gram
+    doesn't drown out the rest of the text.
+
+    The whole batch is hashed at once with NumPy: the texts are laid end to end
+    as UTF-8 bytes and the n-grams of every position computed in a few array
+    operations, then summed per text and bucket with one `bincount`.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = 256,
+        ngram_sizes: Tuple[int, ...] = (3, 4, 5),
+        max_chars: int = 10_000,
+    ):
+        self.dimensions = dimensions
+        self.ngram_sizes = ngram_sizes
+        # Only the head of longer texts is encoded, bounding a batch's cost
+        self.max_chars = max_chars
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        count = len(texts)
+        if not count:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+
+        # Lowercased with whitespace collapsed, padded so edge words form n-grams
+        encoded = [
+            f" {' '.join(text[: self.max_chars].lower().split())} ".encode("utf-8")
+            for text in texts
+        ]
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=count)
+        text_of = np.repeat(np.arange(count, dtype=np.int64), lengths)
+
+        dimensions = np.uint64(self.dimensions)
+        sums = np.zeros(count * self.dimensions, dtype=np.float64)
+        # Hash of the n-gram starting at each position, grown a byte at a time
+        # so the sizes share the work
+        prefixes = data
+        length = 1
+        for size in sorted(self.ngram_sizes):
+            if len(data) < size:
+                break
+            while length < size:
+                prefixes = prefixes[:-1] * _PRIME + data[length:]
+                length += 1
+
+            hashes = prefixes ^ np.uint64(size)
+            hashes ^= hashes >> _SHIFT
+            hashes *= _MIX_1
+            hashes ^= hashes >> _SHIFT
+            hashes *= _MIX_2
+            hashes ^= hashes >> _SHIFT
+
+            # N-grams straddling two texts are dropped
+            positions = len(hashes)
+            inside = text_of[:positions] == text_of[-positions:]
+            hashes = hashes[inside]
+            # Bucket from the high half by multiply-shift, sign from the low half
+            buckets = ((hashes >> _HALF) * dimensions) >> _HALF
+            signs = 1.0 - 2.0 * ((hashes >> _SIGN_BIT) & _ONE).astype(np.float64)
+            sums += np.bincount(
+                text_of[:positions][inside] * self.dimensions
+                + buckets.astype(np.int64),
+                weights=signs,
+                minlength=count * self.dimensions,
+            )
+
+        vectors = (np.sign(sums) * np.log1p(np.abs(sums))).reshape(
+            count, self.dimensions
+        )
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
+        return vectors.astype(np.float32)
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+from collections import defaultdict
+
+from project.application.interfaces.event_publisher_interface import (
+    IEventPublisher,
+    IEventSubscriber,
+)
+
+
+class InMemoryEventBus(IEventPublisher, IEventSubscriber):
+    """
+    Process-local stand-in for the Redis event bus, used in tests and single
+    process setups. Publishing is safe from any thread.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = defaultdict(set)
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self.lock:
+            subscribers = list(self.subscribers[channel])
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    async def subscribe(self, channel: str, timeout: float):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue())
+        with self.lock:
+            self.subscribers[channel].add(subscriber)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(subscriber[1].get(), timeout)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self.lock:
+                self.subscribers[channel].discard(subscriber)
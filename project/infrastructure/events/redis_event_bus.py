@@ -0,0 +1,46 @@
+import json
+import logging
+
+import redis
+import redis.asyncio as aioredis
+
+from project.application.interfaces.event_publisher_interface import (
+    IEventPublisher,
+    IEventSubscriber,
+)
+from project.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisEventPublisher(IEventPublisher):
+    """Publishes events over Redis pub/sub on the Celery broker."""
+
+    def __init__(self, url: str = settings.celery.broker_url):
+        self.client = redis.Redis.from_url(url)
+
+    def publish(self, channel: str, event: dict) -> None:
+        try:
+            self.client.publish(channel, json.dumps(event, default=str))
+        except redis.RedisError as e:
+            logger.warning("Could not publish event on %s: %s", channel, e)
+
+
+class RedisEventSubscriber(IEventSubscriber):
+    def __init__(self, url: str = settings.celery.broker_url):
+        self.url = url
+
+    async def subscribe(self, channel: str, timeout: float):
+        client = aioredis.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=timeout
+                )
+                yield json.loads(message["data"]) if message else None
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.close()
+            await client.close()
@@ -20,3 +20,15 @@ class DuplicateAssociationError(RepositoryError):
     """Raised when the case is already part of the collection."""
 
     pass
+
+
+class StorageError(Exception):
+    """Base exception for file storage operations."""
+
+    pass
+
+
+class FileTooLargeError(StorageError):
+    """Raised when an uploaded file exceeds the configured maximum size."""
+
+    pass
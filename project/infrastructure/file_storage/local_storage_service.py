@@ -1,33 +1,107 @@
+import hashlib
 import os
-from typing import List
+import uuid
+from typing import BinaryIO, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
 
 from project.application.interfaces.file_storage_interface import IFileStorage
 from project.core.config import settings
+from project.domain.entities import StoredFileEntity
+from project.infrastructure.exceptions.exceptions import FileTooLargeError
 
 
 class LocalFileStorage(IFileStorage):
-    async def upload_files(self, files) -> List[str]:
+    """
+    Content-addressed evidence storage.
+
+    Blobs live at `<upload_directory>/ab/cd/<sha256>`, so uploading the same
+    export twice keeps a single copy and files that merely share a name never
+    overwrite each other. The original filename is kept in the returned entity.
+    """
+
+    async def upload_files(self, files) -> List[StoredFileEntity]:
         saved_files = []
+        temp_path = None
         try:
             for file in files:
-                file_path = os.path.abspath(
-                    os.path.join(settings.evidence.upload_directory, file.filename)
+                # The hash is only known once the copy is done, so stream to a
+                # temporary name first and move it into place afterwards
+                temp_path = self._temp_path()
+
+                # Copy in fixed-size chunks on a worker thread, off the event loop
+                size, sha256 = await run_in_threadpool(
+                    self._copy_to_disk, file.file, temp_path, file.filename
                 )
-                file_path = file_path.replace(
-                    "\\", "/"
-                )  # Normalize for Celery / cross-platform
+                file_path = self._blob_path(sha256)
+                await run_in_threadpool(self._commit_blob, temp_path, file_path)
+                temp_path = None
 
                 print(f"File path: {file_path}")
-
-                # Read & write the uploaded file asynchronously
-                with open(file_path, "wb") as buffer:
-                    buffer.write(await file.read())
-                saved_files.append(file_path)
+                saved_files.append(
+                    StoredFileEntity(
+                        path=file_path,
+                        filename=file.filename,
+                        size=size,
+                        sha256=sha256,
+                        content_type=file.content_type,
+                    )
+                )
 
             return saved_files
         except Exception as e:
-            # Cleanup saved files in case of error
-            for file_path in saved_files:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+            # Stored blobs may be shared with other evidences, only drop the
+            # partially written file
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
             raise e
+
+    @staticmethod
+    def _temp_path() -> str:
+        directory = os.path.join(settings.evidence.upload_directory, "incoming")
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, uuid.uuid4().hex)
+
+    @staticmethod
+    def _blob_path(sha256: str) -> str:
+        file_path = os.path.abspath(
+            os.path.join(
+                settings.evidence.upload_directory, sha256[:2], sha256[2:4], sha256
+            )
+        )
+        return file_path.replace("\\", "/")  # Normalize for Celery / cross-platform
+
+    @staticmethod
+    def _commit_blob(temp_path: str, file_path: str) -> None:
+        if os.path.exists(file_path):
+            # Same content is already stored
+            os.remove(temp_path)
+            return
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _copy_to_disk(source: BinaryIO, file_path: str, filename: Optional[str]):
+        """
+        Stream `source` to `file_path`, hashing and counting bytes on the way.
+        `filename` is the name it was uploaded under, reported when too large.
+        """
+        chunk_size = settings.evidence.upload_chunk_size
+        max_size = settings.evidence.max_upload_size
+        digest = hashlib.sha256()
+        size = 0
+
+        source.seek(0)
+        with open(file_path, "wb") as buffer:
+            while chunk := source.read(chunk_size):
+                size += len(chunk)
+                if size > max_size:
+                    raise FileTooLargeError(
+                        f"{filename or 'The uploaded file'} exceeds the maximum "
+                        f"upload size of {max_size} bytes"
+                    )
+                digest.update(chunk)
+                buffer.write(chunk)
+
+        return size, digest.hexdigest()
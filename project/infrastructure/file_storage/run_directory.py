@@ -0,0 +1,89 @@
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from typing import Callable, Collection, Iterator, Optional, Sequence, TypeVar
+
+import numpy as np
+
+LOCK_FILE = ".lock"
+
+# Attempts at reading a manifest whose runs are being merged meanwhile
+READ_ATTEMPTS = 3
+
+T = TypeVar("T")
+
+
+class RunDirectory:
+    """
+    A directory of runs, sets of flat files sharing a name, listed in a JSON
+    manifest. A run is written in full before the manifest names it and never
+    changed after, the manifest is replaced at once: readers never lock, and
+    only retry if a merge removed the runs of the manifest they read.
+    Writers hold the directory's lock, across processes.
+    """
+
+    def __init__(self, path: str, manifest_file: str, run_suffixes: Sequence[str]):
+        self.path = path
+        self.manifest_file = manifest_file
+        self.run_suffixes = run_suffixes
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        os.makedirs(self.path, exist_ok=True)
+        with open(self.file(LOCK_FILE), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def read(self, read: Callable[[Optional[dict]], T]) -> T:
+        """`read` the runs of the manifest, again if some are gone meanwhile."""
+        for attempt in range(READ_ATTEMPTS):
+            try:
+                return read(self.read_manifest())
+            except FileNotFoundError:
+                if attempt == READ_ATTEMPTS - 1:
+                    raise
+
+    def read_manifest(self) -> Optional[dict]:
+        try:
+            with open(self.file(self.manifest_file)) as manifest:
+                return json.load(manifest)
+        except FileNotFoundError:
+            return None
+
+    def save_manifest(self, manifest: dict) -> None:
+        self.replace(self.manifest_file, json.dumps(manifest).encode())
+
+    def replace(self, name: str, data: bytes) -> None:
+        temp_path = self.file(f"{name}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, self.file(name))
+
+    @staticmethod
+    def next_run_name(manifest: dict) -> str:
+        # Past the last run named in the manifest; a name left by a job that
+        # died before saving it is unused and overwritten
+        number = manifest.get("next_run", 0)
+        manifest["next_run"] = number + 1
+        return f"{number:08d}"
+
+    def remove_run(self, name: str) -> None:
+        for suffix in self.run_suffixes:
+            os.remove(self.file(name + suffix))
+
+    def remove_unused_runs(self, used: Collection[str]) -> None:
+        """Remove runs merged away, or left by a job that died mid-write."""
+        for file_name in os.listdir(self.path):
+            name, _, suffix = file_name.partition(".")
+            if f".{suffix}" in self.run_suffixes and name not in used:
+                os.remove(self.file(file_name))
+
+    def map(self, name: str, dtype: np.dtype, shape: tuple) -> np.ndarray:
+        return np.memmap(self.file(name), dtype=dtype, mode="r", shape=shape)
+
+    def file(self, name: str) -> str:
+        return os.path.join(self.path, name)
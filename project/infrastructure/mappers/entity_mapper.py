@@ -1,4 +1,9 @@
-from project.domain.entities import GroupEntity, ProfileEntity, UserEntity
+from project.domain.entities import (
+    EvidenceEntity,
+    GroupEntity,
+    ProfileEntity,
+    UserEntity,
+)
 
 
 class EntityMapper:
@@ -37,3 +42,20 @@ class EntityMapper:
             created_at=group_model.created_at,
             updated_at=group_model.updated_at,
         )
+
+    @staticmethod
+    def to_evidence_entity(evidence_model) -> EvidenceEntity:
+        return EvidenceEntity(
+            id=evidence_model.id,
+            case_id=evidence_model.case_id,
+            source=evidence_model.source,
+            status=evidence_model.status,
+            format=evidence_model.format,
+            # A copy: edited in place and assigned back, the model's own dict
+            # would compare equal to itself and never be saved
+            metadata=dict(evidence_model.metadata_json or {}),
+            attributes=evidence_model.attributes or [],
+            content_hash=evidence_model.content_hash,
+            created_at=evidence_model.created_at,
+            updated_at=evidence_model.updated_at,
+        )
@@ -4,7 +4,7 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 
 from project.core.config import settings
-from project.infrastructure.database.models import Base
+from project.infrastructure.database.models import MESSAGE_PARTITION_PATTERN, Base
 
 config = context.config
 
@@ -26,6 +26,13 @@ config.set_main_option(
 )
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Partitions of the messages table have no model of their own
+    if type_ == "table" and reflected and compare_to is None:
+        return not MESSAGE_PARTITION_PATTERN.match(name)
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -43,6 +50,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         include_schemas=True,  # <--- ✅ include schemas
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
@@ -71,6 +79,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             include_schemas=True,  # <--- ✅ include schemas
+            include_object=include_object,
             compare_type=True,
             compare_server_default=True,
             render_as_batch=True,
@@ -0,0 +1,76 @@
+"""store embeddings as float32 bytes
+
+Revision ID: 563bbe604f3b
+Revises: e03b0f063ef6
+Create Date: 2026-10-18 13:56:19.392981
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "563bbe604f3b"
+down_revision: Union[str, None] = "e03b0f063ef6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MESSAGES = "security_platform.messages"
+
+
+def upgrade() -> None:
+    # Converted into a new column, then swapped in: only embedded messages are
+    # rewritten, where changing the column's type would rewrite every message
+    with op.batch_alter_table("messages", schema="security_platform") as batch_op:
+        batch_op.add_column(sa.Column("embedding_values", sa.LargeBinary()))
+
+    # `float4send` gives the big-endian bytes of each value, reversed here into
+    # the little-endian layout read by `decode_embedding`
+    op.execute(
+        f"UPDATE {MESSAGES} SET embedding_values = ("
+        "SELECT string_agg("
+        "substring(value FROM 4 FOR 1) || substring(value FROM 3 FOR 1) "
+        "|| substring(value FROM 2 FOR 1) || substring(value FROM 1 FOR 1), "
+        "''::bytea ORDER BY position) "
+        "FROM json_array_elements_text(embeddings) WITH ORDINALITY "
+        "AS element (number, position), "
+        "LATERAL float4send(number::real) AS value"
+        ") WHERE embeddings IS NOT NULL"
+    )
+
+    with op.batch_alter_table("messages", schema="security_platform") as batch_op:
+        batch_op.drop_column("embeddings")
+        batch_op.alter_column("embedding_values", new_column_name="embeddings")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("messages", schema="security_platform") as batch_op:
+        batch_op.add_column(
+            sa.Column("embedding_numbers", postgresql.JSON(astext_type=sa.Text()))
+        )
+
+    # Each float32 decoded from its sign, exponent and mantissa bits
+    op.execute(
+        f"UPDATE {MESSAGES} SET embedding_numbers = ("
+        "SELECT json_agg(("
+        "(1 - 2 * (bits >> 31)) * CASE WHEN ((bits >> 23) & 255) = 0 "
+        "THEN (bits & 8388607) * power(2::float8, -149) "
+        "ELSE ((bits & 8388607) + 8388608) "
+        "* power(2::float8, ((bits >> 23) & 255) - 150) END"
+        ")::real ORDER BY position) "
+        "FROM generate_series(0, length(embeddings) - 4, 4) AS position, "
+        "LATERAL (SELECT get_byte(embeddings, position)::bigint "
+        "| (get_byte(embeddings, position + 1)::bigint << 8) "
+        "| (get_byte(embeddings, position + 2)::bigint << 16) "
+        "| (get_byte(embeddings, position + 3)::bigint << 24) AS bits) AS value"
+        ") WHERE embeddings IS NOT NULL"
+    )
+
+    with op.batch_alter_table("messages", schema="security_platform") as batch_op:
+        batch_op.drop_column("embeddings")
+        batch_op.alter_column("embedding_numbers", new_column_name="embeddings")
@@ -0,0 +1,79 @@
+"""add association constraints and indexes
+
+Revision ID: 6c9343fa1346
+Revises: a2b4d3b29f79
+Create Date: 2026-10-18 12:25:56.926101
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6c9343fa1346"
+down_revision: Union[str, None] = "a2b4d3b29f79"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "security_platform"
+
+# (table, unique pair, separately indexed column)
+ASSOCIATIONS = [
+    ("case_collection_associations", ("collection_id", "case_id"), "case_id"),
+    ("shared_case_groups", ("case_id", "group_id"), "group_id"),
+    ("shared_case_users", ("case_id", "user_id"), "user_id"),
+    ("user_group_associations", ("user_id", "group_id"), "group_id"),
+]
+
+
+def unique_name(table: str, columns) -> str:
+    # The name PostgreSQL would have picked itself
+    return f"{table}_{'_'.join(columns)}_key"
+
+
+def upgrade() -> None:
+    for table, columns, indexed_column in ASSOCIATIONS:
+        # Rows duplicated by earlier check-then-insert races, keep the oldest
+        pair_matches = " AND ".join(f"newer.{c} = older.{c}" for c in columns)
+        op.execute(
+            f"DELETE FROM {SCHEMA}.{table} AS newer USING {SCHEMA}.{table} AS older "
+            f"WHERE {pair_matches} AND (newer.created_at, newer.id) > "
+            "(older.created_at, older.id)"
+        )
+
+        with op.batch_alter_table(table, schema=SCHEMA) as batch_op:
+            batch_op.create_index(
+                batch_op.f(f"ix_{SCHEMA}_{table}_{indexed_column}"),
+                [indexed_column],
+                unique=False,
+            )
+            batch_op.create_unique_constraint(
+                unique_name(table, columns), list(columns)
+            )
+
+    with op.batch_alter_table("cases", schema=SCHEMA) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_security_platform_cases_user_id"), ["user_id"], unique=False
+        )
+
+    with op.batch_alter_table("evidences", schema=SCHEMA) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_security_platform_evidences_case_id"),
+            ["case_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("evidences", schema=SCHEMA) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_security_platform_evidences_case_id"))
+
+    with op.batch_alter_table("cases", schema=SCHEMA) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_security_platform_cases_user_id"))
+
+    for table, columns, indexed_column in reversed(ASSOCIATIONS):
+        with op.batch_alter_table(table, schema=SCHEMA) as batch_op:
+            batch_op.drop_constraint(unique_name(table, columns), type_="unique")
+            batch_op.drop_index(batch_op.f(f"ix_{SCHEMA}_{table}_{indexed_column}"))
@@ -0,0 +1,99 @@
+"""partition messages by evidence
+
+Revision ID: a2b4d3b29f79
+Revises: 6d9c0acdf2ca
+Create Date: 2026-10-18 12:23:10.766281
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a2b4d3b29f79"
+down_revision: Union[str, None] = "6d9c0acdf2ca"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = "security_platform"
+PARTITIONS = 16
+COLUMNS = (
+    "id, created_at, updated_at, evidence_id, sender, receiver, payload, status, "
+    "embeddings, attributes"
+)
+
+
+def message_columns():
+    return [
+        sa.Column("evidence_id", sa.UUID(), nullable=False),
+        sa.Column("sender", sa.String(), nullable=False),
+        sa.Column("receiver", sa.String(), nullable=False),
+        sa.Column("payload", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("embeddings", sa.JSON(), nullable=True),
+        sa.Column("attributes", sa.JSON(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def move_aside() -> None:
+    """Rename the current table and its primary key index out of the way."""
+    op.rename_table("messages", "messages_old", schema=SCHEMA)
+    op.execute(f"ALTER INDEX {SCHEMA}.messages_pkey RENAME TO messages_old_pkey")
+
+
+def copy_back_and_drop_old() -> None:
+    op.execute(
+        f"INSERT INTO {SCHEMA}.messages ({COLUMNS}) "
+        f"SELECT {COLUMNS} FROM {SCHEMA}.messages_old"
+    )
+    op.drop_table("messages_old", schema=SCHEMA)
+
+
+def upgrade() -> None:
+    move_aside()
+
+    op.create_table(
+        "messages",
+        *message_columns(),
+        sa.ForeignKeyConstraint(
+            ["evidence_id"], [f"{SCHEMA}.evidences.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("evidence_id", "id"),
+        schema=SCHEMA,
+        postgresql_partition_by="HASH (evidence_id)",
+    )
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE {SCHEMA}.messages_p{remainder} "
+            f"PARTITION OF {SCHEMA}.messages "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+    copy_back_and_drop_old()
+    op.execute(f"ANALYZE {SCHEMA}.messages")
+
+
+def downgrade() -> None:
+    move_aside()
+
+    op.create_table(
+        "messages",
+        *message_columns(),
+        sa.ForeignKeyConstraint(["evidence_id"], [f"{SCHEMA}.evidences.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        schema=SCHEMA,
+    )
+
+    # Dropping the partitioned parent drops its partitions with it
+    copy_back_and_drop_old()
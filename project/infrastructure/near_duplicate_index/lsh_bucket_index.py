@@ -0,0 +1,182 @@
+import os
+import shutil
+from functools import partial
+from typing import ContextManager, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from project.application.interfaces.near_duplicate_index_interface import (
+    INearDuplicateIndex,
+)
+from project.application.utils.near_duplicates import NearDuplicateCluster
+from project.infrastructure.file_storage.run_directory import RunDirectory
+
+# A case's runs, oldest first, the runs staged by batches not known to be
+# committed yet, and the number of the next run
+MANIFEST_FILE = "runs.json"
+KEYS_SUFFIX = ".keys"
+CLUSTERS_SUFFIX = ".clusters"
+
+KEY_DTYPE = np.dtype("<i8")
+# Cluster id then the evidence of its first message
+CLUSTER_DTYPE = np.dtype("V32")
+
+
+class LshBucketIndex(INearDuplicateIndex):
+    """
+    LSH buckets of every case, as sorted runs of flat files: each batch adds
+    one run, its buckets sorted, and a lookup binary-searches every run. Runs
+    are merged as they pile up, a run with the one before it once it holds at
+    least half as many buckets, leaving a logarithmic number of runs.
+
+    A batch costs a sort and a few memory-mapped searches, where a table of
+    buckets would take an index entry per bucket, several per message. Its
+    run is written and staged in the manifest before its batch commits, then
+    only listed among the runs.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def find(
+        self, case_id: UUID, buckets: np.ndarray
+    ) -> Dict[int, NearDuplicateCluster]:
+        runs = self._runs(case_id)
+        keys = np.unique(buckets)
+        if not keys.size or not os.path.exists(runs.path):
+            return {}
+
+        found: Dict[int, NearDuplicateCluster] = {}
+        clusters: Dict[bytes, NearDuplicateCluster] = {}
+        # Newest first, the first run holding a bucket answers for it
+        for run_keys, run_clusters in reversed(runs.read(partial(_map_runs, runs))):
+            positions = np.searchsorted(run_keys, keys)
+            positions[positions == len(run_keys)] = 0
+            hits = run_keys[positions] == keys
+            for key, value in zip(
+                keys[hits].tolist(), run_clusters[positions[hits]].tolist()
+            ):
+                cluster = clusters.get(value)
+                if cluster is None:
+                    cluster = clusters[value] = NearDuplicateCluster(
+                        UUID(bytes=value[:16]), UUID(bytes=value[16:])
+                    )
+                found[key] = cluster
+            keys = keys[~hits]
+            if not keys.size:
+                break
+        return found
+
+    def locked(self, case_id: UUID) -> ContextManager[None]:
+        # Held by one batch at a time; lookups don't lock
+        return self._runs(case_id).locked()
+
+    def stage(
+        self,
+        case_id: UUID,
+        batch_key: str,
+        row_count: int,
+        buckets: np.ndarray,
+        bucket_clusters: np.ndarray,
+        clusters: Sequence[NearDuplicateCluster],
+    ) -> None:
+        if not len(buckets):
+            return
+        values = np.array(
+            [cluster.id.bytes + cluster.evidence_id.bytes for cluster in clusters],
+            dtype=CLUSTER_DTYPE,
+        )
+        order = np.argsort(buckets, kind="stable")
+        keys = np.ascontiguousarray(buckets[order], dtype=KEY_DTYPE)
+        values = values[bucket_clusters[order]]
+
+        runs = self._runs(case_id)
+        manifest = _manifest(runs.read_manifest())
+        staged = manifest.setdefault("staged", {})
+        previous = staged.get(batch_key)
+        name = _write_run(runs, manifest, keys, values)
+        staged[batch_key] = [name, len(keys), row_count]
+        runs.save_manifest(manifest)
+        if previous:
+            runs.remove_run(previous[0])
+
+    def publish(self, case_id: UUID, batch_key: str, committed_rows: int) -> None:
+        runs = self._runs(case_id)
+        manifest = _manifest(runs.read_manifest())
+        staged = manifest.get("staged", {}).pop(batch_key, None)
+        if not staged:
+            return
+        name, count, row_count = staged
+        if row_count > committed_rows:
+            # Its batch was rolled back, and is loaded again with other ids
+            runs.save_manifest(manifest)
+            runs.remove_run(name)
+            return
+
+        manifest["runs"].append([name, count])
+        runs.save_manifest(manifest)
+        listed = manifest["runs"]
+        while len(listed) > 1 and 2 * listed[-1][1] >= listed[-2][1]:
+            _merge_last(runs, manifest)
+
+    def drop(self, case_id: UUID) -> None:
+        shutil.rmtree(self._runs(case_id).path, ignore_errors=True)
+
+    def _runs(self, case_id: UUID) -> RunDirectory:
+        return RunDirectory(
+            os.path.join(self.directory, str(case_id)),
+            MANIFEST_FILE,
+            (KEYS_SUFFIX, CLUSTERS_SUFFIX),
+        )
+
+
+def _manifest(manifest: Optional[dict]) -> dict:
+    return manifest if manifest is not None else {"runs": []}
+
+
+def _merge_last(runs: RunDirectory, manifest: dict) -> None:
+    """Replace the two newest runs by one, removing them once unlisted."""
+    listed = manifest["runs"]
+    older, newer = listed[-2], listed[-1]
+    key_parts, cluster_parts = zip(
+        *(_load_run(runs, name) for name, _ in (older, newer))
+    )
+    keys = np.concatenate(key_parts)
+    # Both halves are sorted already, which a stable sort takes advantage of
+    order = np.argsort(keys, kind="stable")
+    name = _write_run(runs, manifest, keys[order], np.concatenate(cluster_parts)[order])
+    listed[-2:] = [[name, len(keys)]]
+    runs.save_manifest(manifest)
+    for old_name, _ in (older, newer):
+        runs.remove_run(old_name)
+
+
+def _write_run(
+    runs: RunDirectory, manifest: dict, keys: np.ndarray, values: np.ndarray
+) -> str:
+    # Written in full before the manifest lists it
+    name = runs.next_run_name(manifest)
+    keys.tofile(runs.file(name + KEYS_SUFFIX))
+    values.tofile(runs.file(name + CLUSTERS_SUFFIX))
+    return name
+
+
+def _map_runs(
+    runs: RunDirectory, manifest: Optional[dict]
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    # Runs already mapped stay readable if a merge deletes them meanwhile
+    return [
+        (
+            runs.map(name + KEYS_SUFFIX, KEY_DTYPE, (count,)),
+            runs.map(name + CLUSTERS_SUFFIX, CLUSTER_DTYPE, (count,)),
+        )
+        for name, count in _manifest(manifest)["runs"]
+    ]
+
+
+def _load_run(runs: RunDirectory, name: str) -> Tuple[np.ndarray, np.ndarray]:
+    return (
+        np.fromfile(runs.file(name + KEYS_SUFFIX), dtype=KEY_DTYPE),
+        np.fromfile(runs.file(name + CLUSTERS_SUFFIX), dtype=CLUSTER_DTYPE),
+    )
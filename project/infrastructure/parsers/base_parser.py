@@ -0,0 +1,82 @@
+import json
+from abc import abstractmethod
+from datetime import date, datetime, time
+from itertools import islice
+from typing import BinaryIO, Iterator, Optional, Sequence, Union
+
+from project.application.interfaces.evidence_parser_interface import (
+    EvidenceRecord,
+    IEvidenceParser,
+    RejectedRecord,
+)
+from project.application.utils.compression import decompress_stream
+from project.domain.entities import IngestionCheckpointEntity
+
+# Longest raw text kept with a quarantined record
+RAW_LIMIT = 4096
+
+# Values of a required column that count as missing, in every format
+BLANK = (None, "")
+
+
+class StreamEvidenceParser(IEvidenceParser):
+    """
+    Base for parsers that read records sequentially from a binary stream.
+
+    Files are decompressed on the fly when they are gzip or zstd compressed.
+    Sequential streams have no position to resume from, so a resumed parse
+    skips the records its checkpoint already holds.
+    """
+
+    @abstractmethod
+    def iter_records(
+        self, stream: BinaryIO, required_columns: Sequence[str] = ()
+    ) -> Iterator[Union[dict, RejectedRecord]]:
+        """Lazily yield the records of a decompressed binary stream."""
+        pass
+
+    def read_records(
+        self,
+        file_path: str,
+        checkpoint: IngestionCheckpointEntity,
+        required_columns: Sequence[str] = (),
+    ) -> Iterator[EvidenceRecord]:
+        skip = checkpoint.row_count + checkpoint.rejected_count
+        with open(file_path, mode="rb") as f:
+            records = self.iter_records(decompress_stream(f), required_columns)
+            for record in islice(records, skip, None):
+                yield record, None
+
+
+def to_text(value) -> str:
+    """Render a cell or field value the way it is stored on a message."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def validate_record(record: dict, required_columns: Sequence[str]) -> Optional[str]:
+    """Describe why a record can't be stored, None if it can."""
+    # A blank CSV field, an empty XLSX cell and a JSON null are all missing
+    missing = [column for column in required_columns if record.get(column) in BLANK]
+    if missing:
+        return f"Missing column(s): {', '.join(missing)}"
+
+    # PostgreSQL text can't hold NUL, one such value would fail the whole batch
+    if any(isinstance(value, str) and "\x00" in value for value in record.values()):
+        return "Value contains a NUL character"
+    return None
+
+
+def truncate_raw(raw) -> Optional[str]:
+    if raw is None:
+        return None
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return raw[:RAW_LIMIT].replace("\x00", "\ufffd")
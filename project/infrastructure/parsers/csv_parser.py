@@ -0,0 +1,123 @@
+import csv
+from typing import BinaryIO, Callable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from project.application.interfaces.evidence_parser_interface import (
+    EvidenceRecord,
+    RejectedRecord,
+)
+from project.application.utils.compression import is_compressed
+from project.application.utils.csv_chunks import (
+    CsvLineReader,
+    count_lines,
+    plan_csv_chunks,
+    read_csv_header,
+)
+from project.domain.entities import IngestionCheckpointEntity
+from project.infrastructure.parsers.base_parser import (
+    StreamEvidenceParser,
+    truncate_raw,
+    validate_record,
+)
+
+
+class CsvEvidenceParser(StreamEvidenceParser):
+    """
+    Plain CSV files are read by byte range, so they can be split into chunks
+    and resumed from a byte offset. Compressed ones are read as a stream.
+    """
+
+    splittable = True
+
+    def iter_records(
+        self, stream: BinaryIO, required_columns: Sequence[str] = ()
+    ) -> Iterator[Union[dict, RejectedRecord]]:
+        lines = CsvLineReader(stream, 0)
+        header = next(csv.reader(lines), [])
+        for record, _ in self._parse(lines, header, required_columns, lambda: 0):
+            if isinstance(record, RejectedRecord):
+                # Offsets into decompressed data don't locate anything in the file
+                record.byte_offset = None
+            yield record
+
+    def read_records(
+        self,
+        file_path: str,
+        checkpoint: IngestionCheckpointEntity,
+        required_columns: Sequence[str] = (),
+    ) -> Iterator[EvidenceRecord]:
+        if is_compressed(file_path):
+            yield from super().read_records(file_path, checkpoint, required_columns)
+            return
+
+        header, _ = read_csv_header(file_path)
+        start = checkpoint.byte_offset
+        line_base = []
+
+        def lines_before_start() -> int:
+            # Only counted once something is rejected, good rows never pay for it
+            if not line_base:
+                line_base.append(count_lines(file_path, start))
+            return line_base[0]
+
+        with open(file_path, mode="rb") as f:
+            lines = CsvLineReader(f, start, checkpoint.chunk_end)
+            yield from self._parse(lines, header, required_columns, lines_before_start)
+
+    def plan_chunks(
+        self, file_path: str, chunk_size: int
+    ) -> List[Tuple[int, Optional[int]]]:
+        if is_compressed(file_path):
+            return [(0, None)]
+
+        if not chunk_size:
+            _, data_start = read_csv_header(file_path)
+            return [(data_start, None)]
+
+        _, chunks = plan_csv_chunks(file_path, chunk_size)
+        return chunks
+
+    @staticmethod
+    def _parse(
+        lines: CsvLineReader,
+        header: List[str],
+        required_columns: Sequence[str],
+        lines_before_start: Callable[[], int],
+    ) -> Iterator[EvidenceRecord]:
+        reader = csv.reader(lines)
+        while True:
+            record_offset = lines.offset
+            record_line = lines.line_count + 1
+
+            def reject(reason: str, raw=None) -> EvidenceRecord:
+                rejected = RejectedRecord(
+                    reason=reason,
+                    line_number=lines_before_start() + record_line,
+                    byte_offset=record_offset,
+                    raw=truncate_raw(raw),
+                )
+                return rejected, lines.offset
+
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except (csv.Error, UnicodeDecodeError) as e:
+                # The reader starts over on the next line
+                yield reject(f"Malformed CSV: {e}")
+                continue
+
+            if not row:
+                continue
+            if len(row) != len(header):
+                yield reject(
+                    f"Expected {len(header)} fields, found {len(row)}", ",".join(row)
+                )
+                continue
+
+            record = dict(zip(header, row))
+            reason = validate_record(record, required_columns)
+            if reason:
+                yield reject(reason, ",".join(row))
+                continue
+
+            yield record, lines.offset
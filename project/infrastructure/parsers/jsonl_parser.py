@@ -0,0 +1,109 @@
+import json
+import os
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+
+from project.application.interfaces.evidence_parser_interface import (
+    EvidenceRecord,
+    RejectedRecord,
+)
+from project.application.utils.compression import is_compressed
+from project.application.utils.csv_chunks import count_lines
+from project.domain.entities import IngestionCheckpointEntity
+from project.infrastructure.parsers.base_parser import (
+    StreamEvidenceParser,
+    to_text,
+    truncate_raw,
+    validate_record,
+)
+
+
+class JsonlEvidenceParser(StreamEvidenceParser):
+    """
+    Newline-delimited JSON, one message object per line.
+
+    JSON strings cannot hold raw newlines, so every newline ends a record and
+    plain files split into byte ranges without any quote tracking.
+    """
+
+    splittable = True
+
+    def iter_records(
+        self, stream: BinaryIO, required_columns: Sequence[str] = ()
+    ) -> Iterator[Union[dict, RejectedRecord]]:
+        for line_number, line in enumerate(stream, start=1):
+            record = self._decode(line, required_columns)
+            if isinstance(record, RejectedRecord):
+                record.line_number = line_number
+            if record is not None:
+                yield record
+
+    def read_records(
+        self,
+        file_path: str,
+        checkpoint: IngestionCheckpointEntity,
+        required_columns: Sequence[str] = (),
+    ) -> Iterator[EvidenceRecord]:
+        if is_compressed(file_path):
+            yield from super().read_records(file_path, checkpoint, required_columns)
+            return
+
+        end = checkpoint.chunk_end
+        offset = checkpoint.byte_offset
+        line_base = None
+        with open(file_path, mode="rb") as f:
+            f.seek(offset)
+            for line_count, line in enumerate(f, start=1):
+                if end is not None and offset >= end:
+                    break
+                record = self._decode(line, required_columns)
+                if isinstance(record, RejectedRecord):
+                    # Only counted once something is rejected
+                    if line_base is None:
+                        line_base = count_lines(file_path, checkpoint.byte_offset)
+                    record.line_number = line_base + line_count
+                    record.byte_offset = offset
+                offset += len(line)
+                if record is not None:
+                    yield record, offset
+
+    def plan_chunks(
+        self, file_path: str, chunk_size: int
+    ) -> List[Tuple[int, Optional[int]]]:
+        if not chunk_size or is_compressed(file_path):
+            return [(0, None)]
+
+        file_size = os.path.getsize(file_path)
+        chunks = []
+        start = 0
+        with open(file_path, mode="rb") as f:
+            while start < file_size:
+                # Extend the chunk to the end of the line it stops in
+                f.seek(start + chunk_size - 1)
+                f.readline()
+                end = min(f.tell(), file_size)
+                chunks.append((start, end))
+                start = end
+
+        return chunks
+
+    @staticmethod
+    def _decode(
+        line: bytes, required_columns: Sequence[str]
+    ) -> Union[dict, RejectedRecord, None]:
+        line = line.strip()
+        if not line:
+            return None
+
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            return RejectedRecord(reason=f"Invalid JSON: {e}", raw=truncate_raw(line))
+        if not isinstance(record, dict):
+            return RejectedRecord(
+                reason="Expected a JSON object", raw=truncate_raw(line)
+            )
+
+        reason = validate_record(record, required_columns)
+        if reason:
+            return RejectedRecord(reason=reason, raw=truncate_raw(line))
+        return {name: to_text(value) for name, value in record.items()}
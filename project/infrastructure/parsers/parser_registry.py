@@ -0,0 +1,34 @@
+from typing import Dict
+
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParser,
+    IEvidenceParserRegistry,
+)
+from project.domain.enums import EvidenceFormat
+from project.infrastructure.parsers.csv_parser import CsvEvidenceParser
+from project.infrastructure.parsers.jsonl_parser import JsonlEvidenceParser
+from project.infrastructure.parsers.xlsx_parser import XlsxEvidenceParser
+from project.infrastructure.parsers.zip_parser import ZipEvidenceParser
+
+
+class EvidenceParserRegistry(IEvidenceParserRegistry):
+    def __init__(self):
+        self.parsers: Dict[EvidenceFormat, IEvidenceParser] = {}
+
+    def register(self, evidence_format: EvidenceFormat, parser: IEvidenceParser):
+        self.parsers[evidence_format] = parser
+
+    def get(self, evidence_format: EvidenceFormat) -> IEvidenceParser:
+        parser = self.parsers.get(evidence_format)
+        if not parser:
+            raise ValueError(f"Unsupported evidence format: {evidence_format.value}")
+        return parser
+
+
+def build_parser_registry() -> EvidenceParserRegistry:
+    registry = EvidenceParserRegistry()
+    registry.register(EvidenceFormat.CSV, CsvEvidenceParser())
+    registry.register(EvidenceFormat.EXCEL, XlsxEvidenceParser())
+    registry.register(EvidenceFormat.JSONL, JsonlEvidenceParser())
+    registry.register(EvidenceFormat.ZIP, ZipEvidenceParser(registry))
+    return registry
@@ -0,0 +1,47 @@
+from typing import BinaryIO, Iterator, Sequence, Union
+
+from openpyxl import load_workbook
+
+from project.application.interfaces.evidence_parser_interface import RejectedRecord
+from project.infrastructure.parsers.base_parser import (
+    StreamEvidenceParser,
+    to_text,
+    truncate_raw,
+    validate_record,
+)
+
+
+class XlsxEvidenceParser(StreamEvidenceParser):
+    """
+    Reads the rows of every worksheet of an XLSX workbook, using the first row
+    of each sheet as its header.
+
+    The workbook is opened in read-only mode, which streams the sheet XML
+    row by row instead of building the whole cell grid in memory.
+    """
+
+    def iter_records(
+        self, stream: BinaryIO, required_columns: Sequence[str] = ()
+    ) -> Iterator[Union[dict, RejectedRecord]]:
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        try:
+            for worksheet in workbook.worksheets:
+                rows = worksheet.iter_rows(values_only=True)
+                header = [to_text(value).strip() for value in next(rows, ())]
+                for row_number, row in enumerate(rows, start=2):
+                    if all(value is None for value in row):
+                        continue
+
+                    record = {name: value for name, value in zip(header, row) if name}
+                    reason = validate_record(record, required_columns)
+                    if reason:
+                        yield RejectedRecord(
+                            reason=f"{worksheet.title}: {reason}",
+                            line_number=row_number,
+                            raw=truncate_raw(",".join(map(to_text, row))),
+                        )
+                        continue
+
+                    yield {name: to_text(value) for name, value in record.items()}
+        finally:
+            workbook.close()
@@ -0,0 +1,58 @@
+import os
+import zipfile
+from typing import BinaryIO, Iterator, Sequence, Union
+
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParserRegistry,
+    RejectedRecord,
+)
+from project.application.utils.compression import decompress_stream
+from project.application.utils.evidence_format import format_from_filename
+from project.domain.enums import EvidenceFormat
+from project.infrastructure.parsers.base_parser import StreamEvidenceParser
+
+
+class ZipEvidenceParser(StreamEvidenceParser):
+    """
+    Reads the records of every supported file inside a ZIP archive, in
+    archive order.
+
+    Members are decompressed as they are read, nothing is extracted to disk.
+    Files whose type can't be told from their name (and macOS metadata
+    folders) are skipped, as are nested archives.
+    """
+
+    def __init__(self, registry: IEvidenceParserRegistry):
+        self.registry = registry
+
+    def iter_records(
+        self, stream: BinaryIO, required_columns: Sequence[str] = ()
+    ) -> Iterator[Union[dict, RejectedRecord]]:
+        with zipfile.ZipFile(stream) as archive:
+            for member in archive.infolist():
+                evidence_format = self._member_format(member)
+                if not evidence_format:
+                    continue
+
+                parser = self.registry.get(evidence_format)
+                with archive.open(member) as member_stream:
+                    records = parser.iter_records(
+                        decompress_stream(member_stream), required_columns
+                    )
+                    for record in records:
+                        if isinstance(record, RejectedRecord):
+                            record.reason = f"{member.filename}: {record.reason}"
+                        yield record
+
+    @staticmethod
+    def _member_format(member: zipfile.ZipInfo):
+        name = member.filename
+        if member.is_dir() or name.startswith("__MACOSX/"):
+            return None
+        if os.path.basename(name).startswith("."):
+            return None
+
+        evidence_format = format_from_filename(name)
+        if evidence_format == EvidenceFormat.ZIP:
+            return None
+        return evidence_format
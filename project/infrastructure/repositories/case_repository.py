@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload, selectinload
 
 from project.application.interfaces.case_repository_interface import ICaseRepository
@@ -86,6 +87,17 @@ class CaseRepository(ICaseRepository):
             updated_at=db_case.updated_at,
         )
 
+    async def check_case_access(self, case_id: UUID, user_id: UUID) -> None:
+        stmt = select(
+            select(SharedCaseUserModel.id)
+            .where(SharedCaseUserModel.user_id == user_id)
+            .where(SharedCaseUserModel.case_id == case_id)
+            .exists()
+        )
+        result = await self.session.execute(stmt)
+        if not result.scalar():
+            raise AccessDeniedError("Case not found or access denied")
+
     async def get_cases_by_user(self, user_id: UUID) -> List[CaseEntity]:
         stmt = (
             select(CaseModel)
@@ -309,20 +321,15 @@ class CaseRepository(ICaseRepository):
         if not case:
             raise AccessDeniedError("Case not found or access denied")
 
-        # Check if association already exists
-        stmt = select(CaseCollectionAssociationModel).where(
-            CaseCollectionAssociationModel.collection_id == collection_id,
-            CaseCollectionAssociationModel.case_id == case_id,
+        # Create association, the unique constraint settles concurrent adds
+        stmt = (
+            pg_insert(CaseCollectionAssociationModel)
+            .values(collection_id=collection_id, case_id=case_id)
+            .on_conflict_do_nothing(index_elements=["collection_id", "case_id"])
+            .returning(CaseCollectionAssociationModel.id)
         )
         result = await self.session.execute(stmt)
-        association = result.scalars().first()
-        if association:
+        if not result.first():
             raise DuplicateAssociationError("Case is already part of the collection")
 
-        # Create association
-        association = CaseCollectionAssociationModel(
-            collection_id=collection_id,
-            case_id=case_id,
-        )
-        self.session.add(association)
         await self.session.commit()
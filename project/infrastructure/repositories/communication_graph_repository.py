@@ -0,0 +1,439 @@
+from typing import Dict, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import (
+    BigInteger,
+    String,
+    any_,
+    bindparam,
+    delete,
+    func,
+    literal,
+    select,
+    text,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.application.interfaces.communication_graph_repository_interface import (
+    ICommunicationGraphRepository,
+)
+from project.application.utils.graph import merge_components
+from project.application.utils.uuid7 import UUID7_SQL
+from project.domain.entities import CommunicationEdgeEntity, EvidenceEntity
+from project.infrastructure.database.models import (
+    CommunicationComponentModel,
+    CommunicationContactModel,
+    CommunicationEdgeModel,
+    CommunicationParticipantModel,
+)
+
+COMMUNICATION_EDGES_UPSERT = text(
+    f"INSERT INTO {CommunicationEdgeModel.__table__.fullname} AS edge "
+    "(id, case_id, evidence_id, sender, receiver, message_count, first_seen, "
+    "last_seen) "
+    f"SELECT {UUID7_SQL}, case_id, evidence_id, sender, receiver, message_count, "
+    "now(), now() "
+    "FROM unnest(:case_ids, :evidence_ids, :senders, :receivers, :counts) "
+    "AS batch (case_id, evidence_id, sender, receiver, message_count) "
+    "ORDER BY evidence_id, sender, receiver "
+    "ON CONFLICT (evidence_id, sender, receiver) DO UPDATE "
+    "SET message_count = edge.message_count + excluded.message_count, "
+    "last_seen = excluded.last_seen"
+).bindparams(
+    bindparam("case_ids", type_=ARRAY(SA_UUID)),
+    bindparam("evidence_ids", type_=ARRAY(SA_UUID)),
+    bindparam("senders", type_=ARRAY(String)),
+    bindparam("receivers", type_=ARRAY(String)),
+    bindparam("counts", type_=ARRAY(BigInteger)),
+)
+
+# Held until commit by whoever changes the components of a case, so parallel
+# chunks merge them one after the other from what the previous one committed
+COMMUNICATION_COMPONENTS_LOCK = text(
+    "SELECT pg_advisory_xact_lock(hashtextextended(CAST(:case_id AS text), 0))"
+).bindparams(bindparam("case_id", type_=SA_UUID))
+
+COMMUNICATION_COMPONENTS_UPSERT = text(
+    f"INSERT INTO {CommunicationComponentModel.__table__.fullname} AS component "
+    "(id, case_id, size, message_count) "
+    "SELECT id, :case_id, size, message_count "
+    "FROM unnest(:ids, :sizes, :counts) AS batch (id, size, message_count) "
+    "ON CONFLICT (id) DO UPDATE "
+    "SET size = excluded.size, message_count = excluded.message_count, "
+    "updated_at = now()"
+).bindparams(
+    bindparam("case_id", type_=SA_UUID),
+    bindparam("ids", type_=ARRAY(SA_UUID)),
+    bindparam("sizes", type_=ARRAY(BigInteger)),
+    bindparam("counts", type_=ARRAY(BigInteger)),
+)
+
+COMMUNICATION_PARTICIPANTS_RELABEL = text(
+    f"UPDATE {CommunicationParticipantModel.__table__.fullname} AS participant "
+    "SET component_id = merge.component_id, updated_at = now() "
+    "FROM unnest(:merged_ids, :component_ids) AS merge (merged_id, component_id) "
+    "WHERE participant.component_id = merge.merged_id"
+).bindparams(
+    bindparam("merged_ids", type_=ARRAY(SA_UUID)),
+    bindparam("component_ids", type_=ARRAY(SA_UUID)),
+)
+
+COMMUNICATION_PARTICIPANTS_INSERT = text(
+    f"INSERT INTO {CommunicationParticipantModel.__table__.fullname} "
+    "(id, case_id, participant, component_id) "
+    f"SELECT {UUID7_SQL}, :case_id, participant, component_id "
+    "FROM unnest(:participants, :component_ids) AS batch (participant, component_id)"
+).bindparams(
+    bindparam("case_id", type_=SA_UUID),
+    bindparam("participants", type_=ARRAY(String)),
+    bindparam("component_ids", type_=ARRAY(SA_UUID)),
+)
+
+# Contacts new to the case are those whose pair inserts, counted for both ends
+COMMUNICATION_PARTICIPANTS_TOTALS_UPDATE = text(
+    "WITH batch AS ("
+    "SELECT sender, receiver, message_count "
+    "FROM unnest(:senders, :receivers, :counts) "
+    "AS batch (sender, receiver, message_count)"
+    "), new_contacts AS ("
+    f"INSERT INTO {CommunicationContactModel.__table__.fullname} "
+    "(id, case_id, participant, contact) "
+    f"SELECT {UUID7_SQL}, :case_id, pair.participant, pair.contact "
+    "FROM (SELECT DISTINCT least(sender, receiver) AS participant, "
+    "greatest(sender, receiver) AS contact FROM batch) AS pair "
+    "ORDER BY pair.participant, pair.contact "
+    "ON CONFLICT (case_id, participant, contact) DO NOTHING "
+    "RETURNING participant, contact"
+    "), ends AS ("
+    "SELECT sender AS participant, message_count AS sent, 0 AS received, "
+    "0 AS contacts FROM batch "
+    "UNION ALL SELECT receiver, 0, message_count, 0 FROM batch "
+    "UNION ALL SELECT participant, 0, 0, 1 FROM new_contacts "
+    "UNION ALL SELECT contact, 0, 0, 1 FROM new_contacts "
+    "WHERE contact <> participant"
+    ") "
+    f"UPDATE {CommunicationParticipantModel.__table__.fullname} AS participant "
+    "SET sent = participant.sent + totals.sent, "
+    "received = participant.received + totals.received, "
+    "contacts = participant.contacts + totals.contacts, "
+    "last_seen = now(), updated_at = now() "
+    "FROM (SELECT participant, sum(sent) AS sent, sum(received) AS received, "
+    "sum(contacts) AS contacts FROM ends GROUP BY participant) AS totals "
+    "WHERE participant.case_id = :case_id "
+    "AND participant.participant = totals.participant"
+).bindparams(
+    bindparam("case_id", type_=SA_UUID),
+    bindparam("senders", type_=ARRAY(String)),
+    bindparam("receivers", type_=ARRAY(String)),
+    bindparam("counts", type_=ARRAY(BigInteger)),
+)
+
+# After a rebuild, when the participants' edges were first and last loaded
+COMMUNICATION_PARTICIPANTS_SEEN_UPDATE = text(
+    f"UPDATE {CommunicationParticipantModel.__table__.fullname} AS participant "
+    "SET first_seen = seen.first_seen, last_seen = seen.last_seen "
+    "FROM (SELECT participant, min(first_seen) AS first_seen, "
+    "max(last_seen) AS last_seen FROM ("
+    "SELECT sender AS participant, first_seen, last_seen "
+    f"FROM {CommunicationEdgeModel.__table__.fullname} WHERE case_id = :case_id "
+    "UNION ALL SELECT receiver, first_seen, last_seen "
+    f"FROM {CommunicationEdgeModel.__table__.fullname} WHERE case_id = :case_id"
+    ") AS ends GROUP BY participant) AS seen "
+    "WHERE participant.case_id = :case_id "
+    "AND participant.participant = seen.participant"
+).bindparams(bindparam("case_id", type_=SA_UUID))
+
+Edge = CommunicationEdgeModel
+Component = CommunicationComponentModel
+Participant = CommunicationParticipantModel
+
+
+class CommunicationGraphRepository(ICommunicationGraphRepository):
+    def __init__(self, session):
+        self.session = session
+
+    # ------------------------------------------------------------
+    # Writes at ingest time, committed by the caller with the batch
+    # ------------------------------------------------------------
+    def add_edges(self, edges: List[CommunicationEdgeEntity]) -> None:
+        # One statement over arrays, a batch can hold as many pairs as messages.
+        # Rows are locked in key order, parallel chunks of an evidence share
+        # many pairs and would deadlock taking them in different orders.
+        self.session.execute(
+            COMMUNICATION_EDGES_UPSERT,
+            {
+                "case_ids": [edge.case_id for edge in edges],
+                "evidence_ids": [edge.evidence_id for edge in edges],
+                "senders": [edge.sender for edge in edges],
+                "receivers": [edge.receiver for edge in edges],
+                "counts": [edge.message_count for edge in edges],
+            },
+        )
+        self._add_components(
+            edges[0].case_id,
+            [(edge.sender, edge.receiver, edge.message_count) for edge in edges],
+        )
+
+    def clone_edges(self, source_evidence_id: str, evidence: EvidenceEntity) -> None:
+        self.session.execute(
+            text(
+                f"INSERT INTO {Edge.__table__.fullname} "
+                "(id, case_id, evidence_id, sender, receiver, message_count, "
+                "first_seen, last_seen) "
+                f"SELECT {UUID7_SQL}, :case_id, :evidence_id, sender, receiver, "
+                "message_count, now(), now() "
+                f"FROM {Edge.__table__.fullname} "
+                "WHERE evidence_id = :source_evidence_id"
+            ),
+            {
+                "case_id": evidence.case_id,
+                "evidence_id": evidence.id,
+                "source_evidence_id": source_evidence_id,
+            },
+        )
+        stmt = select(Edge.sender, Edge.receiver, Edge.message_count).where(
+            Edge.evidence_id == source_evidence_id
+        )
+        edges = [tuple(row) for row in self.session.execute(stmt)]
+        if edges:
+            self._add_components(evidence.case_id, edges)
+
+    def rebuild_components(self, case_id: UUID) -> None:
+        # Edges deleted with an evidence may split a component, which merging
+        # can't undo: the case's components, and the totals of their
+        # participants, are computed again from scratch
+        self.session.execute(COMMUNICATION_COMPONENTS_LOCK, {"case_id": case_id})
+        for model in (Component, CommunicationContactModel):
+            self.session.execute(delete(model).where(model.case_id == case_id))
+        stmt = (
+            select(
+                Edge.sender,
+                Edge.receiver,
+                func.sum(Edge.message_count),
+            )
+            .where(Edge.case_id == case_id)
+            .group_by(Edge.sender, Edge.receiver)
+        )
+        edges = [tuple(row) for row in self.session.execute(stmt)]
+        try:
+            if edges:
+                self._add_components(case_id, edges)
+                self.session.execute(
+                    COMMUNICATION_PARTICIPANTS_SEEN_UPDATE, {"case_id": case_id}
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def _add_components(self, case_id: UUID, edges: List[Tuple[str, str, int]]) -> None:
+        """
+        Merge the components the edges join and add them to the totals of
+        their participants, reading only those participants: a batch costs
+        the same however large its case.
+        """
+        self.session.execute(COMMUNICATION_COMPONENTS_LOCK, {"case_id": case_id})
+
+        participants = sorted(
+            {participant for edge in edges for participant in edge[:2]}
+        )
+        stmt = (
+            select(
+                Participant.participant,
+                Component.id,
+                Component.size,
+                Component.message_count,
+            )
+            .join(
+                Component,
+                Component.id == Participant.component_id,
+            )
+            .where(
+                Participant.case_id == case_id,
+                Participant.participant == any_(literal(participants, ARRAY(String))),
+            )
+        )
+        known = {
+            participant: (component_id, size, message_count)
+            for participant, component_id, size, message_count in self.session.execute(
+                stmt
+            )
+        }
+        merges = merge_components(edges, known)
+
+        self.session.execute(
+            COMMUNICATION_COMPONENTS_UPSERT,
+            {
+                "case_id": case_id,
+                "ids": [merge.component_id for merge in merges],
+                "sizes": [merge.size for merge in merges],
+                "counts": [merge.message_count for merge in merges],
+            },
+        )
+        relabels = [
+            (merged_id, merge.component_id)
+            for merge in merges
+            for merged_id in merge.merged_ids
+        ]
+        if relabels:
+            merged_ids, component_ids = zip(*relabels)
+            self.session.execute(
+                COMMUNICATION_PARTICIPANTS_RELABEL,
+                {"merged_ids": list(merged_ids), "component_ids": list(component_ids)},
+            )
+            self.session.execute(delete(Component).where(Component.id.in_(merged_ids)))
+        joined = [
+            (participant, merge.component_id)
+            for merge in merges
+            for participant in merge.new_participants
+        ]
+        if joined:
+            new_participants, component_ids = zip(*joined)
+            self.session.execute(
+                COMMUNICATION_PARTICIPANTS_INSERT,
+                {
+                    "case_id": case_id,
+                    "participants": list(new_participants),
+                    "component_ids": list(component_ids),
+                },
+            )
+        self.session.execute(
+            COMMUNICATION_PARTICIPANTS_TOTALS_UPDATE,
+            {
+                "case_id": case_id,
+                "senders": [edge[0] for edge in edges],
+                "receivers": [edge[1] for edge in edges],
+                "counts": [edge[2] for edge in edges],
+            },
+        )
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+    async def top_talkers(self, case_id: UUID, limit: int) -> List[dict]:
+        # Totals kept at ingest, read off the participants' index
+        stmt = (
+            select(
+                Participant.participant,
+                Participant.sent,
+                Participant.received,
+                Participant.contacts,
+                Participant.first_seen,
+                Participant.last_seen,
+            )
+            .where(Participant.case_id == case_id)
+            .order_by(Participant.message_count.desc(), Participant.participant)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def top_contacts(
+        self, case_id: UUID, participant: str, limit: int
+    ) -> List[str]:
+        incident = union_all(
+            select(
+                Edge.receiver.label("contact"), Edge.message_count.label("count")
+            ).where(Edge.case_id == case_id, Edge.sender == participant),
+            select(Edge.sender, Edge.message_count).where(
+                Edge.case_id == case_id, Edge.receiver == participant
+            ),
+        ).subquery("incident")
+
+        stmt = (
+            select(incident.c.contact)
+            .where(incident.c.contact != participant)
+            .group_by(incident.c.contact)
+            .order_by(func.sum(incident.c.count).desc(), incident.c.contact)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
+
+    async def list_edges_between(
+        self, case_id: UUID, participants: List[str]
+    ) -> List[dict]:
+        stmt = (
+            select(
+                Edge.sender,
+                Edge.receiver,
+                func.sum(Edge.message_count).label("message_count"),
+                func.min(Edge.first_seen).label("first_seen"),
+                func.max(Edge.last_seen).label("last_seen"),
+            )
+            .where(
+                Edge.case_id == case_id,
+                Edge.sender.in_(participants),
+                Edge.receiver.in_(participants),
+            )
+            .group_by(Edge.sender, Edge.receiver)
+            .order_by(Edge.sender, Edge.receiver)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def count_components(self, case_id: UUID, min_size: int) -> int:
+        stmt = select(func.count()).where(
+            Component.case_id == case_id, Component.size >= min_size
+        )
+        return (await self.session.execute(stmt)).scalar_one()
+
+    async def list_components(
+        self, case_id: UUID, min_size: int, limit: int, max_participants: int
+    ) -> List[dict]:
+        components = (
+            select(Component.id, Component.size, Component.message_count)
+            .where(Component.case_id == case_id, Component.size >= min_size)
+            .order_by(
+                Component.size.desc(),
+                Component.message_count.desc(),
+                Component.id.desc(),
+            )
+            .limit(limit)
+            .subquery("components")
+        )
+        # The first members of each component by name, read off its index only
+        members = (
+            select(Participant.participant)
+            .where(Participant.component_id == components.c.id)
+            .order_by(Participant.participant)
+            .limit(max_participants)
+            .lateral("members")
+        )
+        stmt = (
+            select(
+                components.c.id,
+                components.c.size,
+                components.c.message_count,
+                members.c.participant,
+            )
+            .select_from(components)
+            .outerjoin(members, true())
+            .order_by(
+                components.c.size.desc(),
+                components.c.message_count.desc(),
+                components.c.id.desc(),
+                members.c.participant,
+            )
+        )
+
+        rows: Dict[UUID, dict] = {}
+        for (
+            component_id,
+            size,
+            message_count,
+            participant,
+        ) in await self.session.execute(stmt):
+            row = rows.setdefault(
+                component_id,
+                {"size": size, "message_count": message_count, "participants": []},
+            )
+            if participant is not None:
+                row["participants"].append(participant)
+        return list(rows.values())
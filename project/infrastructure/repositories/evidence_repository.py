@@ -1,17 +1,97 @@
-from typing import List, Optional
+import csv
+import io
+import json
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+from uuid import UUID
 
-from sqlalchemy import insert
+from sqlalchemy import delete, func, insert, select, text, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from project.application.interfaces.evidence_repository_interface import (
     IEvidenceRepository,
 )
-from project.domain.entities import EvidenceEntity, MessageEntity
-from project.infrastructure.database.models import EvidenceModel, MessageModel
+from project.application.utils.message_batch import MessageBatch, MessageRow
+from project.application.utils.uuid7 import UUID7_SQL, uuid7
+from project.core.config import settings
+from project.domain.entities import (
+    EvidenceEntity,
+    EvidenceProgressEntity,
+    IngestionCheckpointEntity,
+    QuarantinedRowEntity,
+)
+from project.domain.enums import EvidenceStatus
+from project.infrastructure.database.models import (
+    CaseModel,
+    EvidenceModel,
+    IngestionCheckpointModel,
+    MessageIndicatorModel,
+    MessageModel,
+    NearDuplicateClusterModel,
+    QuarantinedRowModel,
+    SharedCaseUserModel,
+    WatchlistHitModel,
+    WatchlistModel,
+)
+from project.infrastructure.exceptions.exceptions import AccessDeniedError
+from project.infrastructure.mappers.entity_mapper import EntityMapper
+
+MESSAGE_COPY_COLUMNS = (
+    "id",
+    "evidence_id",
+    "sender",
+    "receiver",
+    "payload",
+    "status",
+    "attributes",
+)
+
+# Unquoted empty CSV fields are NULL for COPY, keep them as empty strings instead
+MESSAGE_COPY_SQL = (
+    f"COPY {MessageModel.__table__.fullname} ({', '.join(MESSAGE_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (sender, receiver, payload))"
+)
+
+INSERT_ROWS_PER_STATEMENT = 1000
+
+
+class CsvCopyStream:
+    """
+    Read-only text stream rendering rows as CSV only as COPY pulls them, so a
+    batch is never held in memory a second time as one big CSV document.
+    """
+
+    ROWS_PER_RENDER = 1024
+
+    def __init__(self, rows: Iterable[tuple]):
+        self.rows = iter(rows)
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        self.pending = ""
+        self.exhausted = False
+
+    def read(self, size: int = -1) -> str:
+        while not self.exhausted and (size < 0 or len(self.pending) < size):
+            self.writer.writerows(islice(self.rows, self.ROWS_PER_RENDER))
+            rendered = self.buffer.getvalue()
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.exhausted = not rendered
+            self.pending += rendered
+
+        if size < 0 or size >= len(self.pending):
+            data, self.pending = self.pending, ""
+        else:
+            data, self.pending = self.pending[:size], self.pending[size:]
+        return data
 
 
 class EvidenceRepository(IEvidenceRepository):
-    def __init__(self, session):
+    def __init__(self, session, bulk_load_method: Optional[str] = None):
         self.session = session
+        self.bulk_load_method = bulk_load_method or settings.evidence.bulk_load_method
 
     def create(self, evidence: EvidenceEntity) -> EvidenceEntity:
         db_evidence = EvidenceModel(
@@ -20,6 +100,9 @@ class EvidenceRepository(IEvidenceRepository):
             source=evidence.source,
             status=evidence.status,
             format=evidence.format,
+            metadata_json=dict(evidence.metadata),
+            attributes=evidence.attributes,
+            content_hash=evidence.content_hash,
         )
         self.session.add(db_evidence)
         self.session.commit()
@@ -30,7 +113,26 @@ class EvidenceRepository(IEvidenceRepository):
         evidence.updated_at = db_evidence.updated_at
         return evidence
 
+    def get(self, evidence_id: str) -> Optional[EvidenceEntity]:
+        db_evidence = (
+            self.session.query(EvidenceModel).filter_by(id=evidence_id).first()
+        )
+        if not db_evidence:
+            return None
+
+        return EntityMapper.to_evidence_entity(db_evidence)
+
     def update(self, evidence: EvidenceEntity) -> EvidenceEntity:
+        db_evidence = self._assign(evidence)
+
+        self.session.commit()
+        self.session.refresh(db_evidence)
+
+        # Reflect updated data back into domain entity
+        evidence.updated_at = db_evidence.updated_at
+        return evidence
+
+    def _assign(self, evidence: EvidenceEntity) -> EvidenceModel:
         db_evidence = (
             self.session.query(EvidenceModel).filter_by(id=evidence.id).first()
         )
@@ -42,13 +144,8 @@ class EvidenceRepository(IEvidenceRepository):
         db_evidence.source = evidence.source
         db_evidence.status = evidence.status
         db_evidence.format = evidence.format
-
-        self.session.commit()
-        self.session.refresh(db_evidence)
-
-        # Reflect updated data back into domain entity
-        evidence.updated_at = db_evidence.updated_at
-        return evidence
+        db_evidence.metadata_json = evidence.metadata
+        return db_evidence
 
     # def create_messages(self, messages: List[MessageEntity]) -> None:
     #     if not messages:
@@ -70,32 +167,345 @@ class EvidenceRepository(IEvidenceRepository):
     #     self.session.bulk_save_objects(db_messages)
     #     self.session.commit()
 
-    def create_messages(self, messages: List[MessageEntity]) -> None:
-        if not messages:
-            return
+    def get_checkpoint(
+        self, evidence_id: str, chunk_start: int
+    ) -> Optional[IngestionCheckpointEntity]:
+        db_checkpoint = (
+            self.session.query(IngestionCheckpointModel)
+            .filter_by(evidence_id=evidence_id, chunk_start=chunk_start)
+            .first()
+        )
+        if not db_checkpoint:
+            return None
+
+        return IngestionCheckpointEntity(
+            evidence_id=db_checkpoint.evidence_id,
+            chunk_start=db_checkpoint.chunk_start,
+            chunk_end=db_checkpoint.chunk_end,
+            byte_offset=db_checkpoint.byte_offset,
+            row_count=db_checkpoint.row_count,
+            rejected_count=db_checkpoint.rejected_count,
+            last_message_id=db_checkpoint.last_message_id,
+            completed=db_checkpoint.completed,
+            created_at=db_checkpoint.created_at,
+            updated_at=db_checkpoint.updated_at,
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        try:
+            yield
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+    def create_messages(
+        self,
+        messages: MessageBatch,
+        checkpoint: Optional[IngestionCheckpointEntity] = None,
+        quarantined_rows: Optional[List[QuarantinedRowEntity]] = None,
+    ) -> None:
+        if messages and self.bulk_load_method == "copy" and self._supports_copy():
+            self._copy_messages(messages.rows())
+        elif messages:
+            self._insert_messages(messages.rows())
+        if checkpoint and messages:
+            checkpoint.last_message_id = messages.last_id
+
+        if quarantined_rows:
+            self._insert_quarantined_rows(quarantined_rows)
 
+        # Same transaction as the batch, so a resume never replays committed rows
+        if checkpoint:
+            self._save_checkpoint(checkpoint)
+
+    def _save_checkpoint(self, checkpoint: IngestionCheckpointEntity) -> None:
+        values = {
+            "byte_offset": checkpoint.byte_offset,
+            "chunk_end": checkpoint.chunk_end,
+            "row_count": checkpoint.row_count,
+            "rejected_count": checkpoint.rejected_count,
+            "last_message_id": checkpoint.last_message_id,
+            "completed": checkpoint.completed,
+        }
+        stmt = pg_insert(IngestionCheckpointModel).values(
+            id=uuid7(),
+            evidence_id=checkpoint.evidence_id,
+            chunk_start=checkpoint.chunk_start,
+            **values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["evidence_id", "chunk_start"],
+            set_={**values, "updated_at": func.now()},
+        )
+        self.session.execute(stmt)
+
+    def _supports_copy(self) -> bool:
+        return self.session.get_bind().dialect.driver == "psycopg2"
+
+    def _copy_messages(self, rows: Iterator[MessageRow]) -> None:
+        """Stream the rows as CSV through COPY FROM STDIN on the session connection."""
+        stream = CsvCopyStream(
+            (*row[:-1], self._dump_attributes(row[-1])) for row in rows
+        )
+
+        # Raw psycopg2 connection bound to the session's current transaction
+        dbapi_connection = self.session.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(MESSAGE_COPY_SQL, stream)
+
+    def _insert_messages(self, rows: Iterator[MessageRow]) -> None:
+        # Several smaller statements, a single one would render the whole batch
+        while data := [
+            dict(zip(MESSAGE_COPY_COLUMNS, row))
+            for row in islice(rows, INSERT_ROWS_PER_STATEMENT)
+        ]:
+            self.session.execute(insert(MessageModel).values(data))
+
+    def _insert_quarantined_rows(self, rows: List[QuarantinedRowEntity]) -> None:
         data = [
             {
-                "id": message.id,
-                "evidence_id": message.evidence_id,
-                "sender": message.sender,
-                "receiver": message.receiver,
-                "payload": message.payload,
-                "status": message.status,
-                "embeddings": message.embeddings,
+                "id": row.id or uuid7(),
+                "evidence_id": row.evidence_id,
+                "line_number": row.line_number,
+                "byte_offset": row.byte_offset,
+                "reason": row.reason,
+                "raw": row.raw,
             }
-            for message in messages
+            for row in rows
         ]
 
-        stmt = insert(MessageModel).values(data)
-        self.session.execute(stmt)
-        self.session.commit()
+        self.session.execute(insert(QuarantinedRowModel).values(data))
+
+    @staticmethod
+    def _dump_attributes(attributes: Optional[list]) -> Optional[str]:
+        # Compact separators, the JSON column keeps the text as written
+        if attributes is None:
+            return None
+        return json.dumps(attributes, separators=(",", ":"), ensure_ascii=False)
+
+    def clone_messages(self, source_evidence_id: str, evidence: EvidenceEntity) -> None:
+        # Copied server-side, rows never travel to the worker. The new ids are
+        # drawn up front so the mentions of indicators follow their messages.
+        messages = MessageModel.__table__.fullname
+        clusters = NearDuplicateClusterModel.__table__.fullname
+        hits = WatchlistHitModel.__table__.fullname
+        self.session.execute(
+            text(
+                "WITH copied AS MATERIALIZED ("
+                f"SELECT id AS source_id, {UUID7_SQL} AS id FROM {messages} "
+                "WHERE evidence_id = :source_evidence_id"
+                "), copied_messages AS ("
+                f"INSERT INTO {messages} "
+                "(id, evidence_id, sender, receiver, payload, status, embeddings, "
+                "attributes) "
+                "SELECT copied.id, :evidence_id, sender, receiver, payload, "
+                "status, embeddings, attributes "
+                f"FROM {messages} AS message "
+                "JOIN copied ON copied.source_id = message.id "
+                "WHERE message.evidence_id = :source_evidence_id"
+                "), copied_mentions AS ("
+                f"INSERT INTO {MessageIndicatorModel.__table__.fullname} "
+                "(id, indicator_id, evidence_id, message_id) "
+                f"SELECT {UUID7_SQL}, mention.indicator_id, :evidence_id, copied.id "
+                f"FROM {MessageIndicatorModel.__table__.fullname} AS mention "
+                "JOIN copied ON copied.source_id = mention.message_id "
+                "WHERE mention.evidence_id = :source_evidence_id"
+                "), copied_hits AS ("
+                # Only hits of watchlists that apply to the evidence's case
+                f"INSERT INTO {hits} "
+                "(id, evidence_id, message_id, watchlist_id, term) "
+                f"SELECT {UUID7_SQL}, :evidence_id, copied.id, hit.watchlist_id, "
+                "hit.term "
+                f"FROM {hits} AS hit "
+                "JOIN copied ON copied.source_id = hit.message_id "
+                f"JOIN {WatchlistModel.__table__.fullname} AS watchlist "
+                "ON watchlist.id = hit.watchlist_id "
+                "WHERE hit.evidence_id = :source_evidence_id "
+                "AND (watchlist.case_id = :case_id OR watchlist.case_id IS NULL "
+                "AND watchlist.user_id = ("
+                f"SELECT user_id FROM {CaseModel.__table__.fullname} "
+                "WHERE id = :case_id))"
+                ") "
+                # Shares keep their cluster ids: in the source's case the copy
+                # adds to its clusters, in another it starts them
+                f"INSERT INTO {clusters} "
+                "(id, case_id, evidence_id, cluster_id, message_count, "
+                "sample_message_id) "
+                f"SELECT {UUID7_SQL}, :case_id, :evidence_id, share.cluster_id, "
+                "share.message_count, copied.id "
+                f"FROM {clusters} AS share "
+                "JOIN copied ON copied.source_id = share.sample_message_id "
+                "WHERE share.evidence_id = :source_evidence_id"
+            ),
+            {
+                "case_id": evidence.case_id,
+                "evidence_id": evidence.id,
+                "source_evidence_id": source_evidence_id,
+            },
+        )
+        # Committed together with the copy, so a retry never clones twice
+        self._assign(evidence)
+
+    async def get_parsed_by_content_hash(
+        self, content_hash: str, column_mapping: dict
+    ) -> Optional[EvidenceEntity]:
+        stmt = (
+            select(EvidenceModel)
+            .where(
+                EvidenceModel.content_hash == content_hash,
+                EvidenceModel.status == EvidenceStatus.PARSED,
+                EvidenceModel.metadata_json["column_mapping"]
+                == type_coerce(column_mapping, JSONB),
+            )
+            .order_by(EvidenceModel.created_at.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        db_evidence = result.scalars().first()
+        if not db_evidence:
+            return None
+
+        return EntityMapper.to_evidence_entity(db_evidence)
+
+    async def get_progress(
+        self, evidence_id: UUID, user_id: UUID
+    ) -> EvidenceProgressEntity:
+        # Only evidences and checkpoints are read, never the messages table
+        has_access = (
+            select(SharedCaseUserModel.id)
+            .where(
+                SharedCaseUserModel.case_id == EvidenceModel.case_id,
+                SharedCaseUserModel.user_id == user_id,
+            )
+            .exists()
+        )
+        stmt = (
+            select(
+                EvidenceModel,
+                func.coalesce(func.sum(IngestionCheckpointModel.row_count), 0),
+                func.coalesce(func.sum(IngestionCheckpointModel.rejected_count), 0),
+                func.coalesce(
+                    func.sum(
+                        IngestionCheckpointModel.byte_offset
+                        - IngestionCheckpointModel.chunk_start
+                    ),
+                    0,
+                ),
+                func.count(IngestionCheckpointModel.id).filter(
+                    IngestionCheckpointModel.completed.is_(True)
+                ),
+                func.max(
+                    func.coalesce(
+                        IngestionCheckpointModel.updated_at,
+                        IngestionCheckpointModel.created_at,
+                    )
+                ),
+            )
+            .outerjoin(
+                IngestionCheckpointModel,
+                IngestionCheckpointModel.evidence_id == EvidenceModel.id,
+            )
+            .where(EvidenceModel.id == evidence_id, has_access)
+            .group_by(EvidenceModel.id)
+        )
+        result = await self.session.execute(stmt)
+        row = result.first()
+        if not row:
+            raise AccessDeniedError("Evidence not found or access denied")
+
+        db_evidence, rows, rejected, processed, completed, updated_at = row
+        metadata = db_evidence.metadata_json or {}
+        return EvidenceProgressEntity(
+            evidence_id=db_evidence.id,
+            case_id=db_evidence.case_id,
+            status=db_evidence.status,
+            total_bytes=metadata.get("size", 0),
+            bytes_processed=int(processed),
+            rows_processed=int(rows),
+            rows_rejected=int(rejected),
+            chunks_total=metadata.get("chunks", 1),
+            chunks_completed=completed,
+            started_at=db_evidence.created_at,
+            updated_at=updated_at,
+        )
+
+    async def list_quarantined_rows(
+        self, evidence_id: UUID, user_id: UUID, limit: int, offset: int
+    ) -> List[QuarantinedRowEntity]:
+        has_access = (
+            select(SharedCaseUserModel.id)
+            .where(
+                SharedCaseUserModel.case_id == EvidenceModel.case_id,
+                SharedCaseUserModel.user_id == user_id,
+            )
+            .exists()
+        )
+        evidence = await self.session.execute(
+            select(EvidenceModel.id).where(EvidenceModel.id == evidence_id, has_access)
+        )
+        if not evidence.first():
+            raise AccessDeniedError("Evidence not found or access denied")
+
+        stmt = (
+            select(QuarantinedRowModel)
+            .where(QuarantinedRowModel.evidence_id == evidence_id)
+            .order_by(
+                QuarantinedRowModel.line_number.nulls_last(),
+                QuarantinedRowModel.created_at,
+            )
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        return [
+            QuarantinedRowEntity(
+                id=db_row.id,
+                evidence_id=db_row.evidence_id,
+                line_number=db_row.line_number,
+                byte_offset=db_row.byte_offset,
+                reason=db_row.reason,
+                raw=db_row.raw,
+                created_at=db_row.created_at,
+            )
+            for db_row in result.scalars()
+        ]
 
     async def get_by_id(self, evidence_id: str) -> Optional[EvidenceEntity]:
-        pass
+        result = await self.session.execute(
+            select(EvidenceModel).where(EvidenceModel.id == evidence_id)
+        )
+        db_evidence = result.scalars().first()
+        if not db_evidence:
+            return None
+
+        return EntityMapper.to_evidence_entity(db_evidence)
 
     async def list_by_case_id(self, case_id: str) -> List[EvidenceEntity]:
-        pass
+        result = await self.session.execute(
+            select(EvidenceModel)
+            .where(EvidenceModel.case_id == case_id)
+            .order_by(EvidenceModel.id)
+        )
+        return [EntityMapper.to_evidence_entity(e) for e in result.scalars()]
 
-    async def delete(self, evidence_id: str) -> None:
-        pass
+    async def delete(self, evidence_id: UUID, user_id: UUID) -> None:
+        stmt = (
+            select(EvidenceModel.id)
+            .join(CaseModel, CaseModel.id == EvidenceModel.case_id)
+            .where(EvidenceModel.id == evidence_id, CaseModel.user_id == user_id)
+        )
+        result = await self.session.execute(stmt)
+        if not result.first():
+            raise AccessDeniedError("Evidence not found or access denied")
+
+        # Pruned to the evidence's partition and one key range of its index;
+        # checkpoints and quarantined rows go with the evidence by cascade
+        await self.session.execute(
+            delete(MessageModel).where(MessageModel.evidence_id == evidence_id)
+        )
+        await self.session.execute(
+            delete(EvidenceModel).where(EvidenceModel.id == evidence_id)
+        )
+        await self.session.commit()
@@ -3,6 +3,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from project.application.interfaces.group_repository_interface import IGroupRepository
@@ -142,21 +143,17 @@ class GroupRepository(IGroupRepository):
         if not group:
             raise AccessDeniedError("Group not found or access denied")
 
-        # Check if already in group
-        stmt = select(UserGroupAssociationModel).where(
-            UserGroupAssociationModel.user_id == user_to_add,
-            UserGroupAssociationModel.group_id == group_id,
+        # The unique constraint settles concurrent adds, a skipped row is a duplicate
+        stmt = (
+            pg_insert(UserGroupAssociationModel)
+            .values(user_id=user_to_add, group_id=group_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "group_id"])
+            .returning(UserGroupAssociationModel.id)
         )
         result = await self.session.execute(stmt)
-        existing = result.scalars().first()
-        if existing:
+        if not result.first():
             raise DuplicateAssociationError("User already in group")
 
-        association = UserGroupAssociationModel(
-            user_id=user_to_add,
-            group_id=group_id,
-        )
-        self.session.add(association)
         await self.session.commit()
 
     # ------------------------------------------------------------
@@ -184,25 +181,27 @@ class GroupRepository(IGroupRepository):
         if not members:
             raise NotFoundError("Group not found or empty")
 
-        # Check if case already shared with group
-        stmt = select(SharedCaseGroupModel).where(
-            SharedCaseGroupModel.case_id == case_id,
-            SharedCaseGroupModel.group_id == group_id,
+        # Share with group, a skipped row means it already was
+        stmt = (
+            pg_insert(SharedCaseGroupModel)
+            .values(case_id=case_id, group_id=group_id)
+            .on_conflict_do_nothing(index_elements=["case_id", "group_id"])
+            .returning(SharedCaseGroupModel.id)
         )
         result = await self.session.execute(stmt)
-        shared = result.scalars().first()
-        if shared:
+        if not result.first():
             raise DuplicateAssociationError("Case already shared with this group")
 
-        # Share with group
-        shared_group = SharedCaseGroupModel(case_id=case_id, group_id=group_id)
-        self.session.add(shared_group)
-
-        # Also share with each member (via SharedCaseUserModel)
-        for member in members:
-            self.session.add(
-                SharedCaseUserModel(case_id=case_id, user_id=member.user_id)
+        # Also share with each member (via SharedCaseUserModel), skipping members
+        # who already have access, such as the owner
+        stmt = (
+            pg_insert(SharedCaseUserModel)
+            .values(
+                [{"case_id": case_id, "user_id": member.user_id} for member in members]
             )
+            .on_conflict_do_nothing(index_elements=["case_id", "user_id"])
+        )
+        await self.session.execute(stmt)
 
         await self.session.commit()
 
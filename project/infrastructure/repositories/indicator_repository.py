@@ -0,0 +1,165 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import String, bindparam, distinct, func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.application.interfaces.indicator_repository_interface import (
+    IIndicatorRepository,
+)
+from project.application.utils.indicators import IndicatorMatch, indicator_id
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.uuid7 import UUID7_SQL
+from project.infrastructure.database.models import (
+    EvidenceModel,
+    IndicatorModel,
+    MessageIndicatorModel,
+    MessageModel,
+    SharedCaseUserModel,
+)
+
+# Indicators already seen keep their row, their ids are derived from the values
+INDICATORS_INSERT = text(
+    f"INSERT INTO {IndicatorModel.__table__.fullname} (id, kind, value) "
+    "SELECT id, kind, value FROM unnest(:ids, :kinds, :values) "
+    "AS batch (id, kind, value) "
+    "ORDER BY id "
+    "ON CONFLICT (id) DO NOTHING"
+).bindparams(
+    bindparam("ids", type_=ARRAY(SA_UUID)),
+    bindparam("kinds", type_=ARRAY(String)),
+    bindparam("values", type_=ARRAY(String)),
+)
+
+MESSAGE_INDICATORS_INSERT = text(
+    f"INSERT INTO {MessageIndicatorModel.__table__.fullname} "
+    "(id, indicator_id, evidence_id, message_id) "
+    f"SELECT {UUID7_SQL}, indicator_id, :evidence_id, message_id "
+    "FROM unnest(:indicator_ids, :message_ids) AS batch (indicator_id, message_id)"
+).bindparams(
+    bindparam("evidence_id", type_=SA_UUID),
+    bindparam("indicator_ids", type_=ARRAY(SA_UUID)),
+    bindparam("message_ids", type_=ARRAY(SA_UUID)),
+)
+
+Mention = MessageIndicatorModel
+
+
+class IndicatorRepository(IIndicatorRepository):
+    def __init__(self, session):
+        self.session = session
+
+    def add_mentions(
+        self, messages: MessageBatch, indicators: List[IndicatorMatch]
+    ) -> None:
+        # Looked up by their position in the batch, the messages now have ids
+        ids = {
+            (match.kind, match.value): indicator_id(match.kind, match.value)
+            for match in indicators
+        }
+        self.session.execute(
+            INDICATORS_INSERT,
+            {
+                "ids": list(ids.values()),
+                "kinds": [kind.value for kind, _ in ids],
+                "values": [value for _, value in ids],
+            },
+        )
+        self.session.execute(
+            MESSAGE_INDICATORS_INSERT,
+            {
+                "evidence_id": messages.evidence_id,
+                "indicator_ids": [ids[match.kind, match.value] for match in indicators],
+                "message_ids": [messages.ids[match.row] for match in indicators],
+            },
+        )
+
+    async def list_indicator_cases(
+        self, value: str, kind: Optional[str], user_id: UUID
+    ) -> List[dict]:
+        # The value index finds the indicator, the primary key of the mentions
+        # then every evidence mentioning it
+        conditions = [IndicatorModel.value == value]
+        if kind:
+            conditions.append(IndicatorModel.kind == kind)
+        has_access = (
+            select(SharedCaseUserModel.id)
+            .where(
+                SharedCaseUserModel.case_id == EvidenceModel.case_id,
+                SharedCaseUserModel.user_id == user_id,
+            )
+            .exists()
+        )
+
+        messages = func.count()
+        stmt = (
+            select(
+                IndicatorModel.kind,
+                IndicatorModel.value,
+                EvidenceModel.case_id,
+                func.count(distinct(Mention.evidence_id)).label("evidences"),
+                messages.label("messages"),
+                func.min(Mention.created_at).label("first_seen"),
+                func.max(Mention.created_at).label("last_seen"),
+            )
+            .join(Mention, Mention.indicator_id == IndicatorModel.id)
+            .join(EvidenceModel, EvidenceModel.id == Mention.evidence_id)
+            .where(*conditions, has_access)
+            .group_by(IndicatorModel.kind, IndicatorModel.value, EvidenceModel.case_id)
+            .order_by(messages.desc(), EvidenceModel.case_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def list_indicator_messages(
+        self,
+        evidence_ids: List[UUID],
+        value: str,
+        kind: Optional[str],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Mentions are read in primary key order, each message then fetched by
+        its own key from the partition of its evidence.
+        """
+        if not evidence_ids:
+            return []
+
+        conditions = [
+            IndicatorModel.value == value,
+            Mention.evidence_id.in_(evidence_ids),
+        ]
+        if kind:
+            conditions.append(IndicatorModel.kind == kind)
+        if after:
+            conditions.append(
+                tuple_(Mention.evidence_id, Mention.message_id) > tuple_(*after)
+            )
+
+        stmt = (
+            select(
+                IndicatorModel.kind,
+                IndicatorModel.value,
+                MessageModel.id,
+                MessageModel.evidence_id,
+                MessageModel.sender,
+                MessageModel.receiver,
+                MessageModel.payload,
+                MessageModel.created_at,
+            )
+            .join(Mention, Mention.indicator_id == IndicatorModel.id)
+            .join(
+                MessageModel,
+                (MessageModel.evidence_id == Mention.evidence_id)
+                & (MessageModel.id == Mention.message_id),
+            )
+            .where(*conditions)
+            .order_by(Mention.evidence_id, Mention.message_id)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
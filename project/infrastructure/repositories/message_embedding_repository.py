@@ -0,0 +1,96 @@
+from itertools import groupby
+from typing import List, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import LargeBinary, bindparam, select, text
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.application.interfaces.message_embedding_repository_interface import (
+    IMessageEmbeddingRepository,
+    MessageEmbeddings,
+    PendingMessage,
+)
+from project.application.utils.embeddings import decode_embeddings, encode_embeddings
+from project.domain.enums import MessageStatus
+from project.infrastructure.database.models import MessageModel
+
+# One statement per evidence, its constant key prunes the update to a single
+# partition. The claimed ids are in key order, bounding them keeps the join from
+# reading every message of the evidence.
+MESSAGE_EMBEDDINGS_UPDATE = text(
+    f"UPDATE {MessageModel.__table__.fullname} AS message "
+    "SET embeddings = batch.embedding, status = :status "
+    "FROM unnest(:ids, :embeddings) AS batch (id, embedding) "
+    "WHERE message.evidence_id = :evidence_id "
+    "AND message.id BETWEEN :first_id AND :last_id AND message.id = batch.id"
+).bindparams(
+    bindparam("ids", type_=ARRAY(SA_UUID)),
+    bindparam("embeddings", type_=ARRAY(LargeBinary)),
+)
+
+
+class MessageEmbeddingRepository(IMessageEmbeddingRepository):
+    def __init__(self, session):
+        self.session = session
+
+    def claim_pending_messages(
+        self, limit: int, evidence_id: Optional[str] = None
+    ) -> List[PendingMessage]:
+        # Walks the partial index of pending messages, the rows locked here stay
+        # locked until the transaction ends
+        stmt = (
+            select(MessageModel.evidence_id, MessageModel.id, MessageModel.payload)
+            .where(MessageModel.status == MessageStatus.PROCESSING.value)
+            .order_by(MessageModel.evidence_id, MessageModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        if evidence_id:
+            stmt = stmt.where(MessageModel.evidence_id == evidence_id)
+        return [PendingMessage(*row) for row in self.session.execute(stmt)]
+
+    def save_embeddings(
+        self, messages: List[PendingMessage], vectors: np.ndarray
+    ) -> None:
+        rows = zip(messages, encode_embeddings(vectors))
+        for evidence_id, group in groupby(rows, key=lambda row: row[0].evidence_id):
+            group = list(group)
+            ids = [message.id for message, _ in group]
+            self.session.execute(
+                MESSAGE_EMBEDDINGS_UPDATE,
+                {
+                    "evidence_id": evidence_id,
+                    "first_id": ids[0],
+                    "last_id": ids[-1],
+                    "ids": ids,
+                    "embeddings": [embedding for _, embedding in group],
+                    "status": MessageStatus.EMBEDDED.value,
+                },
+            )
+        self.session.commit()
+
+    def release_claimed_messages(self) -> None:
+        self.session.rollback()
+
+    def list_embeddings(
+        self, evidence_id: str, limit: int, after: Optional[UUID] = None
+    ) -> MessageEmbeddings:
+        stmt = (
+            select(MessageModel.id, MessageModel.embeddings)
+            .where(
+                MessageModel.evidence_id == evidence_id,
+                MessageModel.status == MessageStatus.EMBEDDED.value,
+            )
+            .order_by(MessageModel.id)
+            .limit(limit)
+        )
+        if after:
+            stmt = stmt.where(MessageModel.id > after)
+
+        rows = self.session.execute(stmt).all()
+        return MessageEmbeddings(
+            ids=[row.id for row in rows],
+            vectors=decode_embeddings([row.embeddings for row in rows]),
+        )
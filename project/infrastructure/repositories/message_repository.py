@@ -0,0 +1,230 @@
+import uuid
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import and_, bindparam, func, literal_column, or_, select, true, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from project.application.interfaces.message_repository_interface import (
+    MESSAGE_FIELDS,
+    IMessageRepository,
+)
+from project.application.utils.embeddings import decode_embedding
+from project.domain.enums import MessageStatus
+from project.infrastructure.database.models import MESSAGE_SEARCH_CONFIG, MessageModel
+
+# Lower than any message id, the bound of evidences not yet started
+NIL_UUID = uuid.UUID(int=0)
+
+# Up to two passages around the matches, the matched words wrapped in <mark>
+SNIPPET_OPTIONS = (
+    "MaxFragments=2, MaxWords=24, MinWords=8, StartSel=<mark>, StopSel=</mark>"
+)
+
+
+class MessageRepository(IMessageRepository):
+    def __init__(self, session):
+        self.session = session
+
+    async def list_messages(
+        self,
+        evidence_ids: List[UUID],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+        sender: Optional[str] = None,
+        receiver: Optional[str] = None,
+        fields: Sequence[str] = MESSAGE_FIELDS,
+    ) -> List[dict]:
+        """
+        Evidences are visited in id order, each through a lateral keyset scan
+        of its own partition that starts at the cursor and stops after `limit`
+        rows. Every page costs the same index descents whatever its depth,
+        which OFFSET pagination cannot offer.
+        """
+        evidence_ids = sorted(evidence_ids)
+        if after:
+            evidence_ids = [e for e in evidence_ids if e >= after[0]]
+        if not evidence_ids:
+            return []
+
+        # Each evidence paired with the id its scan starts after
+        lower_bounds = [
+            after[1] if after and evidence_id == after[0] else NIL_UUID
+            for evidence_id in evidence_ids
+        ]
+        evidences = (
+            func.unnest(
+                bindparam("evidence_ids", evidence_ids, type_=ARRAY(SA_UUID)),
+                bindparam("lower_bounds", lower_bounds, type_=ARRAY(SA_UUID)),
+            )
+            .table_valued("evidence_id", "after_id")
+            .render_derived(name="evidence")
+        )
+
+        columns = self._columns(fields)
+        conditions = [
+            MessageModel.evidence_id == evidences.c.evidence_id,
+            MessageModel.id > evidences.c.after_id,
+        ]
+        if sender is not None:
+            conditions.append(MessageModel.sender == sender)
+        if receiver is not None:
+            conditions.append(MessageModel.receiver == receiver)
+
+        page = (
+            select(*columns)
+            .where(*conditions)
+            .order_by(MessageModel.id)
+            .limit(limit)
+            .lateral("page")
+        )
+        stmt = (
+            select(page)
+            .select_from(evidences)
+            .join(page, true())
+            .order_by(page.c.evidence_id, page.c.id)
+            .limit(limit)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_messages(
+        self, keys: List[Tuple[UUID, UUID]], fields: Sequence[str] = MESSAGE_FIELDS
+    ) -> List[dict]:
+        """
+        Primary key lookups; the evidence ids on their own let the planner
+        prune the partitions that hold none of the keys.
+        """
+        if not keys:
+            return []
+
+        stmt = select(*self._columns(fields)).where(
+            MessageModel.evidence_id.in_({evidence_id for evidence_id, _ in keys}),
+            tuple_(MessageModel.evidence_id, MessageModel.id).in_(keys),
+        )
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def get_message_embedding(
+        self, evidence_id: UUID, message_id: UUID
+    ) -> Optional[np.ndarray]:
+        stmt = select(MessageModel.embeddings).where(
+            MessageModel.evidence_id == evidence_id,
+            MessageModel.id == message_id,
+            MessageModel.status == MessageStatus.EMBEDDED.value,
+        )
+        embeddings = await self.session.scalar(stmt)
+        if embeddings is None:
+            return None
+        return decode_embedding(embeddings)
+
+    async def search_messages(
+        self,
+        evidence_ids: List[UUID],
+        query: str,
+        limit: int,
+        after: Optional[Tuple[float, UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Matches are looked up in the GIN index of the evidences' partitions
+        and ranked in the database. Snippets are only built for the rows of the
+        page, `ts_headline` parses the payload again and is the costly part.
+        """
+        if not evidence_ids:
+            return []
+
+        config = literal_column(f"'{MESSAGE_SEARCH_CONFIG}'::regconfig")
+        tsquery = func.websearch_to_tsquery(config, query)
+
+        ranked = (
+            select(
+                MessageModel.evidence_id,
+                MessageModel.id,
+                func.ts_rank(MessageModel.payload_tsv, tsquery).label("rank"),
+            )
+            .where(
+                MessageModel.evidence_id.in_(evidence_ids),
+                MessageModel.payload_tsv.bool_op("@@")(tsquery),
+            )
+            .subquery("ranked")
+        )
+        conditions = []
+        if after:
+            rank, evidence_id, message_id = after
+            conditions.append(
+                or_(
+                    ranked.c.rank < rank,
+                    and_(
+                        ranked.c.rank == rank,
+                        tuple_(ranked.c.evidence_id, ranked.c.id)
+                        > tuple_(evidence_id, message_id),
+                    ),
+                )
+            )
+        page = (
+            select(ranked)
+            .where(*conditions)
+            .order_by(ranked.c.rank.desc(), ranked.c.evidence_id, ranked.c.id)
+            .limit(limit)
+            .subquery("page")
+        )
+
+        stmt = (
+            select(
+                MessageModel.id,
+                MessageModel.evidence_id,
+                MessageModel.sender,
+                MessageModel.receiver,
+                MessageModel.created_at,
+                page.c.rank,
+                func.ts_headline(
+                    config, MessageModel.payload, tsquery, SNIPPET_OPTIONS
+                ).label("snippet"),
+            )
+            .join(
+                page,
+                and_(
+                    MessageModel.evidence_id == page.c.evidence_id,
+                    MessageModel.id == page.c.id,
+                ),
+            )
+            .order_by(page.c.rank.desc(), page.c.evidence_id, page.c.id)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def stream_messages(
+        self,
+        evidence_ids: List[UUID],
+        fields: Sequence[str] = MESSAGE_FIELDS,
+        batch_size: int = 5000,
+    ) -> AsyncIterator[Tuple[UUID, List[tuple]]]:
+        """
+        One evidence after the other, so each cursor walks the primary key of
+        a single partition and rows come out in order without a sort. Rows
+        stay plain Core tuples, ORM rows or mappings would double the cost.
+        """
+        columns = [getattr(MessageModel, field) for field in fields]
+        connection = await self.session.connection()
+        for evidence_id in sorted(evidence_ids):
+            stmt = (
+                select(*columns)
+                .where(MessageModel.evidence_id == evidence_id)
+                .order_by(MessageModel.id)
+                .execution_options(yield_per=batch_size)
+            )
+            result = await connection.stream(stmt)
+            async for rows in result.partitions():
+                yield evidence_id, rows
+
+    @staticmethod
+    def _columns(fields: Sequence[str]) -> list:
+        return [MessageModel.evidence_id, MessageModel.id] + [
+            getattr(MessageModel, field)
+            for field in fields
+            if field not in ("evidence_id", "id")
+        ]
@@ -0,0 +1,137 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import BigInteger, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+
+from project.application.interfaces.near_duplicate_repository_interface import (
+    INearDuplicateRepository,
+)
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.near_duplicates import (
+    NearDuplicateBatch,
+    resolve_clusters,
+)
+from project.application.utils.uuid7 import UUID7_SQL
+from project.infrastructure.database.models import (
+    EvidenceModel,
+    NearDuplicateClusterModel,
+)
+
+# The share of the cluster's first message, if nothing has been counted for
+# its evidence yet: the cluster then held that one message. Skipped once the
+# evidence is deleted.
+NEAR_DUPLICATE_ORIGINS_INSERT = text(
+    f"INSERT INTO {NearDuplicateClusterModel.__table__.fullname} "
+    "(id, case_id, evidence_id, cluster_id, message_count, sample_message_id) "
+    f"SELECT {UUID7_SQL}, :case_id, origin.evidence_id, origin.cluster_id, 1, "
+    "origin.cluster_id "
+    "FROM unnest(:cluster_ids, :evidence_ids) AS origin (cluster_id, evidence_id) "
+    f"JOIN {EvidenceModel.__table__.fullname} AS evidence "
+    "ON evidence.id = origin.evidence_id "
+    "ORDER BY origin.cluster_id, origin.evidence_id "
+    "ON CONFLICT (case_id, cluster_id, evidence_id) DO NOTHING"
+).bindparams(
+    bindparam("case_id", type_=SA_UUID),
+    bindparam("cluster_ids", type_=ARRAY(SA_UUID)),
+    bindparam("evidence_ids", type_=ARRAY(SA_UUID)),
+)
+
+# Shares are locked in key order, like the edges of the communication graph
+NEAR_DUPLICATE_SHARES_UPSERT = text(
+    f"INSERT INTO {NearDuplicateClusterModel.__table__.fullname} AS share "
+    "(id, case_id, evidence_id, cluster_id, message_count, sample_message_id) "
+    f"SELECT {UUID7_SQL}, :case_id, :evidence_id, cluster_id, message_count, "
+    "sample_message_id "
+    "FROM unnest(:cluster_ids, :counts, :sample_ids) "
+    "AS batch (cluster_id, message_count, sample_message_id) "
+    "ORDER BY cluster_id "
+    "ON CONFLICT (case_id, cluster_id, evidence_id) DO UPDATE "
+    "SET message_count = share.message_count + excluded.message_count, "
+    "updated_at = now()"
+).bindparams(
+    bindparam("case_id", type_=SA_UUID),
+    bindparam("evidence_id", type_=SA_UUID),
+    bindparam("cluster_ids", type_=ARRAY(SA_UUID)),
+    bindparam("counts", type_=ARRAY(BigInteger)),
+    bindparam("sample_ids", type_=ARRAY(SA_UUID)),
+)
+
+Cluster = NearDuplicateClusterModel
+
+
+class NearDuplicateRepository(INearDuplicateRepository):
+    def __init__(self, session):
+        self.session = session
+
+    def add_shares(
+        self, messages: MessageBatch, near_duplicates: NearDuplicateBatch
+    ) -> None:
+        clusters = resolve_clusters(near_duplicates, messages.evidence_id, messages.ids)
+        # Clusters of a single message so far aren't counted, see
+        # `NearDuplicateClusterModel`
+        origins = []
+        shares = []
+        for share, cluster in zip(near_duplicates.clusters, clusters):
+            if share.cluster:
+                origins.append(cluster)
+            if share.cluster or len(share.rows) > 1:
+                shares.append(
+                    (cluster.id, len(share.rows), messages.ids[share.rows[0]])
+                )
+
+        # Origins first, one in this evidence is then added to
+        if origins:
+            self.session.execute(
+                NEAR_DUPLICATE_ORIGINS_INSERT,
+                {
+                    "case_id": near_duplicates.case_id,
+                    "cluster_ids": [cluster.id for cluster in origins],
+                    "evidence_ids": [cluster.evidence_id for cluster in origins],
+                },
+            )
+        if shares:
+            cluster_ids, counts, sample_ids = zip(*shares)
+            self.session.execute(
+                NEAR_DUPLICATE_SHARES_UPSERT,
+                {
+                    "case_id": near_duplicates.case_id,
+                    "evidence_id": messages.evidence_id,
+                    "cluster_ids": list(cluster_ids),
+                    "counts": list(counts),
+                    "sample_ids": list(sample_ids),
+                },
+            )
+
+    async def list_clusters(
+        self, case_id: UUID, min_size: int, limit: int, offset: int
+    ) -> List[dict]:
+        # Only clusters of more than one message have shares, summed over the
+        # evidences without ever reading a message
+        size = func.sum(Cluster.message_count)
+        stmt = (
+            select(
+                Cluster.cluster_id,
+                size.label("message_count"),
+                func.count().label("evidence_count"),
+                _earliest(Cluster.evidence_id).label("evidence_id"),
+                _earliest(Cluster.sample_message_id).label("message_id"),
+                func.count().over().label("total"),
+            )
+            .where(Cluster.case_id == case_id)
+            # In the order of the unique constraint, read without sorting
+            .group_by(Cluster.case_id, Cluster.cluster_id)
+            .having(size >= min_size)
+            .order_by(size.desc(), Cluster.cluster_id)
+            .limit(limit)
+            .offset(offset)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+
+def _earliest(column):
+    """`column` of the share with the earliest sample, ids are ordered by time."""
+    return func.array_agg(aggregate_order_by(column, Cluster.sample_message_id))[1]
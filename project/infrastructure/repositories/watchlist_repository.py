@@ -0,0 +1,253 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import UUID as SA_UUID
+from sqlalchemy import (
+    String,
+    all_,
+    and_,
+    bindparam,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.application.utils.message_batch import MessageBatch
+from project.application.utils.uuid7 import UUID7_SQL
+from project.application.utils.watchlists import WatchlistHit
+from project.domain.entities import WatchlistEntity
+from project.infrastructure.database.models import (
+    CaseModel,
+    MessageModel,
+    WatchlistHitModel,
+    WatchlistModel,
+)
+from project.infrastructure.exceptions.exceptions import AccessDeniedError
+
+WATCHLIST_HITS_INSERT = text(
+    f"INSERT INTO {WatchlistHitModel.__table__.fullname} "
+    "(id, evidence_id, message_id, watchlist_id, term) "
+    f"SELECT {UUID7_SQL}, :evidence_id, message_id, watchlist_id, term "
+    "FROM unnest(:message_ids, :watchlist_ids, :terms) "
+    "AS batch (message_id, watchlist_id, term)"
+).bindparams(
+    bindparam("evidence_id", type_=SA_UUID),
+    bindparam("message_ids", type_=ARRAY(SA_UUID)),
+    bindparam("watchlist_ids", type_=ARRAY(SA_UUID)),
+    bindparam("terms", type_=ARRAY(String)),
+)
+
+Hit = WatchlistHitModel
+
+
+class WatchlistRepository(IWatchlistRepository):
+    def __init__(self, session):
+        self.session = session
+
+    # ------------------------------------------------------------
+    # Matching at ingest time
+    # ------------------------------------------------------------
+    def get_case_watchlist_revisions(self, case_id: UUID) -> List[Tuple[UUID, int]]:
+        # Read once per batch, the terms only when the revisions changed
+        owner = select(CaseModel.user_id).where(CaseModel.id == case_id)
+        stmt = select(WatchlistModel.id, WatchlistModel.revision).where(
+            or_(
+                WatchlistModel.case_id == case_id,
+                and_(
+                    WatchlistModel.case_id.is_(None),
+                    WatchlistModel.user_id == owner.scalar_subquery(),
+                ),
+            )
+        )
+        return [tuple(row) for row in self.session.execute(stmt)]
+
+    def get_watchlist_terms(
+        self, watchlist_ids: Sequence[UUID]
+    ) -> Dict[UUID, List[str]]:
+        stmt = select(WatchlistModel.id, WatchlistModel.terms).where(
+            WatchlistModel.id.in_(watchlist_ids)
+        )
+        return {
+            watchlist_id: terms for watchlist_id, terms in self.session.execute(stmt)
+        }
+
+    def add_hits(
+        self, messages: MessageBatch, watchlist_hits: List[WatchlistHit]
+    ) -> None:
+        self.session.execute(
+            WATCHLIST_HITS_INSERT,
+            {
+                "evidence_id": messages.evidence_id,
+                "message_ids": [messages.ids[hit.row] for hit in watchlist_hits],
+                "watchlist_ids": [hit.watchlist_id for hit in watchlist_hits],
+                "terms": [hit.term for hit in watchlist_hits],
+            },
+        )
+
+    # ------------------------------------------------------------
+    # Watchlist CRUD (only by their user)
+    # ------------------------------------------------------------
+    async def create_watchlist(self, watchlist: WatchlistEntity) -> WatchlistEntity:
+        db_watchlist = WatchlistModel(
+            id=watchlist.id,
+            user_id=watchlist.user_id,
+            case_id=watchlist.case_id,
+            name=watchlist.name,
+            terms=watchlist.terms,
+            revision=watchlist.revision,
+        )
+        self.session.add(db_watchlist)
+        await self.session.commit()
+        await self.session.refresh(db_watchlist)
+
+        return self._to_entity(db_watchlist)
+
+    async def get_watchlists_by_user(self, user_id: UUID) -> List[WatchlistEntity]:
+        # Lists of thousands of terms stay in the database
+        stmt = (
+            select(
+                WatchlistModel.id,
+                WatchlistModel.user_id,
+                WatchlistModel.case_id,
+                WatchlistModel.name,
+                WatchlistModel.revision,
+                func.cardinality(WatchlistModel.terms).label("term_count"),
+                WatchlistModel.created_at,
+                WatchlistModel.updated_at,
+            )
+            .where(WatchlistModel.user_id == user_id)
+            .order_by(WatchlistModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return [WatchlistEntity(**row) for row in result.mappings()]
+
+    async def get_watchlist(self, watchlist_id: UUID, user_id: UUID) -> WatchlistEntity:
+        return self._to_entity(await self._get_model(watchlist_id, user_id))
+
+    async def update_watchlist(self, watchlist: WatchlistEntity) -> WatchlistEntity:
+        db_watchlist = await self._get_model(watchlist.id, watchlist.user_id)
+
+        db_watchlist.name = watchlist.name
+        if watchlist.terms != db_watchlist.terms:
+            # Hits already recorded stay, but not those of terms no longer watched
+            await self.session.execute(
+                delete(Hit)
+                .where(
+                    Hit.watchlist_id == watchlist.id,
+                    Hit.term != all_(literal(watchlist.terms, ARRAY(String))),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db_watchlist.terms = watchlist.terms
+            db_watchlist.revision = WatchlistModel.revision + 1
+
+        await self.session.commit()
+        await self.session.refresh(db_watchlist)
+
+        return self._to_entity(db_watchlist)
+
+    async def delete_watchlist(self, watchlist_id: UUID, user_id: UUID) -> None:
+        db_watchlist = await self._get_model(watchlist_id, user_id)
+
+        # Hits have no foreign key to their watchlist, see `WatchlistHitModel`
+        await self.session.execute(delete(Hit).where(Hit.watchlist_id == watchlist_id))
+        await self.session.delete(db_watchlist)
+        await self.session.commit()
+
+    # ------------------------------------------------------------
+    # Hits
+    # ------------------------------------------------------------
+    async def list_hit_messages(
+        self,
+        evidence_ids: List[UUID],
+        watchlist_id: Optional[UUID],
+        term: Optional[str],
+        limit: int,
+        after: Optional[Tuple[UUID, UUID]] = None,
+    ) -> List[dict]:
+        """
+        Hits are grouped per message in primary key order, each message then
+        fetched by its own key from the partition of its evidence.
+        """
+        if not evidence_ids:
+            return []
+
+        conditions = [Hit.evidence_id.in_(evidence_ids)]
+        if watchlist_id:
+            conditions.append(Hit.watchlist_id == watchlist_id)
+        if term:
+            conditions.append(Hit.term == term)
+        if after:
+            conditions.append(tuple_(Hit.evidence_id, Hit.message_id) > tuple_(*after))
+
+        # Hits of a watchlist deleted while their batch was matched are left out
+        hit_order = (Hit.watchlist_id, Hit.term)
+        hits = (
+            select(
+                Hit.evidence_id,
+                Hit.message_id,
+                func.array_agg(aggregate_order_by(Hit.watchlist_id, *hit_order)).label(
+                    "watchlist_ids"
+                ),
+                func.array_agg(aggregate_order_by(Hit.term, *hit_order)).label("terms"),
+            )
+            .join(WatchlistModel, WatchlistModel.id == Hit.watchlist_id)
+            .where(*conditions)
+            .group_by(Hit.evidence_id, Hit.message_id)
+            .order_by(Hit.evidence_id, Hit.message_id)
+            .limit(limit)
+            .subquery()
+        )
+        stmt = (
+            select(
+                MessageModel.id,
+                MessageModel.evidence_id,
+                MessageModel.sender,
+                MessageModel.receiver,
+                MessageModel.payload,
+                MessageModel.created_at,
+                hits.c.watchlist_ids,
+                hits.c.terms,
+            )
+            .join(
+                hits,
+                (MessageModel.evidence_id == hits.c.evidence_id)
+                & (MessageModel.id == hits.c.message_id),
+            )
+            .order_by(hits.c.evidence_id, hits.c.message_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def _get_model(self, watchlist_id: UUID, user_id: UUID) -> WatchlistModel:
+        stmt = select(WatchlistModel).where(
+            WatchlistModel.id == watchlist_id, WatchlistModel.user_id == user_id
+        )
+        result = await self.session.execute(stmt)
+        db_watchlist = result.scalars().first()
+        if not db_watchlist:
+            raise AccessDeniedError("Watchlist not found or access denied")
+        return db_watchlist
+
+    @staticmethod
+    def _to_entity(db_watchlist: WatchlistModel) -> WatchlistEntity:
+        return WatchlistEntity(
+            id=db_watchlist.id,
+            user_id=db_watchlist.user_id,
+            case_id=db_watchlist.case_id,
+            name=db_watchlist.name,
+            terms=db_watchlist.terms,
+            revision=db_watchlist.revision,
+            term_count=len(db_watchlist.terms),
+            created_at=db_watchlist.created_at,
+            updated_at=db_watchlist.updated_at,
+        )
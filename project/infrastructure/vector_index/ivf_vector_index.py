@@ -0,0 +1,299 @@
+import os
+import shutil
+from functools import partial
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from project.application.interfaces.vector_index_interface import (
+    IVectorIndex,
+    VectorMatch,
+)
+from project.application.utils.embeddings import EMBEDDING_DTYPE
+from project.infrastructure.file_storage.run_directory import RunDirectory
+
+# Files of an evidence's index. The meta file names the runs in use; each
+# run is written whole before it is named there and never changed after.
+CENTROIDS_FILE = "centroids.f32"
+META_FILE = "index.json"
+VECTORS_SUFFIX = ".vectors.f32"
+IDS_SUFFIX = ".ids.uuid"
+OFFSETS_SUFFIX = ".offsets.i64"
+RUN_SUFFIXES = (VECTORS_SUFFIX, IDS_SUFFIX, OFFSETS_SUFFIX)
+
+ID_DTYPE = np.dtype("V16")
+LIST_DTYPE = np.dtype("<u2")
+OFFSET_DTYPE = np.dtype("<i8")
+
+# Rows assigned to their centroid per matrix product, bounding its memory
+ASSIGN_BATCH_ROWS = 65536
+# A new run is merged with the runs before it until they hold more than this
+# many times its rows, so an evidence keeps a logarithmic number of runs
+MERGE_RATIO = 2
+
+
+class IvfVectorIndex(IVectorIndex):
+    """
+    Inverted-file index of unit vectors. Each vector is filed under its
+    closest centroid, a search only scores the vectors of the `probes` lists
+    whose centroids are closest to the query and ranks those exactly.
+
+    Every evidence has a directory of runs, one per batch added: flat files of
+    vectors and message ids sorted by list, and the offset where each list
+    starts, memory-mapped by searches so they read only the probed lists.
+    Small runs are merged list by list into larger ones as batches arrive.
+    Until an evidence holds `training_rows_per_list` vectors per list they are
+    all scanned; its centroids are then trained once, by spherical k-means
+    over those rows, which are filed again into a single run.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        lists: int = 512,
+        probes: int = 16,
+        training_rows_per_list: int = 32,
+        kmeans_iterations: int = 8,
+    ):
+        if not 0 < lists <= np.iinfo(LIST_DTYPE).max:
+            raise ValueError(f"Lists must be between 1 and {np.iinfo(LIST_DTYPE).max}")
+        self.directory = directory
+        self.lists = lists
+        self.probes = probes
+        self.training_rows_per_list = training_rows_per_list
+        self.kmeans_iterations = kmeans_iterations
+
+    def add(self, evidence_id: UUID, ids: Sequence[UUID], vectors: np.ndarray) -> None:
+        vectors = np.ascontiguousarray(vectors, dtype=EMBEDDING_DTYPE)
+        if not len(vectors):
+            return
+        dimensions = vectors.shape[1]
+        runs = self._runs(evidence_id)
+
+        # Held by one writer at a time; searches don't lock
+        with runs.locked():
+            meta = runs.read_manifest()
+            if meta is None:
+                meta = {"dimensions": dimensions, "trained": False, "runs": []}
+            elif meta["dimensions"] != dimensions:
+                raise ValueError(
+                    f"Index of evidence {evidence_id} holds {meta['dimensions']} "
+                    f"dimensions, got {dimensions}"
+                )
+
+            ids = np.frombuffer(b"".join(uuid.bytes for uuid in ids), dtype=ID_DTYPE)
+            centroids = self._read_centroids(runs, meta)
+            meta["runs"].append(self._write_run(runs, meta, vectors, ids, centroids))
+
+            count = sum(rows for _, rows in meta["runs"])
+            if centroids is None and count >= self.lists * self.training_rows_per_list:
+                self._train(runs, meta)
+            else:
+                self._merge(runs, meta)
+            runs.save_manifest(meta)
+            runs.remove_unused_runs({name for name, _ in meta["runs"]})
+
+    def search(
+        self, evidence_ids: Sequence[UUID], query: np.ndarray, limit: int
+    ) -> List[VectorMatch]:
+        query = np.asarray(query, dtype=EMBEDDING_DTYPE).ravel()
+        norm = np.linalg.norm(query)
+        if not norm or limit < 1:
+            return []
+        query = query / norm
+
+        matches = []
+        for evidence_id in evidence_ids:
+            matches.extend(self._search_evidence(evidence_id, query, limit))
+        matches.sort(key=lambda match: match.score, reverse=True)
+
+        # A batch indexed again after a retry holds its messages twice
+        seen = set()
+        unique = []
+        for match in matches:
+            if match.id not in seen:
+                seen.add(match.id)
+                unique.append(match)
+                if len(unique) == limit:
+                    break
+        return unique
+
+    def drop(self, evidence_id: UUID) -> None:
+        shutil.rmtree(self._runs(evidence_id).path, ignore_errors=True)
+
+    def _search_evidence(
+        self, evidence_id: UUID, query: np.ndarray, limit: int
+    ) -> List[VectorMatch]:
+        runs = self._runs(evidence_id)
+        scores, ids = runs.read(partial(self._score_probed, runs, query))
+
+        # Some slack for messages indexed twice
+        top = min(len(scores), 2 * limit)
+        if not top:
+            return []
+        best = np.argpartition(scores, len(scores) - top)[-top:]
+        return [
+            VectorMatch(evidence_id, UUID(bytes=ids[i].tobytes()), float(scores[i]))
+            for i in best
+        ]
+
+    def _score_probed(
+        self, runs: RunDirectory, query: np.ndarray, meta: Optional[dict]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores and ids of the vectors in the lists probed for `query`."""
+        scores = [np.empty(0, dtype=EMBEDDING_DTYPE)]
+        ids = [np.empty(0, dtype=ID_DTYPE)]
+        # Vectors of another encoder can't be compared with the query
+        if meta is None or meta["dimensions"] != len(query):
+            return scores[0], ids[0]
+
+        centroids = self._read_centroids(runs, meta)
+        if centroids is None:
+            probed = np.zeros(1, dtype=np.intp)
+        else:
+            probes = min(self.probes, len(centroids))
+            probed = np.argpartition(centroids @ query, -probes)[-probes:]
+
+        for name, rows in meta["runs"]:
+            offsets = np.fromfile(runs.file(name + OFFSETS_SUFFIX), dtype=OFFSET_DTYPE)
+            vectors = runs.map(
+                name + VECTORS_SUFFIX, EMBEDDING_DTYPE, (rows, len(query))
+            )
+            run_ids = runs.map(name + IDS_SUFFIX, ID_DTYPE, (rows,))
+            for start, end in zip(offsets[probed], offsets[probed + 1]):
+                if end > start:
+                    scores.append(vectors[start:end] @ query)
+                    ids.append(run_ids[start:end])
+        return np.concatenate(scores), np.concatenate(ids)
+
+    def _train(self, runs: RunDirectory, meta: dict) -> None:
+        dimensions = meta["dimensions"]
+        vectors = np.concatenate(
+            [
+                runs.map(name + VECTORS_SUFFIX, EMBEDDING_DTYPE, (rows, dimensions))
+                for name, rows in meta["runs"]
+            ]
+        )
+        ids = np.concatenate(
+            [
+                runs.map(name + IDS_SUFFIX, ID_DTYPE, (rows,))
+                for name, rows in meta["runs"]
+            ]
+        )
+        centroids = _kmeans(vectors, self.lists, self.kmeans_iterations)
+        run = self._write_run(runs, meta, vectors, ids, centroids)
+        # Centroids written before the meta naming the run filed under them
+        runs.replace(CENTROIDS_FILE, centroids.tobytes())
+        meta["trained"] = True
+        meta["runs"] = [run]
+        print(
+            f"Trained {len(centroids)} lists over {len(vectors)} vectors of {runs.path}"
+        )
+
+    def _merge(self, runs: RunDirectory, meta: dict) -> None:
+        """Merge the newest run with the runs before it not much larger."""
+        listed = meta["runs"]
+        merged = 1
+        rows = listed[-1][1]
+        while merged < len(listed) and listed[-merged - 1][1] <= MERGE_RATIO * rows:
+            merged += 1
+            rows += listed[-merged][1]
+        if merged == 1:
+            return
+
+        sources = [
+            (
+                np.fromfile(runs.file(name + OFFSETS_SUFFIX), dtype=OFFSET_DTYPE),
+                runs.map(
+                    name + VECTORS_SUFFIX, EMBEDDING_DTYPE, (count, meta["dimensions"])
+                ),
+                runs.map(name + IDS_SUFFIX, ID_DTYPE, (count,)),
+            )
+            for name, count in listed[-merged:]
+        ]
+        # Every run of an evidence has as many lists, copied one after another
+        lists = len(sources[0][0]) - 1
+        counts = sum(np.diff(offsets) for offsets, _, _ in sources)
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(OFFSET_DTYPE)
+
+        name = runs.next_run_name(meta)
+        with open(runs.file(name + VECTORS_SUFFIX), "wb") as vectors, open(
+            runs.file(name + IDS_SUFFIX), "wb"
+        ) as ids:
+            for list_ in range(lists):
+                for source_offsets, source_vectors, source_ids in sources:
+                    start, end = source_offsets[list_], source_offsets[list_ + 1]
+                    vectors.write(source_vectors[start:end].tobytes())
+                    ids.write(source_ids[start:end].tobytes())
+        with open(runs.file(name + OFFSETS_SUFFIX), "wb") as file:
+            file.write(offsets.tobytes())
+        meta["runs"][-merged:] = [[name, rows]]
+
+    def _write_run(
+        self,
+        runs: RunDirectory,
+        meta: dict,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+        centroids: Optional[np.ndarray],
+    ) -> list:
+        """Write a run of rows filed under their closest centroid, if any."""
+        if centroids is None:
+            offsets = np.array([0, len(vectors)], dtype=OFFSET_DTYPE)
+        else:
+            lists = _assign(vectors, centroids)
+            order = np.argsort(lists, kind="stable")
+            vectors, ids = vectors[order], ids[order]
+            counts = np.bincount(lists, minlength=len(centroids))
+            offsets = np.concatenate(([0], np.cumsum(counts))).astype(OFFSET_DTYPE)
+
+        name = runs.next_run_name(meta)
+        for suffix, data in (
+            (VECTORS_SUFFIX, vectors),
+            (IDS_SUFFIX, ids),
+            (OFFSETS_SUFFIX, offsets),
+        ):
+            with open(runs.file(name + suffix), "wb") as file:
+                file.write(np.ascontiguousarray(data).tobytes())
+        return [name, len(vectors)]
+
+    def _runs(self, evidence_id: UUID) -> RunDirectory:
+        return RunDirectory(
+            os.path.join(self.directory, str(evidence_id)), META_FILE, RUN_SUFFIXES
+        )
+
+    @staticmethod
+    def _read_centroids(runs: RunDirectory, meta: dict) -> Optional[np.ndarray]:
+        if not meta["trained"]:
+            return None
+        centroids = np.fromfile(runs.file(CENTROIDS_FILE), dtype=EMBEDDING_DTYPE)
+        return centroids.reshape(-1, meta["dimensions"])
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Number of the closest centroid of each vector."""
+    lists = np.empty(len(vectors), dtype=LIST_DTYPE)
+    for start in range(0, len(vectors), ASSIGN_BATCH_ROWS):
+        end = start + ASSIGN_BATCH_ROWS
+        lists[start:end] = np.argmax(vectors[start:end] @ centroids.T, axis=1)
+    return lists
+
+
+def _kmeans(vectors: np.ndarray, lists: int, iterations: int) -> np.ndarray:
+    """Spherical k-means: centroids are the mean direction of their vectors."""
+    rng = np.random.default_rng(0)
+    lists = min(lists, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _assign(vectors, centroids)
+        counts = np.bincount(assignment, minlength=lists)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        # Sorted by list, each list's vectors are summed as one segment;
+        # a list left empty keeps its centroid
+        filled = counts > 0
+        order = np.argsort(assignment, kind="stable")
+        sums = np.add.reduceat(vectors[order], starts[filled])
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids[filled] = sums / np.where(norms > 0, norms, 1.0)
+    return centroids
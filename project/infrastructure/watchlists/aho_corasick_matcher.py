@@ -0,0 +1,171 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import ahocorasick
+
+from project.application.interfaces.watchlist_matcher_interface import IWatchlistMatcher
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.application.utils.watchlists import WatchlistHit, normalize_text
+
+# Part of every cache key, bumped when what is pickled changes
+AUTOMATON_FORMAT = 1
+AUTOMATON_SUFFIX = ".automaton"
+# Automatons kept in each process, and files kept in the shared directory
+CACHED_AUTOMATONS = 16
+CACHED_FILES = 256
+
+# Shared by the matchers of a process, each job creating its own: a worker
+# compiles or loads an automaton once for all the batches of its jobs.
+# Watchlists without any term are cached as None.
+_automatons: "OrderedDict[str, Optional[ahocorasick.Automaton]]" = OrderedDict()
+
+
+class AhoCorasickWatchlistMatcher(IWatchlistMatcher):
+    """
+    Matches every term of a case's watchlists in one pass over a batch
+    through an Aho-Corasick automaton, whose cost per character barely grows
+    with the number of terms where a pattern per term would scan every text
+    once for each of them.
+
+    An automaton is compiled once per set of watchlist revisions, kept in the
+    process and pickled to `directory` for the other workers: loading one is
+    several times faster than compiling it again from the terms.
+    """
+
+    def __init__(self, watchlist_repo: IWatchlistRepository, directory: str):
+        self.watchlist_repo = watchlist_repo
+        self.directory = directory
+
+    def match(self, case_id: UUID, texts: Sequence[str]) -> List[WatchlistHit]:
+        if not texts:
+            return []
+        revisions = self.watchlist_repo.get_case_watchlist_revisions(case_id)
+        if not revisions:
+            return []
+        automaton = self._automaton(revisions)
+        if automaton is None:
+            return []
+        return match_automaton(automaton, texts)
+
+    def _automaton(
+        self, revisions: List[Tuple[UUID, int]]
+    ) -> Optional[ahocorasick.Automaton]:
+        key = _cache_key(revisions)
+        if key in _automatons:
+            _automatons.move_to_end(key)
+            return _automatons[key]
+
+        path = os.path.join(self.directory, key + AUTOMATON_SUFFIX)
+        try:
+            with open(path, "rb") as file:
+                automaton = pickle.load(file)
+            # Kept by the pruning of `_save` as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            terms = self.watchlist_repo.get_watchlist_terms(
+                [watchlist_id for watchlist_id, _ in revisions]
+            )
+            automaton = compile_automaton(terms)
+            self._save(path, automaton)
+            print(f"Compiled {len(revisions)} watchlists into {path}")
+
+        _automatons[key] = automaton
+        if len(_automatons) > CACHED_AUTOMATONS:
+            _automatons.popitem(last=False)
+        return automaton
+
+    def _save(self, path: str, automaton: Optional[ahocorasick.Automaton]) -> None:
+        # Written in full before it appears, workers may load it meanwhile
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(automaton, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+        # Automatons of past revisions are never loaded again
+        cached = [
+            entry
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(AUTOMATON_SUFFIX)
+        ]
+        if len(cached) > CACHED_FILES:
+            cached.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in cached[: len(cached) - CACHED_FILES]:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+
+def compile_automaton(
+    watchlists: Dict[UUID, List[str]]
+) -> Optional[ahocorasick.Automaton]:
+    """
+    One automaton for the terms of all the watchlists, each term leading to
+    itself and the watchlists holding it. None without any term.
+    """
+    holders: Dict[str, List[UUID]] = {}
+    for watchlist_id, terms in watchlists.items():
+        for term in terms:
+            holders.setdefault(term, []).append(watchlist_id)
+    if not holders:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term, watchlist_ids in holders.items():
+        automaton.add_word(term, (term, tuple(watchlist_ids)))
+    automaton.make_automaton()
+    return automaton
+
+
+def match_automaton(
+    automaton: ahocorasick.Automaton, texts: Sequence[str]
+) -> List[WatchlistHit]:
+    """
+    The terms of `automaton` found in `texts` as whole words. The normalized
+    texts are scanned end to end in one call, each match then placed in its
+    text by its position.
+    """
+    normalized = [normalize_text(text) for text in texts]
+    # Neither normalized texts nor terms hold newlines, no match spans two texts
+    joined = "\n".join(normalized)
+    ends = list(accumulate(len(text) + 1 for text in normalized))
+
+    hits: Dict[Tuple[int, UUID, str], None] = {}
+    for end, (term, watchlist_ids) in automaton.iter(joined):
+        start = end - len(term) + 1
+        if not _is_whole_word(joined, start, end, term):
+            continue
+        row = bisect_right(ends, start)
+        for watchlist_id in watchlist_ids:
+            hits[row, watchlist_id, term] = None
+    return [WatchlistHit(*hit) for hit in hits]
+
+
+def _is_whole_word(text: str, start: int, end: int, term: str) -> bool:
+    """Whether the match of `term` at `[start, end]` doesn't cut through a word."""
+    if _is_word_char(term[0]) and start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if _is_word_char(term[-1]) and end + 1 < len(text):
+        return not _is_word_char(text[end + 1])
+    return True
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _cache_key(revisions: List[Tuple[UUID, int]]) -> str:
+    """Same for every worker given the same watchlists at the same revisions."""
+    listed = ",".join(
+        f"{watchlist_id}:{revision}" for watchlist_id, revision in sorted(revisions)
+    )
+    return hashlib.sha256(f"{AUTOMATON_FORMAT}|{listed}".encode()).hexdigest()[:32]
@@ -12,9 +12,13 @@ from project.application.dto.case_management_dto import (
     UpdateCaseRequest,
 )
 from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.near_duplicate_index_interface import (
+    INearDuplicateIndex,
+)
 from project.application.use_cases.case_management.case_management_use_case import (
     CaseManagementUseCase,
 )
+from project.dependencies.database_dependency import get_near_duplicate_index
 from project.dependencies.repository_dependency import get_case_repo
 from project.presentation.dependencies.authentication_dependency import get_user_info
 
@@ -83,9 +87,10 @@ async def update_case(
 async def delete_case(
     case_id: UUID,
     repo: ICaseRepository = Depends(get_case_repo),
+    near_duplicate_index: INearDuplicateIndex = Depends(get_near_duplicate_index),
     user=Depends(get_user_info),
 ):
-    use_case = CaseManagementUseCase(repo)
+    use_case = CaseManagementUseCase(repo, near_duplicate_index)
     try:
         await use_case.delete_case(case_id, user.id)
     except ValueError as e:
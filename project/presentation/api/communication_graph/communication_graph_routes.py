@@ -0,0 +1,65 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from project.application.dto.communication_graph_dto import (
+    ComponentsResponse,
+    EgoNetworkResponse,
+    TalkerResponse,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.communication_graph_repository_interface import (
+    ICommunicationGraphRepository,
+)
+from project.application.use_cases.communication_graph.graph_use_case import (
+    CommunicationGraphUseCase,
+)
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_communication_graph_repo,
+)
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(prefix="/cases/{case_id}/graph", tags=["Communication Graph"])
+
+
+@router.get("/top-talkers", response_model=List[TalkerResponse])
+async def top_talkers(
+    case_id: UUID,
+    limit: int = Query(20, ge=1, le=1000),
+    graph_repo: ICommunicationGraphRepository = Depends(get_communication_graph_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = CommunicationGraphUseCase(graph_repo, case_repo)
+    return await use_case.top_talkers(case_id, user.id, limit)
+
+
+@router.get("/ego", response_model=EgoNetworkResponse)
+async def ego_network(
+    case_id: UUID,
+    participant: str,
+    limit: int = Query(50, ge=1, le=1000, description="Contacts to include"),
+    graph_repo: ICommunicationGraphRepository = Depends(get_communication_graph_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = CommunicationGraphUseCase(graph_repo, case_repo)
+    return await use_case.ego_network(case_id, user.id, participant, limit)
+
+
+@router.get("/components", response_model=ComponentsResponse)
+async def connected_components(
+    case_id: UUID,
+    limit: int = Query(20, ge=1, le=1000),
+    min_size: int = Query(2, ge=1),
+    max_participants: int = Query(100, ge=0, le=10000),
+    graph_repo: ICommunicationGraphRepository = Depends(get_communication_graph_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = CommunicationGraphUseCase(graph_repo, case_repo)
+    return await use_case.connected_components(
+        case_id, user.id, limit, min_size, max_participants
+    )
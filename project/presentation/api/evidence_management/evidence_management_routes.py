@@ -0,0 +1,72 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+
+from project.application.dto.evidence_management_dto import (
+    EvidenceProgressResponse,
+    QuarantinedRowResponse,
+)
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.job_dispatcher_interface import IJobDispatcher
+from project.application.interfaces.vector_index_interface import IVectorIndex
+from project.application.use_cases.evidence_management.evidence_management_use_case import (  # noqa: E501
+    EvidenceManagementUseCase,
+)
+from project.dependencies.database_dependency import (
+    get_job_dispatcher,
+    get_vector_index,
+)
+from project.dependencies.repository_dependency import get_evidence_repo
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Evidence Management"])
+
+
+# ----------------------------
+# EVIDENCE CRUD
+# ----------------------------
+@router.delete("/evidences/{evidence_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_evidence(
+    evidence_id: UUID,
+    repo: IEvidenceRepository = Depends(get_evidence_repo),
+    vector_index: IVectorIndex = Depends(get_vector_index),
+    job_dispatcher: IJobDispatcher = Depends(get_job_dispatcher),
+    user=Depends(get_user_info),
+):
+    use_case = EvidenceManagementUseCase(repo, vector_index, job_dispatcher)
+    await use_case.delete_evidence(evidence_id, user.id)
+
+
+# ----------------------------
+# INGESTION PROGRESS
+# ----------------------------
+@router.get(
+    "/evidences/{evidence_id}/progress", response_model=EvidenceProgressResponse
+)
+async def get_evidence_progress(
+    evidence_id: UUID,
+    repo: IEvidenceRepository = Depends(get_evidence_repo),
+    user=Depends(get_user_info),
+):
+    use_case = EvidenceManagementUseCase(repo)
+    return await use_case.get_progress(evidence_id, user.id)
+
+
+# ----------------------------
+# QUARANTINE
+# ----------------------------
+@router.get(
+    "/evidences/{evidence_id}/quarantine", response_model=List[QuarantinedRowResponse]
+)
+async def list_quarantined_rows(
+    evidence_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    repo: IEvidenceRepository = Depends(get_evidence_repo),
+    user=Depends(get_user_info),
+):
+    use_case = EvidenceManagementUseCase(repo)
+    return await use_case.list_quarantined_rows(evidence_id, user.id, limit, offset)
@@ -0,0 +1,61 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from project.application.dto.indicator_dto import (
+    IndicatorCaseResponse,
+    IndicatorMessagePageResponse,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.indicator_repository_interface import (
+    IIndicatorRepository,
+)
+from project.application.use_cases.indicators.indicator_use_case import IndicatorUseCase
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_evidence_repo,
+    get_indicator_repo,
+)
+from project.domain.enums import IndicatorKind
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Indicators"])
+
+
+@router.get("/indicators/lookup", response_model=List[IndicatorCaseResponse])
+async def lookup_indicator(
+    value: str = Query(..., min_length=1, description="IP, domain, URL, hash, ..."),
+    kind: Optional[IndicatorKind] = None,
+    indicator_repo: IIndicatorRepository = Depends(get_indicator_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    """The cases mentioning an indicator, among those shared with the user."""
+    use_case = IndicatorUseCase(indicator_repo, evidence_repo, case_repo)
+    return await use_case.lookup(user.id, value, kind)
+
+
+@router.get(
+    "/cases/{case_id}/indicators/messages",
+    response_model=IndicatorMessagePageResponse,
+)
+async def list_indicator_messages(
+    case_id: UUID,
+    value: str = Query(..., min_length=1, description="IP, domain, URL, hash, ..."),
+    kind: Optional[IndicatorKind] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the last page"),
+    indicator_repo: IIndicatorRepository = Depends(get_indicator_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = IndicatorUseCase(indicator_repo, evidence_repo, case_repo)
+    return await use_case.list_case_messages(
+        case_id, user.id, value, kind, limit, cursor
+    )
@@ -0,0 +1,128 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from project.application.dto.message_browsing_dto import (
+    MessagePageResponse,
+    MessageSearchResponse,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.use_cases.message_browsing.message_browsing_use_case import (
+    MessageBrowsingUseCase,
+)
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_evidence_repo,
+    get_message_repo,
+)
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Message Browsing"])
+
+
+# Fields left out of the projection are left out of the items as well
+@router.get(
+    "/evidences/{evidence_id}/messages",
+    response_model=MessagePageResponse,
+    response_model_exclude_unset=True,
+)
+async def list_evidence_messages(
+    evidence_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the last page"),
+    sender: Optional[str] = None,
+    receiver: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = MessageBrowsingUseCase(message_repo, evidence_repo, case_repo)
+    return await use_case.list_evidence_messages(
+        evidence_id, user.id, limit, cursor, sender, receiver, fields
+    )
+
+
+@router.get(
+    "/cases/{case_id}/messages",
+    response_model=MessagePageResponse,
+    response_model_exclude_unset=True,
+)
+async def list_case_messages(
+    case_id: UUID,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the last page"),
+    sender: Optional[str] = None,
+    receiver: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = MessageBrowsingUseCase(message_repo, evidence_repo, case_repo)
+    return await use_case.list_case_messages(
+        case_id, user.id, limit, cursor, sender, receiver, fields
+    )
+
+
+@router.get("/cases/{case_id}/messages/search", response_model=MessageSearchResponse)
+async def search_case_messages(
+    case_id: UUID,
+    q: str = Query(
+        ..., min_length=1, description='Web-search syntax: words, "phrase", or, -word'
+    ),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the last page"),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = MessageBrowsingUseCase(message_repo, evidence_repo, case_repo)
+    return await use_case.search_case_messages(case_id, user.id, q, limit, cursor)
+
+
+@router.get("/cases/{case_id}/messages/export")
+async def export_case_messages(
+    case_id: UUID,
+    format: str = Query("csv", description="csv, ndjson or parquet"),
+    gzip: bool = False,
+    fields: Optional[str] = Query(None, description="Comma-separated fields"),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    """
+    Download every message of a case. Rows are streamed from a server-side
+    cursor as they are encoded, the response starts right away and memory
+    stays flat whatever the size of the case.
+    """
+    use_case = MessageBrowsingUseCase(message_repo, evidence_repo, case_repo)
+    export_format, chunks = await use_case.export_case_messages(
+        case_id, user.id, format, gzip, fields
+    )
+
+    file_name = f"case-{case_id}-messages.{export_format.extension}"
+    media_type = export_format.media_type
+    if gzip:
+        file_name += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{file_name}"',
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,39 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from project.application.dto.near_duplicate_dto import NearDuplicateClustersResponse
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.interfaces.near_duplicate_repository_interface import (
+    INearDuplicateRepository,
+)
+from project.application.use_cases.near_duplicates.near_duplicate_use_case import (
+    NearDuplicateUseCase,
+)
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_message_repo,
+    get_near_duplicate_repo,
+)
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(prefix="/cases/{case_id}", tags=["Near Duplicates"])
+
+
+@router.get("/near-duplicates", response_model=NearDuplicateClustersResponse)
+async def list_near_duplicate_clusters(
+    case_id: UUID,
+    min_size: int = Query(2, ge=2),
+    limit: int = Query(20, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    near_duplicate_repo: INearDuplicateRepository = Depends(get_near_duplicate_repo),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    """Clusters of near-identical messages in the case, largest first."""
+    use_case = NearDuplicateUseCase(near_duplicate_repo, message_repo, case_repo)
+    return await use_case.list_clusters(case_id, user.id, min_size, limit, offset)
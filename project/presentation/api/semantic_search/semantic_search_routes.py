@@ -0,0 +1,47 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from project.application.dto.semantic_search_dto import SimilarMessageResponse
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.message_repository_interface import (
+    IMessageRepository,
+)
+from project.application.interfaces.vector_index_interface import IVectorIndex
+from project.application.use_cases.semantic_search.semantic_search_use_case import (
+    SemanticSearchUseCase,
+)
+from project.dependencies.database_dependency import get_vector_index
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_evidence_repo,
+    get_message_repo,
+)
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Semantic Search"])
+
+
+@router.get(
+    "/evidences/{evidence_id}/messages/{message_id}/similar",
+    response_model=List[SimilarMessageResponse],
+)
+async def find_similar_messages(
+    evidence_id: UUID,
+    message_id: UUID,
+    limit: int = Query(10, ge=1, le=100),
+    message_repo: IMessageRepository = Depends(get_message_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    vector_index: IVectorIndex = Depends(get_vector_index),
+    user=Depends(get_user_info),
+):
+    """The messages of the evidence's case that mean much the same."""
+    use_case = SemanticSearchUseCase(
+        message_repo, evidence_repo, case_repo, vector_index
+    )
+    return await use_case.find_similar_messages(evidence_id, message_id, user.id, limit)
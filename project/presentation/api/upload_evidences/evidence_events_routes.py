@@ -0,0 +1,53 @@
+import json
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.event_publisher_interface import IEventSubscriber
+from project.application.use_cases.evidence_management.evidence_events_use_case import (
+    EvidenceEventsUseCase,
+)
+from project.dependencies.database_dependency import get_async_db, get_event_subscriber
+from project.dependencies.repository_dependency import get_case_repo
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Upload Evidences"])
+
+
+def format_sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/cases/{case_id}/evidences/events")
+async def stream_evidence_events(
+    case_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    event_subscriber: IEventSubscriber = Depends(get_event_subscriber),
+    user=Depends(get_user_info),
+):
+    """
+    Server-Sent Events stream of `started`, `progress`, `completed` and
+    `failed` events for the evidences of a case.
+    """
+    use_case = EvidenceEventsUseCase(case_repo, event_subscriber)
+    await use_case.authorize(case_id, user.id)
+    # Don't pin a pooled connection for as long as the client stays connected
+    await db.close()
+
+    async def event_stream():
+        async for event in use_case.stream(case_id):
+            if await request.is_disconnected():
+                break
+            # Comment lines keep proxies from closing an idle stream
+            yield format_sse(event) if event else ": keep-alive\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,12 +1,26 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from pydantic import ValidationError
 
+from project.application.dto.evidence_management_dto import (
+    ColumnMapping,
+    UploadEvidencesResponse,
+)
+from project.application.exceptions.exceptions import BaseAppException
+from project.application.interfaces.evidence_parser_interface import (
+    IEvidenceParserRegistry,
+)
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
 from project.application.use_cases.upload_evidences import UploadEvidencesUseCase
 from project.dependencies.database_dependency import (
     get_file_storage,
     get_job_dispatcher,
+    get_parser_registry,
 )
+from project.dependencies.repository_dependency import get_evidence_repo
 from project.infrastructure.celery_tasks.celery_app import CeleryJobDispatcher
 from project.infrastructure.file_storage.local_storage_service import LocalFileStorage
 from project.presentation.dependencies.authentication_dependency import get_user_info
@@ -14,19 +28,37 @@ from project.presentation.dependencies.authentication_dependency import get_user
 router = APIRouter(prefix="/evidences", tags=["Upload Evidences"])
 
 
-@router.post("")
+@router.post("", response_model=UploadEvidencesResponse)
 async def upload_evidences(
     case_id: str = Form(...),
     evidences: List[UploadFile] = File(...),
+    column_mapping: Optional[str] = Form(
+        None,
+        description='JSON object such as {"sender": "From", "payload": "Body"}; '
+        "unmapped fields are detected from the header",
+    ),
     user=Depends(get_user_info),
     file_storage: LocalFileStorage = Depends(get_file_storage),
     job_dispatcher: CeleryJobDispatcher = Depends(get_job_dispatcher),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    parser_registry: IEvidenceParserRegistry = Depends(get_parser_registry),
 ):
-    use_case = UploadEvidencesUseCase(file_storage, job_dispatcher)
-
     try:
-        await use_case.execute(case_id, evidences)
+        mapping = ColumnMapping.parse_raw(column_mapping) if column_mapping else None
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=e.errors()
+        )
+
+    use_case = UploadEvidencesUseCase(
+        file_storage, job_dispatcher, evidence_repo, parser_registry
+    )
 
-        return {"message": "Evidences uploaded successfully"}
+    try:
+        return await use_case.execute(
+            case_id, evidences, mapping.dict(exclude_none=True) if mapping else None
+        )
+    except BaseAppException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,121 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+
+from project.application.dto.watchlist_dto import (
+    CreateWatchlistRequest,
+    UpdateWatchlistRequest,
+    WatchlistDetailResponse,
+    WatchlistHitMessagePageResponse,
+    WatchlistResponse,
+)
+from project.application.interfaces.case_repository_interface import ICaseRepository
+from project.application.interfaces.evidence_repository_interface import (
+    IEvidenceRepository,
+)
+from project.application.interfaces.watchlist_repository_interface import (
+    IWatchlistRepository,
+)
+from project.application.use_cases.watchlists.watchlist_use_case import WatchlistUseCase
+from project.dependencies.repository_dependency import (
+    get_case_repo,
+    get_evidence_repo,
+    get_watchlist_repo,
+)
+from project.presentation.dependencies.authentication_dependency import get_user_info
+
+router = APIRouter(tags=["Watchlists"])
+
+
+# ----------------------------
+# WATCHLIST CRUD
+# ----------------------------
+@router.get("/watchlists", response_model=List[WatchlistResponse])
+async def get_watchlists_by_user(
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    return await use_case.get_watchlists_by_user(user.id)
+
+
+@router.get("/watchlists/{watchlist_id}", response_model=WatchlistDetailResponse)
+async def get_watchlist(
+    watchlist_id: UUID,
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    return await use_case.get_watchlist(watchlist_id, user.id)
+
+
+@router.post(
+    "/watchlists",
+    response_model=WatchlistDetailResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_watchlist(
+    data: CreateWatchlistRequest,
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    """Terms are matched against the messages ingested from then on."""
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    return await use_case.create_watchlist(data, user.id)
+
+
+@router.put("/watchlists/{watchlist_id}", response_model=WatchlistDetailResponse)
+async def update_watchlist(
+    watchlist_id: UUID,
+    data: UpdateWatchlistRequest,
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    return await use_case.update_watchlist(watchlist_id, user.id, data)
+
+
+@router.delete("/watchlists/{watchlist_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_watchlist(
+    watchlist_id: UUID,
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    await use_case.delete_watchlist(watchlist_id, user.id)
+
+
+# ----------------------------
+# HITS
+# ----------------------------
+@router.get(
+    "/cases/{case_id}/watchlist-hits",
+    response_model=WatchlistHitMessagePageResponse,
+)
+async def list_watchlist_hits(
+    case_id: UUID,
+    watchlist_id: Optional[UUID] = None,
+    term: Optional[str] = Query(None, min_length=1),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="`next_cursor` of the last page"),
+    watchlist_repo: IWatchlistRepository = Depends(get_watchlist_repo),
+    evidence_repo: IEvidenceRepository = Depends(get_evidence_repo),
+    case_repo: ICaseRepository = Depends(get_case_repo),
+    user=Depends(get_user_info),
+):
+    """The messages of a case containing a watched term, with the terms found."""
+    use_case = WatchlistUseCase(watchlist_repo, evidence_repo, case_repo)
+    return await use_case.list_case_hits(
+        case_id, user.id, watchlist_id, term, limit, cursor
+    )